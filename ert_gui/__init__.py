@@ -7,15 +7,27 @@ if sys.hexversion < REQUIRED_VERSION_HEX:
     raise Exception("ERT GUI Python requires at least version 2.7 of Python")
 
 import os
-import matplotlib
 
 def headless():
     return "DISPLAY" not in os.environ
 
-if headless():
-    matplotlib.use("Agg")
-else:
-    matplotlib.use("Qt4Agg")
+_matplotlib_configured = False
+
+def configureMatplotlib():
+    """
+    Selects the matplotlib backend. Called by the plotting code before it
+    imports matplotlib, so the command line modes never load matplotlib.
+    """
+    global _matplotlib_configured
+    if _matplotlib_configured:
+        return
+
+    import matplotlib
+    if headless():
+        matplotlib.use("Agg")
+    else:
+        matplotlib.use("Qt4Agg")
+    _matplotlib_configured = True
 
 try:
     from .version import version as __version__
@@ -23,5 +35,10 @@ except ImportError:
     __version__ = '0.0.0'
 
 from .ert_adapter import ERT
-from .ertnotifier import configureErtNotifier
-from .cli import run_cli
+
+def configureErtNotifier(ert, config_file):
+    # The notifier is a QObject, imported here to keep Qt out of the command line modes.
+    from .ertnotifier import configureErtNotifier as configure
+    configure(ert, config_file)
+
+from .cli import run_cli, run_export, run_load_results, run_init_case, run_storage
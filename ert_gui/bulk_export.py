@@ -0,0 +1,201 @@
+from __future__ import print_function
+
+import fnmatch
+import os
+from multiprocessing import Pool
+
+from res.enkf import EnKFMain, ResConfig
+
+
+def _moduleAvailable(name):
+    try:
+        __import__(name)
+        return True
+    except ImportError:
+        return False
+
+
+class BulkExporter(object):
+    """
+    Exports summary, GEN_KW and GEN_DATA values for many cases to columnar
+    files. The keys of each data type are exported in chunks of chunk_size
+    keys, each chunk to its own file:
+
+        <output_dir>/<case>/<data type>/chunk_<n>.<parquet|h5>
+
+    so at most one chunk per worker is held in memory at a time. Summary
+    chunks have Realization and Date columns followed by one column per
+    key, GEN_KW chunks a Realization column followed by one column per key,
+    and GEN_DATA chunks are in long form with Key, Index, Realization and
+    Value columns.
+    """
+    SUMMARY = "summary"
+    GEN_KW = "gen_kw"
+    GEN_DATA = "gen_data"
+    DATA_TYPES = [SUMMARY, GEN_KW, GEN_DATA]
+
+    FORMATS = {"parquet": ".parquet", "hdf5": ".h5"}
+    DEFAULT_CHUNK_SIZE = 1000
+
+    def __init__(self, ert, output_dir, file_format="parquet", chunk_size=DEFAULT_CHUNK_SIZE):
+        super(BulkExporter, self).__init__()
+        if file_format not in BulkExporter.FORMATS:
+            raise ValueError("Unknown export format: %s" % file_format)
+
+        self._ert = ert
+        self._output_dir = output_dir
+        self._file_format = file_format
+        self._chunk_size = chunk_size
+
+    @staticmethod
+    def checkFormatAvailable(file_format):
+        """ Raises a ValueError if the libraries needed to write the format are missing. """
+        if file_format == "parquet" and not (_moduleAvailable("pyarrow") or _moduleAvailable("fastparquet")):
+            raise ValueError("Exporting to Parquet requires the pyarrow or fastparquet package")
+        if file_format == "hdf5" and not _moduleAvailable("tables"):
+            raise ValueError("Exporting to HDF5 requires the tables (PyTables) package")
+
+    def availableKeys(self, data_type):
+        """ @rtype: list[str] """
+        key_manager = self._ert.getKeyManager()
+        if data_type == BulkExporter.SUMMARY:
+            return list(key_manager.summaryKeys())
+        elif data_type == BulkExporter.GEN_KW:
+            return list(key_manager.genKwKeys())
+        elif data_type == BulkExporter.GEN_DATA:
+            return list(key_manager.genDataKeys())
+        raise ValueError("Unknown data type: %s" % data_type)
+
+    def selectKeys(self, data_type, patterns=None):
+        """
+        The keys of the data type matching any of the shell style patterns,
+        or all keys if no patterns are given.
+        @rtype: list[str]
+        """
+        keys = self.availableKeys(data_type)
+        if not patterns:
+            return keys
+        return [key for key in keys if any(fnmatch.fnmatchcase(key, pattern) for pattern in patterns)]
+
+    def chunks(self, keys):
+        """ @rtype: list[list[str]] """
+        return [keys[index:index + self._chunk_size] for index in range(0, len(keys), self._chunk_size)]
+
+    def tasks(self, cases, data_types=None, patterns=None):
+        """
+        The work to do as (case, data type, chunk index, keys) tuples.
+        @rtype: list[tuple]
+        """
+        tasks = []
+        for data_type in data_types or BulkExporter.DATA_TYPES:
+            keys = self.selectKeys(data_type, patterns)
+            for case in cases:
+                for chunk_index, chunk in enumerate(self.chunks(keys)):
+                    tasks.append((case, data_type, chunk_index, chunk))
+        return tasks
+
+    def loadChunk(self, case, data_type, keys):
+        """ @rtype: pandas.DataFrame """
+        # Imported here, pandas is slow to import and not needed to start the command line modes.
+        import pandas
+        from res.enkf.export import GenKwCollector, SummaryCollector, GenDataCollector
+
+        if data_type == BulkExporter.SUMMARY:
+            data = SummaryCollector.loadAllSummaryData(self._ert, case, keys)
+            return data.reset_index()
+
+        if data_type == BulkExporter.GEN_KW:
+            data = GenKwCollector.loadAllGenKwData(self._ert, case, keys)
+            data.index.name = "Realization"
+            return data.reset_index()
+
+        frames = []
+        for key in keys:
+            name, report_step = key.split("@", 1)
+            try:
+                data = GenDataCollector.loadGenData(self._ert, case, name, int(report_step))
+            except ValueError:
+                continue
+
+            data.index.name = "Index"
+            data.columns.name = "Realization"
+            data = data.stack().rename("Value").reset_index()
+            data.insert(0, "Key", key)
+            frames.append(data)
+
+        if not frames:
+            return pandas.DataFrame(columns=["Key", "Index", "Realization", "Value"])
+        return pandas.concat(frames, ignore_index=True)
+
+    def chunkPath(self, case, data_type, chunk_index):
+        """ @rtype: str """
+        file_name = "chunk_%04d%s" % (chunk_index, BulkExporter.FORMATS[self._file_format])
+        return os.path.join(self._output_dir, case, data_type, file_name)
+
+    def writeChunk(self, data, path):
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # Another worker created it first.
+                if not os.path.isdir(directory):
+                    raise
+
+        data.columns = [str(column) for column in data.columns]
+        if self._file_format == "parquet":
+            data.to_parquet(path, index=False)
+        else:
+            data.to_hdf(path, "data", mode="w", format="table")
+
+    def exportChunk(self, case, data_type, chunk_index, keys):
+        """ @rtype: str: the path of the written file """
+        path = self.chunkPath(case, data_type, chunk_index)
+        self.writeChunk(self.loadChunk(case, data_type, keys), path)
+        return path
+
+    def export(self, cases, data_types=None, patterns=None, workers=1, config_file=None):
+        """
+        Exports the matching keys for all the cases. With more than one
+        worker, the chunks are exported by a pool of processes which each
+        open the configuration in config_file.
+        @rtype: list[str]: the written files
+        """
+        tasks = self.tasks(cases, data_types, patterns)
+        written = []
+
+        if workers <= 1 or len(tasks) <= 1:
+            for index, task in enumerate(tasks):
+                written.append(self.exportChunk(*task))
+                print("Exported %d/%d chunks" % (index + 1, len(tasks)))
+            return written
+
+        if config_file is None:
+            raise ValueError("Exporting with several workers requires the configuration file")
+
+        pool = Pool(workers, initializer=_initWorker,
+                    initargs=(config_file, self._output_dir, self._file_format, self._chunk_size))
+        try:
+            for path in pool.imap_unordered(_exportTask, tasks):
+                written.append(path)
+                print("Exported %d/%d chunks" % (len(written), len(tasks)))
+        finally:
+            pool.close()
+            pool.join()
+
+        return written
+
+
+_worker_exporter = None
+
+
+def _initWorker(config_file, output_dir, file_format, chunk_size):
+    global _worker_exporter
+    res_config = ResConfig(config_file)
+    os.chdir(res_config.config_path)
+    ert = EnKFMain(res_config, strict=True)
+    _worker_exporter = BulkExporter(ert, output_dir, file_format, chunk_size)
+
+
+def _exportTask(task):
+    return _worker_exporter.exportChunk(*task)
@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from threading import RLock
+
+from res.enkf import RealizationStateEnum
+
+
+class CaseInfo(object):
+    """
+    What is known about one case in storage. The initialized flag, the
+    running flag and the realization states are read from storage the
+    first time they are asked for.
+    """
+
+    def __init__(self, name, hidden):
+        super(CaseInfo, self).__init__()
+        self.name = name
+        self.hidden = hidden
+        self.initialized = None
+        self.running = None
+        self.realization_states = None
+
+
+class CaseCatalog(object):
+    """
+    A cache of the cases in the storage of the current EnKFMain. The case
+    list is read once and kept until invalidate() is called, which the
+    ERT adapter does whenever a change to ERT is announced or a new
+    EnKFMain is adapted. The running flag is a snapshot; use the file
+    system manager directly when it has to be exact.
+    """
+
+    def __init__(self, ert_source):
+        """ @param ert_source: an object with the EnKFMain as its ert attribute """
+        super(CaseCatalog, self).__init__()
+        self._ert_source = ert_source
+        self._lock = RLock()
+        self._cases = None
+
+    def invalidate(self):
+        with self._lock:
+            self._cases = None
+
+    def refresh(self):
+        self.invalidate()
+        self._catalog()
+
+    def _fsManager(self):
+        return self._ert_source.ert.getEnkfFsManager()
+
+    def _catalog(self):
+        """ @rtype: OrderedDict[str, CaseInfo] """
+        with self._lock:
+            if self._cases is None:
+                fs_manager = self._fsManager()
+                cases = OrderedDict()
+                for case in fs_manager.getCaseList():
+                    cases[str(case)] = CaseInfo(str(case), fs_manager.isCaseHidden(case))
+                self._cases = cases
+            return self._cases
+
+    def caseInfo(self, case_name):
+        """ @rtype: CaseInfo or None """
+        return self._catalog().get(str(case_name))
+
+    def caseNames(self, include_hidden=False):
+        """ @rtype: list[str] """
+        return [name for name, info in self._catalog().items() if include_hidden or not info.hidden]
+
+    def exists(self, case_name):
+        """ True if case_name is a case which is not hidden. """
+        info = self.caseInfo(case_name)
+        return info is not None and not info.hidden
+
+    def isInitialized(self, case_name):
+        """ @rtype: bool """
+        with self._lock:
+            info = self.caseInfo(case_name)
+            if info is None:
+                return self._fsManager().isCaseInitialized(case_name)
+            if info.initialized is None:
+                info.initialized = self._fsManager().isCaseInitialized(case_name)
+            return info.initialized
+
+    def isRunning(self, case_name):
+        """ @rtype: bool """
+        with self._lock:
+            info = self.caseInfo(case_name)
+            if info is None:
+                return self._fsManager().isCaseRunning(case_name)
+            if info.running is None:
+                info.running = self._fsManager().isCaseRunning(case_name)
+            return info.running
+
+    def realizationStates(self, case_name):
+        """ @rtype: list[res.enkf.enums.RealizationStateEnum] """
+        with self._lock:
+            info = self.caseInfo(case_name)
+            if info is None:
+                return [state for state in self._fsManager().getStateMapForCase(case_name)]
+            if info.realization_states is None:
+                state_map = self._fsManager().getStateMapForCase(case_name)
+                info.realization_states = [state for state in state_map]
+            return list(info.realization_states)
+
+    def hasData(self, case_name):
+        """ @rtype: bool """
+        states = self.realizationStates(case_name)
+        return any(state == RealizationStateEnum.STATE_HAS_DATA for state in states)
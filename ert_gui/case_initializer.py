@@ -0,0 +1,80 @@
+from ecl.util.util import BoolVector, StringList
+from res.enkf import ErtRunContext
+from ert_gui.task_pool import TaskProgress
+
+
+class CaseInitializer(object):
+    """
+    Initializes the current case from scratch or from an existing case,
+    chunk_size realizations at a time, so the progress can be followed and
+    the initialization cancelled between the chunks. The storage is not
+    thread safe, so the chunks are initialized one after the other.
+    Announcing the change to ERT is left to the caller, which for the GUI
+    has to happen in the GUI thread.
+    """
+    DEFAULT_CHUNK_SIZE = 10
+
+    def __init__(self, ert, chunk_size=DEFAULT_CHUNK_SIZE):
+        super(CaseInitializer, self).__init__()
+        self._ert = ert
+        self._chunk_size = max(1, chunk_size)
+
+    def _chunks(self, members):
+        members = sorted(set(int(str(member).strip()) for member in members))
+        for start in range(0, len(members), self._chunk_size):
+            yield members[start:start + self._chunk_size]
+
+    def _mask(self, chunk):
+        mask = BoolVector(default_value=False, initial_size=self._ert.getEnsembleSize())
+        for member in chunk:
+            mask[member] = True
+        return mask
+
+    def _run(self, members, initialize_chunk, progress):
+        progress = progress or TaskProgress()
+        chunks = list(self._chunks(members))
+        progress.start(sum(len(chunk) for chunk in chunks))
+
+        initialized = 0
+        for chunk in chunks:
+            if progress.isCancelled():
+                break
+            initialize_chunk(self._mask(chunk))
+            initialized += len(chunk)
+            progress.advance(len(chunk))
+        return initialized
+
+    def initializeFromScratch(self, parameters, members, progress=None):
+        """
+        @type parameters: list[str]
+        @type members: list[int or str]
+        @type progress: TaskProgress
+        @rtype: int: the number of initialized realizations
+        """
+        fs_manager = self._ert.getEnkfFsManager()
+        selected_parameters = StringList(parameters)
+        sim_fs = fs_manager.getCurrentFileSystem()
+
+        def initializeChunk(mask):
+            run_context = ErtRunContext.case_init(sim_fs, mask)
+            fs_manager.initializeFromScratch(selected_parameters, run_context)
+
+        return self._run(members, initializeChunk, progress)
+
+    def initializeFromExisting(self, source_case, source_report_step, parameters, members, progress=None):
+        """
+        @type source_case: str
+        @type source_report_step: int
+        @type parameters: list[str]
+        @type members: list[int or str]
+        @type progress: TaskProgress
+        @rtype: int: the number of initialized realizations
+        """
+        fs_manager = self._ert.getEnkfFsManager()
+        selected_parameters = StringList(parameters)
+
+        def initializeChunk(mask):
+            fs_manager.customInitializeCurrentFromExistingCase(source_case, source_report_step, mask,
+                                                               selected_parameters)
+
+        return self._run(members, initializeChunk, progress)
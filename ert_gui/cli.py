@@ -3,43 +3,216 @@ import logging
 import os
 import sys
 from argparse import ArgumentTypeError
+from contextlib import contextmanager
 
 from ecl.util.util import BoolVector
 from res.enkf import EnKFMain, ErtRunContext, ESUpdate, ResConfig
 
 from ert_gui import ERT
-from ert_gui.ertwidgets.models import ertmodel
+from ert_gui.bulk_export import BulkExporter
+from ert_gui.case_initializer import CaseInitializer
+from ert_gui.load_manifest import LoadManifest
+from ert_gui.profiler import profiledRegion
+from ert_gui.result_loader import LoadProgress, ResultLoader
+from ert_gui.storage_manager import StorageManager
+from ert_gui.task_pool import TaskProgress
+from ert_gui import ert_queries
 from ert_gui.ide.keywords.definitions import (NumberListStringArgument,
                                               RangeStringArgument)
 from ert_gui.simulation.models.ensemble_experiment import EnsembleExperiment
 from ert_gui.simulation.models.ensemble_smoother import EnsembleSmoother
 from ert_gui.simulation.models.multiple_data_assimilation import \
     MultipleDataAssimilation
+from ert_gui.simulation.models.progress_reporter import ProgressReporter
 from ert_gui.simulation.models.single_test_run import SingleTestRun
 
 
 def run_cli(args):
 
-    res_config = ResConfig(args.config)
-    os.chdir(res_config.config_path)
-    ert = EnKFMain(res_config, strict=True, verbose=args.verbose)
-    notifier = ErtCliNotifier(ert, args.config)
-    ERT.adapt(notifier)
-
-    # Setup model
-    if args.mode == 'test_run':
-        model, argument = _setup_single_test_run()
-    elif args.mode == 'ensemble_experiment':
-        model, argument = _setup_ensemble_experiment(args)
-    elif args.mode == 'ensemble_smoother':
-        model, argument = _setup_ensemble_smoother(args)
-    elif args.mode == 'es_mda':
-        model, argument = _setup_multiple_data_assimilation(args)    
+    with profiledRegion("model setup"):
+        res_config = ResConfig(args.config)
+        os.chdir(res_config.config_path)
+        ert = EnKFMain(res_config, strict=True, verbose=args.verbose)
+        notifier = ErtCliNotifier(ert, args.config)
+        ERT.adapt(notifier)
+
+        # Setup model
+        if args.mode == 'test_run':
+            model, argument = _setup_single_test_run()
+        elif args.mode == 'ensemble_experiment':
+            model, argument = _setup_ensemble_experiment(args)
+        elif args.mode == 'ensemble_smoother':
+            model, argument = _setup_ensemble_smoother(args)
+        elif args.mode == 'es_mda':
+            model, argument = _setup_multiple_data_assimilation(args)
+        else:
+            raise NotImplementedError(
+                "Run type not supported {}".format(args.mode))
+
+    argument.update(_straggler_policy(args))
+    argument["slow_realization_factor"] = getattr(args, "slow_realization_factor", None)
+    argument["trace_file"] = getattr(args, "trace_file", None)
+    model.prepareRun(argument)
+    try:
+        with _progress_reporting(args, model):
+            model.runSimulations(argument)
+    finally:
+        model.finishRun(argument)
+
+
+def run_export(args):
+    # The workers open the configuration themselves, after the chdir below.
+    config_file = os.path.abspath(args.config)
+    output_dir = os.path.abspath(args.output_dir)
+    BulkExporter.checkFormatAvailable(args.format)
+
+    ert = _setup_ert(config_file, args.verbose)
+    cases = _export_cases(args)
+    exporter = BulkExporter(ert, output_dir, file_format=args.format, chunk_size=args.chunk_size)
+    written = exporter.export(cases, data_types=args.data_types, patterns=args.keys,
+                              workers=args.workers, config_file=config_file)
+    print("Exported %d files to %s" % (len(written), output_dir))
+
+
+def run_load_results(args):
+    ert = _setup_ert(args.config, args.verbose)
+    case_name = args.case or ert_queries.getCurrentCaseName()
+    if not ert_queries.caseExists(case_name):
+        raise ArgumentTypeError("Case does not exist: {}".format(case_name))
+
+    realizations = list(_realizations(args).createActiveList())
+
+    def report(iens, status):
+        if status not in (LoadProgress.PENDING, LoadProgress.LOADING):
+            print("Realization %d: %s" % (iens, status))
+
+    progress = LoadProgress(listener=report if args.verbose else None)
+    runpath_index = ERT.runpath_indexes.index(ert, case_name)
+    manifest = LoadManifest.forCase(ert, case_name)
+    loader = ResultLoader(ert, workers=args.workers, runpath_index=runpath_index, manifest=manifest)
+    loaded = loader.load(case_name, realizations, args.iteration, progress, skip_unchanged=args.skip_unchanged)
+
+    statuses = progress.statuses()
+    failed = sorted(iens for iens, status in statuses.items() if status == LoadProgress.FAILED)
+    missing = sorted(iens for iens, status in statuses.items() if status == LoadProgress.MISSING)
+    print("Loaded %d of %d realizations into case %s" % (loaded, len(realizations), case_name))
+    unchanged = progress.count(LoadProgress.UNCHANGED)
+    if unchanged:
+        print("Skipped %d realizations with unchanged results" % unchanged)
+    if missing:
+        print("No run path for realizations: %s" % ", ".join(str(iens) for iens in missing))
+    if failed:
+        print("Failed to load realizations: %s" % ", ".join(str(iens) for iens in failed))
+    if failed or missing:
+        sys.exit(1)
+
+
+def run_init_case(args):
+    ert = _setup_ert(args.config, args.verbose)
+    if args.case is not None:
+        ert_queries.selectOrCreateNewCase(args.case)
+    case_name = ert_queries.getCurrentCaseName()
+
+    parameters = _init_parameters(args)
+    members = list(_realizations(args).createActiveList())
+    initializer = CaseInitializer(ert)
+    progress = TaskProgress()
+
+    if args.source_case is None:
+        initialized = initializer.initializeFromScratch(parameters, members, progress)
     else:
-        raise NotImplementedError(
-            "Run type not supported {}".format(args.mode))
-
-    model.runSimulations(argument)
+        if not ert_queries.canInitializeCurrentCaseFromExisting(args.source_case, case_name):
+            raise ArgumentTypeError("Source case does not exist or is not initialized: {}".format(args.source_case))
+        initialized = initializer.initializeFromExisting(args.source_case, args.report_step, parameters, members,
+                                                         progress)
+
+    print("Initialized %d realizations of case %s" % (initialized, case_name))
+
+
+def run_storage(args):
+    ert = _setup_ert(args.config, args.verbose)
+    manager = StorageManager(ert, workers=args.workers)
+
+    for case_name in (args.delete or []) + (args.archive or []):
+        problem = manager.removalProblem(case_name)
+        if problem is not None:
+            sys.exit("Refusing to remove case: {}".format(problem))
+
+    for case_name in args.delete or []:
+        manager.deleteCase(case_name)
+        print("Deleted case %s" % case_name)
+
+    for case_name in args.archive or []:
+        archive_path = manager.archiveCase(case_name, args.archive_dir)
+        print("Archived case %s to %s" % (case_name, archive_path))
+
+    if args.delete or args.archive:
+        ERT.emitErtChange()
+        return
+
+    usages = manager.scan()
+    node_types = sorted(set(node_type for usage in usages for node_type in usage.by_type))
+    print("Storage: %s" % manager.storageRoot())
+    print("%-30s %12s" % ("Case", "Size") + "".join(" %16s" % node_type for node_type in node_types))
+    for usage in usages:
+        print("%-30s %12s" % (usage.name, StorageManager.formatSize(usage.total)) +
+              "".join(" %16s" % StorageManager.formatSize(usage.by_type.get(node_type, 0))
+                      for node_type in node_types))
+    print("%-30s %12s" % ("Total", StorageManager.formatSize(sum(usage.total for usage in usages))))
+
+
+def _setup_ert(config_file, verbose):
+    """ @rtype: EnKFMain """
+    with profiledRegion("model setup"):
+        res_config = ResConfig(config_file)
+        os.chdir(res_config.config_path)
+        ert = EnKFMain(res_config, strict=True, verbose=verbose)
+        notifier = ErtCliNotifier(ert, config_file)
+        ERT.adapt(notifier)
+    return ert
+
+
+def _init_parameters(args):
+    all_parameters = ert_queries.getParameterList()
+    if args.parameters is None:
+        return all_parameters
+
+    parameters = [parameter.strip() for parameter in args.parameters.split(",") if parameter.strip()]
+    for parameter in parameters:
+        if parameter not in all_parameters:
+            raise ArgumentTypeError("Unknown parameter: {}".format(parameter))
+    return parameters
+
+
+def _export_cases(args):
+    if args.cases is None:
+        return [ert_queries.getCurrentCaseName()]
+
+    cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+    for case in cases:
+        if not ert_queries.caseExists(case):
+            raise ArgumentTypeError("Case does not exist: {}".format(case))
+    return cases
+
+
+@contextmanager
+def _progress_reporting(args, model):
+    if getattr(args, "progress_format", None) is None:
+        yield
+        return
+
+    reporter = ProgressReporter(model,
+                                path=getattr(args, "progress_file", None),
+                                interval=getattr(args, "progress_interval", ProgressReporter.DEFAULT_INTERVAL))
+    reporter.start()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = str(e) or e.__class__.__name__
+        raise
+    finally:
+        reporter.stop(error=error)
 
 
 def _setup_single_test_run():
@@ -63,7 +236,7 @@ def _setup_ensemble_smoother(args):
     model = EnsembleSmoother()
     iterable = False
     active_name = ERT.ert.analysisConfig().activeModuleName()
-    modules = ertmodel.getAnalysisModuleNames(iterable=iterable)
+    modules = ert_queries.getAnalysisModuleNames(iterable=iterable)
     simulations_argument = {
         "active_realizations": _realizations(args),
         "target_case": _target_case_name(args, format_mode=False),
@@ -76,16 +249,24 @@ def _setup_multiple_data_assimilation(args):
     model = MultipleDataAssimilation()
     iterable = False
     active_name = ERT.ert.analysisConfig().activeModuleName()
-    modules = ertmodel.getAnalysisModuleNames(iterable=iterable)
+    modules = ert_queries.getAnalysisModuleNames(iterable=iterable)
     simulations_argument = {
         "active_realizations": _realizations(args),
         "target_case": _target_case_name(args, format_mode=True),
         "analysis_module": _get_analysis_module_name(active_name, modules, iterable=iterable),
-        "weights": args.weights
+        "weights": args.weights,
+        "resume": args.resume
     }
     return model, simulations_argument
 
 
+def _straggler_policy(args):
+    return {
+        "straggler_threshold": getattr(args, "straggler_threshold", None),
+        "straggler_grace_time": getattr(args, "straggler_grace_time", None),
+    }
+
+
 def _get_analysis_module_name(active_name, modules, iterable):
 
     if active_name in modules:
@@ -123,14 +304,14 @@ def _target_case_name(args, format_mode=False):
         return args.target_case
 
     if not format_mode:
-        case_name = ertmodel.getCurrentCaseName()
+        case_name = ert_queries.getCurrentCaseName()
         return "{}_smoother_update".format(case_name)
 
     aic = ERT.ert.analysisConfig().getAnalysisIterConfig()
     if aic.caseFormatSet():
         return aic.getCaseFormat()
 
-    case_name = ertmodel.getCurrentCaseName()
+    case_name = ert_queries.getCurrentCaseName()
     return "{}_%d".format(case_name)
 
 
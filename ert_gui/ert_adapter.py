@@ -1,7 +1,17 @@
+from ert_gui.case_catalog import CaseCatalog
+from ert_gui.runpath_index import RunpathIndexCache
+
+
 class ErtAdapter():
 
+    def __init__(self):
+        self.case_catalog = CaseCatalog(self)
+        self.runpath_indexes = RunpathIndexCache()
+
     def adapt(self, implementation):
         self._implementation = implementation
+        self.case_catalog.invalidate()
+        self.runpath_indexes.clear()
     
     @property
     def ertChanged(self):
@@ -16,6 +26,7 @@ class ErtAdapter():
         return self._implementation.config_file
     
     def emitErtChange(self):
+        self.case_catalog.invalidate()
         self._implementation.emitErtChange()
 
     def reloadERT(self, config_file):
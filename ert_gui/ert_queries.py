@@ -0,0 +1,168 @@
+"""
+Queries and updates of the current EnKFMain through the ERT adapter. The
+module does not depend on Qt, so the command line modes can use it;
+ert_gui.ertwidgets.models.ertmodel re-exports it for the widgets, with a
+wait cursor on the slow operations.
+"""
+from res.analysis.analysis_module import AnalysisModule
+from res.analysis.enums.analysis_module_options_enum import AnalysisModuleOptionsEnum
+from res.enkf import EnkfVarType
+from res.job_queue import WorkflowRunner
+from ert_gui import ERT
+from ert_gui.case_initializer import CaseInitializer
+
+
+def getRealizationCount():
+    return ERT.ert.getEnsembleSize()
+
+
+def getAllCases():
+    """ @rtype: list[str] """
+    return ERT.case_catalog.caseNames()
+
+
+def caseExists(case_name):
+    """ @rtype: bool """
+    return ERT.case_catalog.exists(case_name)
+
+
+def caseIsInitialized(case_name):
+    """ @rtype: bool """
+    return ERT.case_catalog.isInitialized(case_name)
+
+
+def getAllInitializedCases():
+    """ @rtype: list[str] """
+    return [case for case in getAllCases() if caseIsInitialized(case)]
+
+
+def getCurrentCaseName():
+    """ @rtype: str """
+    return str(ERT.ert.getEnkfFsManager().getCurrentFileSystem().getCaseName())
+
+
+def getHistoryLength():
+    """ @rtype: int """
+    return ERT.ert.getHistoryLength()
+
+
+def selectOrCreateNewCase(case_name):
+    if getCurrentCaseName() != case_name:
+        fs = ERT.ert.getEnkfFsManager().getFileSystem(case_name)
+        ERT.ert.getEnkfFsManager().switchFileSystem(fs)
+        ERT.emitErtChange()
+
+
+def caseHasDataAndIsNotRunning(case):
+    """ @rtype: bool """
+    return ERT.case_catalog.hasData(case) and not caseIsRunning(case)
+
+
+def getAllCasesWithDataAndNotRunning():
+    """ @rtype: list[str] """
+    return [case for case in getAllCases() if caseHasDataAndIsNotRunning(case)]
+
+
+def caseIsRunning(case):
+    """ @rtype: bool: asks the storage, not the case catalog """
+    return ERT.ert.getEnkfFsManager().isCaseRunning(case)
+
+
+def getAllCasesNotRunning():
+    """ @rtype: list[str] """
+    return [case for case in getAllCases() if not caseIsRunning(case)]
+
+
+def getCaseRealizationStates(case_name):
+    """ @rtype: list[res.enkf.enums.RealizationStateEnum] """
+    return ERT.case_catalog.realizationStates(case_name)
+
+
+def initializeCurrentCaseFromScratch(parameters, members, progress=None):
+    """ @rtype: int: the number of initialized realizations """
+    initializer = CaseInitializer(ERT.ert)
+    initialized = initializer.initializeFromScratch(parameters, members, progress)
+    ERT.emitErtChange()
+    return initialized
+
+
+def canInitializeCurrentCaseFromExisting(source_case, target_case):
+    """ @rtype: bool """
+    return caseExists(source_case) and caseIsInitialized(source_case) and caseExists(target_case)
+
+
+def initializeCurrentCaseFromExisting(source_case, target_case, source_report_step, parameters, members,
+                                      progress=None):
+    """ @rtype: int: the number of initialized realizations """
+    if not canInitializeCurrentCaseFromExisting(source_case, target_case):
+        return 0
+
+    initializer = CaseInitializer(ERT.ert)
+    initialized = initializer.initializeFromExisting(source_case, source_report_step, parameters, members, progress)
+    ERT.emitErtChange()
+    return initialized
+
+
+def getParameterList():
+    """ @rtype: list[str] """
+    return [str(p) for p in ERT.ert.ensembleConfig().getKeylistFromVarType(EnkfVarType.PARAMETER)]
+
+
+def getRunPath():
+    """ @rtype: str """
+    return ERT.ert.getModelConfig().getRunpathAsString()
+
+
+def getNumberOfIterations():
+    """ @rtype: int """
+    return ERT.ert.analysisConfig().getAnalysisIterConfig().getNumIterations()
+
+
+def setNumberOfIterations(iteration_count):
+    """ @type iteration_count: int """
+    if iteration_count != getNumberOfIterations():
+        ERT.ert.analysisConfig().getAnalysisIterConfig().setNumIterations(iteration_count)
+        ERT.emitErtChange()
+
+
+def getWorkflowNames():
+    """ @rtype: list[str] """
+    return sorted(ERT.ert.getWorkflowList().getWorkflowNames(), key=str.lower)
+
+
+def createWorkflowRunner(workflow_name):
+    """ @rtype: WorkflowRunner """
+    workflow_list = ERT.ert.getWorkflowList()
+
+    workflow = workflow_list[workflow_name]
+    context = workflow_list.getContext()
+    return WorkflowRunner(workflow, ERT.ert, context)
+
+
+def getAnalysisModules(iterable=False):
+    """ @rtype: list[ert.analysis.AnalysisModule]"""
+    module_names = ERT.ert.analysisConfig().getModuleList()
+
+    modules = []
+    for module_name in module_names:
+        module = ERT.ert.analysisConfig().getModule(module_name)
+        module_is_iterable = module.checkOption(AnalysisModuleOptionsEnum.ANALYSIS_ITERABLE)
+
+        if iterable == module_is_iterable:
+            modules.append(module)
+
+    return sorted(modules, key=AnalysisModule.getName)
+
+def getAnalysisModuleNames(iterable=False):
+    """ @rtype: list[str] """
+    modules = getAnalysisModules(iterable)
+    return [module.getName() for module in modules]
+
+
+def getCurrentAnalysisModuleName():
+    """ @rtype: str """
+    return ERT.ert.analysisConfig().activeModuleName()
+
+
+def getQueueConfig():
+    return ERT.ert.get_queue_config( )
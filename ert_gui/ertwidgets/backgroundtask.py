@@ -0,0 +1,87 @@
+from threading import Thread
+
+from ErtQt.Qt import Qt, QTimer, QProgressDialog
+
+
+class BackgroundTask(object):
+    """
+    Runs a function in a daemon thread and reports back in the GUI thread,
+    which polls the thread with a timer. on_update() is called on every
+    poll, and on_done(value, error) once the function has finished, with
+    its return value or the message of the exception it raised.
+    """
+    POLL_INTERVAL = 100
+
+    def __init__(self, name, function, on_done, on_update=None):
+        super(BackgroundTask, self).__init__()
+        self._function = function
+        self._on_done = on_done
+        self._on_update = on_update
+        self._result = {}
+
+        self._thread = Thread(target=self._run, name=name)
+        self._thread.daemon = True
+
+        self._timer = QTimer()
+        self._timer.setInterval(BackgroundTask.POLL_INTERVAL)
+        self._timer.timeout.connect(self._poll)
+
+    def _run(self):
+        try:
+            self._result["value"] = self._function()
+        except Exception as e:
+            self._result["error"] = str(e)
+
+    def start(self):
+        self._thread.start()
+        self._timer.start()
+
+    def isRunning(self):
+        return self._thread.is_alive()
+
+    def _poll(self):
+        if self._on_update is not None:
+            self._on_update()
+
+        if self._thread.is_alive():
+            return
+
+        self._timer.stop()
+        self._finished(self._result.get("value"), self._result.get("error"))
+
+    def _finished(self, value, error):
+        self._on_done(value, error)
+
+
+class ProgressDialogTask(BackgroundTask):
+    """
+    A BackgroundTask running function(progress=progress) with a modal
+    progress dialog, which shows the progress of the TaskProgress and
+    cancels it when the dialog is cancelled.
+    """
+
+    def __init__(self, parent, title, description, function, progress, on_done, name):
+        self._progress = progress
+        self._description = description
+
+        self._dialog = QProgressDialog("%s..." % description, "Cancel", 0, 100, parent)
+        self._dialog.setWindowTitle(title)
+        self._dialog.setWindowModality(Qt.WindowModal)
+        self._dialog.setMinimumDuration(500)
+        self._dialog.setAutoClose(False)
+        self._dialog.canceled.connect(progress.cancel)
+
+        super(ProgressDialogTask, self).__init__(name, lambda: function(progress=progress), on_done,
+                                                 self._updateDialog)
+
+    def _updateDialog(self):
+        if not self._progress.isCancelled():
+            self._dialog.setLabelText("%s: %d of %d realizations" % (self._description, self._progress.done(),
+                                                                     self._progress.total()))
+            self._dialog.setValue(int(self._progress.fraction() * 100))
+
+    def _finished(self, value, error):
+        # Closing the dialog emits canceled, so the dialog is disconnected from the progress first
+        self._dialog.canceled.disconnect(self._progress.cancel)
+        self._dialog.close()
+        super(ProgressDialogTask, self)._finished(value, error)
@@ -7,6 +7,7 @@ from ert_gui.ertwidgets import addHelpToWidget
 from ert_gui.ertwidgets.models.ertmodel import getAllCases, selectOrCreateNewCase
 from ert_gui.ertwidgets.validateddialog import ValidatedDialog
 from ert_gui.ertwidgets import resourceIcon
+from ert_gui.storage_manager import StorageManager
 
 
 class AddRemoveWidget(QWidget):
@@ -69,7 +70,7 @@ class CaseList(QWidget):
         self._list.setMinimumHeight(100)
         self._list.setMaximumHeight(250)
         self._default_selection_mode = self._list.selectionMode()
-        self.setSelectable(False)
+        self._list.itemSelectionChanged.connect(self._selectionChanged)
 
         layout.addWidget(QLabel("Available Cases:"))
         layout.addWidget(self._list)
@@ -99,9 +100,27 @@ class CaseList(QWidget):
         if not new_case_name == "":
             selectOrCreateNewCase(new_case_name)
 
+    def _selectionChanged(self):
+        self._addRemoveWidget.enableRemoveButton(len(self._list.selectedItems()) > 0)
+
     def removeItem(self):
-        message = "Support for removal of items has not been implemented!"
-        QMessageBox.information(self, "Not implemented!", message)
+        """ Deletes the selected case from storage, unless it is running, current or in use. """
+        items = self._list.selectedItems()
+        if not items:
+            return
+
+        case_name = str(items[0].text())
+        manager = StorageManager(ERT.ert)
+        problem = manager.removalProblem(case_name)
+        if problem is not None:
+            QMessageBox.warning(self, "Delete case", "%s and can not be deleted." % problem)
+            return
+
+        answer = QMessageBox.question(self, "Delete case", "Delete case %s from storage?" % case_name,
+                                      QMessageBox.Yes | QMessageBox.No)
+        if answer == QMessageBox.Yes:
+            manager.deleteCase(case_name)
+            ERT.emitErtChange()
 
 
     def updateList(self):
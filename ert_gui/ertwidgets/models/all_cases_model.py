@@ -2,6 +2,7 @@ import sys
 
 from ErtQt.Qt import QAbstractItemModel, QModelIndex, Qt, QVariant
 
+from ert_gui import ERT
 from ert_gui.ertwidgets.models.ertmodel import getAllCases
 
 
@@ -9,7 +10,15 @@ class AllCasesModel(QAbstractItemModel):
 
     def __init__(self):
         QAbstractItemModel.__init__(self)
-        self.__data = []
+        self.__data = getAllCases()
+        ERT.ertChanged.connect(self.__updateCases)
+
+    def __updateCases(self):
+        cases = getAllCases()
+        if cases != self.__data:
+            self.beginResetModel()
+            self.__data = cases
+            self.endResetModel()
 
     def index(self, row, column, parent=None, *args, **kwargs):
         return self.createIndex(row, column)
@@ -49,7 +58,7 @@ class AllCasesModel(QAbstractItemModel):
 
 
     def getAllItems(self):
-        return getAllCases()
+        return self.__data
 
 
     def indexOf(self, item):
@@ -1,6 +1,4 @@
-import sys
-
-from ErtQt.Qt import Qt, QFrame, QLabel, QVBoxLayout, QHBoxLayout, QScrollArea, QWidget, QGridLayout
+from ErtQt.Qt import Qt, QFrame, QLabel, QVBoxLayout, QHBoxLayout, QScrollArea, QWidget, QGridLayout, QTimer
 
 from ert_gui.ertwidgets.models.ertsummary import ErtSummary
 
@@ -61,31 +59,52 @@ class SummaryPanel(QFrame):
         layout.addWidget(scroll)
 
         self.setLayout(layout)
-        self.updateSummary()
+
+        self.__loading_label = QLabel("Loading configuration summary...")
+        self.layout.addWidget(self.__loading_label)
+
+        # Loaded once the event loop runs, so the summary does not delay the window.
+        # EnKFMain is only queried from the GUI thread.
+        QTimer.singleShot(0, self.updateSummary)
 
 
     def updateSummary(self):
+        self.showSummary(self.loadSummary())
+
+
+    def loadSummary(self):
+        """ @rtype: list[str] """
         summary = ErtSummary()
 
         text = SummaryTemplate("Forward Model")
-
         for job in summary.getForwardModels():
             text.addRow(job)
 
-
-        self.addColumn(text.getText())
+        columns = [text.getText()]
 
         text = SummaryTemplate("Parameters")
         for parameters in summary.getParameters():
             text.addRow(parameters)
 
-        self.addColumn(text.getText())
+        columns.append(text.getText())
 
         text = SummaryTemplate("Observations")
         for observations in summary.getObservations():
             text.addRow(observations)
 
-        self.addColumn(text.getText())
+        columns.append(text.getText())
+
+        return columns
+
+
+    def showSummary(self, columns):
+        if self.__loading_label is not None:
+            self.layout.removeWidget(self.__loading_label)
+            self.__loading_label.deleteLater()
+            self.__loading_label = None
+
+        for column in columns:
+            self.addColumn(column)
 
 
     def addColumn(self, text):
@@ -110,12 +110,15 @@
 #
 # -------------------- </Example shell script> --------------------
 import sys
+import time
+
+_import_start_time = time.time()
 
 try:
-  from PyQt4.QtCore import Qt, QLocale
+  from PyQt4.QtCore import Qt, QLocale, QTimer
   from PyQt4.QtGui import QApplication, QFileDialog, QMessageBox
 except ImportError:
-  from PyQt5.QtCore import Qt, QLocale
+  from PyQt5.QtCore import Qt, QLocale, QTimer
   from PyQt5.QtWidgets import QApplication, QFileDialog, QMessageBox
 
 
@@ -125,29 +128,38 @@ import ert_gui.ertwidgets
 from ert_gui.main_window import GertMainWindow
 from ert_gui.newconfig import NewConfigurationDialog
 from ert_gui.simulation.simulation_panel import SimulationPanel
-from ert_gui.tools import HelpCenter
-from ert_gui.tools.export import ExportTool
+from ert_gui.ertwidgets.models.ertmodel import getWorkflowNames
+from ert_gui.tools import HelpCenter, LazyTool
+from ert_gui.tools.export import ExportTool, ExportKeywordModel
 from ert_gui.tools.help import HelpTool
 from ert_gui.tools.ide import IdeTool
-from ert_gui.tools.load_results import LoadResultsTool
+from ert_gui.tools.load_results import LoadResultsTool, LoadResultsModel
 from ert_gui.tools.manage_cases import ManageCasesTool
 from ert_gui.tools.plot import PlotTool
 from ert_gui.tools.plugins import PluginHandler, PluginsTool
 from ert_gui.tools.run_analysis import RunAnalysisTool
+from ert_gui.tools.storage import StorageTool
 from ert_gui.tools.workflows import WorkflowsTool
+from ert_gui.profiler import enableProfilingFromEnvironment, profiledRegion
+from ert_gui.startup_trace import StartupTrace
 import os
 from res.enkf import EnKFMain, ResConfig
 from res.util import ResLog
 
 import res
 import ecl
-import sys
-import time
+
+_import_end_time = time.time()
 
 
 def main(argv):
-    app = QApplication(argv)  # Early so that QT is initialized before other imports
-    app.setWindowIcon(resourceIcon("application/window_icon_cutout"))
+    enableProfilingFromEnvironment()
+    startup_trace = StartupTrace.fromEnvironment()
+    startup_trace.addPhase("import", _import_start_time, _import_end_time)
+
+    with startup_trace.phase("QApplication"):
+        app = QApplication(argv)  # Early so that QT is initialized before other imports
+        app.setWindowIcon(resourceIcon("application/window_icon_cutout"))
 
     # There seems to be a setlocale() call deep down in the initialization of
     # QApplication, if the user has set the LC_NUMERIC environment variables to
@@ -224,40 +236,62 @@ def main(argv):
     splash.show()
     splash.repaint()
 
-    now = time.time()
+    with profiledRegion("model setup"):
+        with startup_trace.phase("ResConfig"):
+            res_config = ResConfig(config_file)
+        os.chdir( res_config.config_path )
+        with startup_trace.phase("EnKFMain"):
+            ert = EnKFMain(res_config, strict=strict, verbose=verbose)
+        ert_gui.configureErtNotifier(ert, config_file)
 
-    res_config = ResConfig(config_file)
-    os.chdir( res_config.config_path )
-    ert = EnKFMain(res_config, strict=strict, verbose=verbose)
-    ert_gui.configureErtNotifier(ert, config_file)
+    with startup_trace.phase("GertMainWindow"):
+        window = GertMainWindow()
 
-    window = GertMainWindow()
-    window.setWidget(SimulationPanel())
+    with startup_trace.phase("SimulationPanel"):
+        window.setWidget(SimulationPanel())
 
     plugin_handler = PluginHandler(ert, ert.getWorkflowList().getPluginJobs(), window)
 
-    help_tool = HelpTool("ERT", window)
-
-    window.addDock("Configuration Summary", SummaryPanel(), area=Qt.BottomDockWidgetArea)
-    window.addTool(IdeTool(os.path.basename(config_file), help_tool))
-    window.addTool(PlotTool())
-    window.addTool(ExportTool())
-    window.addTool(WorkflowsTool())
-    window.addTool(ManageCasesTool())
-    window.addTool(PluginsTool(plugin_handler))
-    window.addTool(RunAnalysisTool())
-    window.addTool(LoadResultsTool())
-    window.addTool(help_tool)
-    window.adjustSize()
-    sleep_time = 2 - (time.time() - now)
-
-    if sleep_time > 0:
-        time.sleep(sleep_time)
-
-    window.show()
-    splash.finish(window)
-    window.activateWindow()
-    window.raise_()
+    with startup_trace.phase("HelpTool"):
+        help_tool = HelpTool("ERT", window)
+
+    with startup_trace.phase("SummaryPanel"):
+        window.addDock("Configuration Summary", SummaryPanel(), area=Qt.BottomDockWidgetArea)
+
+    # Apart from the help and plugins, the tools are created when they are first used.
+    with startup_trace.phase("tools"):
+        tools = [
+            LazyTool(IdeTool, lambda: IdeTool(os.path.basename(config_file), help_tool)),
+            LazyTool(PlotTool),
+            LazyTool(ExportTool, enabled=lambda: ExportKeywordModel().hasKeywords()),
+            LazyTool(WorkflowsTool, enabled=lambda: len(getWorkflowNames()) > 0),
+            LazyTool(ManageCasesTool),
+            LazyTool(StorageTool),
+            PluginsTool(plugin_handler),
+            LazyTool(RunAnalysisTool),
+            LazyTool(LoadResultsTool, enabled=LoadResultsModel.isValidRunPath),
+            help_tool,
+        ]
+        for tool in tools:
+            window.addTool(tool)
+
+    with startup_trace.phase("show"):
+        window.adjustSize()
+        window.show()
+        splash.finish(window)
+        window.activateWindow()
+        window.raise_()
+
+    def updateTools():
+        with startup_trace.phase("tool availability"):
+            for tool in tools:
+                if isinstance(tool, LazyTool):
+                    tool.updateEnabled()
+        startup_trace.finish()
+
+    # Runs once the event loop has started, i.e. after the window is shown.
+    QTimer.singleShot(0, updateTools)
+
     ResLog.log(3, "Versions: ecl:%s    res:%s    ert:%s" % (ecl.__version__, res.__version__, ert_gui.__version__))
     
     if not ert._real_enkf_main().have_observations():
@@ -1,71 +1,106 @@
 import os
+import time
+from bisect import bisect_left
+from threading import Lock
 
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
 
-class PathItem(object):
-    def __init__(self, value):
-        super(PathItem, self).__init__()
-        #: :type: str
-        self.value = value
 
+class DirectoryListing(object):
+    """ The entries of a directory, sorted by name so a prefix can be looked up with bisect. """
 
-    def __str__(self):
-        return self.value
+    def __init__(self, mtime, entries):
+        """ @type entries: dict[str, bool]: whether each entry is a directory """
+        super(DirectoryListing, self).__init__()
+        self.mtime = mtime
+        self.checked = time.time()
+        self.names = sorted(entries)
+        self.directories = set(name for name, is_dir in entries.items() if is_dir)
 
-    def __gt__(self, other):
-        assert isinstance(other, PathItem)
-
-        if self.value.endswith("/") and not other.value.endswith("/"):
-            return True
-        elif not self.value.endswith("/") and other.value.endswith("/"):
-            return False
-        else:
-            return self.value.lower() > other.value.lower()
-
-    def __eq__(self, other):
-        return self.value == other.value
-
-    def __lt__(self, other):
-        return not (self == other or self > other)
-
-    def __le__(self, other):
-        return self == other or not self > other
-
-    def __ge__(self, other):
-        return self == other or self > other
+    def matches(self, prefix):
+        """ @rtype: list[str]: the names starting with prefix """
+        result = []
+        for index in range(bisect_left(self.names, prefix), len(self.names)):
+            name = self.names[index]
+            if not name.startswith(prefix):
+                break
+            result.append(name)
+        return result
 
+    def isDirectory(self, name):
+        return name in self.directories
 
 
 class PathCompleter(object):
-    def __init__(self):
+    """
+    Completes paths from cached directory listings. A listing is trusted
+    for ttl seconds; after that the modification time of the directory is
+    checked and the directory is only listed again if it has changed.
+    Directories are completed with a trailing slash and listed after the
+    files.
+    """
+    DEFAULT_TTL = 2.0
+
+    def __init__(self, ttl=DEFAULT_TTL):
         super(PathCompleter, self).__init__()
-
+        self._ttl = ttl
+        self._lock = Lock()
+        self._listings = {}
+
+    def invalidate(self, directory=None):
+        """ Forgets the listing of directory, or of all directories if None. """
+        with self._lock:
+            if directory is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(os.path.abspath(directory), None)
+
+    @staticmethod
+    def _scan(path):
+        """ @rtype: dict[str, bool] """
+        if scandir is not None:
+            return dict((entry.name, entry.is_dir()) for entry in scandir(path))
+        return dict((name, os.path.isdir(os.path.join(path, name))) for name in os.listdir(path))
+
+    def _listing(self, directory):
+        """ @rtype: DirectoryListing or None """
+        path = os.path.abspath(directory)
+        with self._lock:
+            listing = self._listings.get(path)
+            if listing is not None and time.time() - listing.checked < self._ttl:
+                return listing
+
+            try:
+                mtime = os.stat(path).st_mtime
+                if listing is not None and listing.mtime == mtime:
+                    listing.checked = time.time()
+                    return listing
+
+                listing = DirectoryListing(mtime, self._scan(path))
+            except OSError:
+                self._listings.pop(path, None)
+                return None
+
+            self._listings[path] = listing
+            return listing
 
     def completeOptions(self, path_prefix):
-
+        """ @rtype: list[str] """
         root, entry_prefix = os.path.split(path_prefix)
 
-        if os.path.isdir(root):
-            if not root.startswith("/"):
-                root_path = "./%s/" % root
-            else:
-                root_path = "%s/" % root
-        else:
-            if root == "":
-                root_path = "./"
-            else:
-                root_path = root
-
-        entries = os.listdir(root_path)
+        listing = self._listing(root or os.curdir)
+        if listing is None:
+            return []
 
+        names = sorted(listing.matches(entry_prefix), key=lambda name: (listing.isDirectory(name), name.lower()))
 
         result = []
-        for entry in entries:
-            if entry.startswith(entry_prefix):
-                full_path = os.path.join(root, entry)
-                if os.path.isdir(full_path):
-                    full_path += "/"
-                result.append(PathItem(full_path))
-
-
-        result = sorted(result)
-        return [str(item) for item in result]
+        for name in names:
+            full_path = os.path.join(root, name)
+            if listing.isDirectory(name):
+                full_path += "/"
+            result.append(full_path)
+        return result
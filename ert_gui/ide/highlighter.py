@@ -1,26 +1,53 @@
 import re
 import sys
+from functools import partial
 
 try:
+  from PyQt4.QtCore import QTimer
   from PyQt4.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QTextBlockUserData
 except ImportError:
+  from PyQt5.QtCore import QTimer
   from PyQt5.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QTextBlockUserData
 
+from ert_gui.ertwidgets.backgroundtask import BackgroundTask
 from ert_gui.ide.keywords import ErtKeywords
 from ert_gui.ide.keywords.configuration_line_builder import ConfigurationLineBuilder
 from ert_gui.ide.keywords.data import Keyword
+from ert_gui.ide.keywords.document_validator import DocumentValidator
 
 
 class ConfigurationLineUserData(QTextBlockUserData):
-    def __init__(self, configuration_line):
+    def __init__(self, configuration_line, problems=None):
         QTextBlockUserData.__init__(self)
         self.configuration_line = configuration_line
+        self.problems = problems or []
 
 class KeywordHighlighter(QSyntaxHighlighter):
+    """
+    Highlights the configuration line by line, reusing the parsed lines for
+    text it has seen before. The problems which can only be found by
+    looking at the whole document, like duplicate keywords, are found in a
+    background thread when the document has not changed for
+    VALIDATION_DELAY milliseconds.
+    """
+    CACHE_SIZE = 10000
+    VALIDATION_DELAY = 500
+
     def __init__(self, document):
         QSyntaxHighlighter.__init__(self, document)
 
-        self.clb = ConfigurationLineBuilder(ErtKeywords())
+        self.clb = ConfigurationLineBuilder(ErtKeywords(), cache_size=KeywordHighlighter.CACHE_SIZE)
+
+        self.document_validator = DocumentValidator()
+        self.document_problems = {}
+        self._running_validation = None
+
+        self._validation_timer = QTimer()
+        self._validation_timer.setSingleShot(True)
+        self._validation_timer.setInterval(KeywordHighlighter.VALIDATION_DELAY)
+        self._validation_timer.timeout.connect(self.__startValidation)
+
+        document.contentsChanged.connect(self._validation_timer.start)
 
 
         self.comment_format = QTextCharFormat()
@@ -81,7 +108,8 @@ class KeywordHighlighter(QSyntaxHighlighter):
 
         if self.clb.hasConfigurationLine():
             cl = self.clb.configurationLine()
-            self.setCurrentBlockUserData(ConfigurationLineUserData(cl))
+            problems = self.problemsForBlock(self.currentBlock().blockNumber(), block)
+            self.setCurrentBlockUserData(ConfigurationLineUserData(cl, problems))
 
             self.formatKeyword(cl.keyword(), cl.validationStatusForToken(cl.keyword()))
 
@@ -97,12 +125,29 @@ class KeywordHighlighter(QSyntaxHighlighter):
                 if not cl.validationStatusForToken(argument):
                     self.formatToken(argument, self.error_format)
 
+            for problem in problems:
+                self.formatToken(problem, self.error_format)
+
 
         if self.search_string != "":
             for match in re.finditer("(%s)" % self.search_string, complete_block):
                 self.setFormat(match.start(1), match.end(1) - match.start(1), self.search_format)
 
 
+    def problemsForBlock(self, block_number, text):
+        """
+        The document problems of a line, if the line still has the text it
+        had when it was validated. Lines are inserted and removed before
+        the next validation has finished, so the problems of a line number
+        may belong to another line by now.
+        @rtype: list of DocumentProblem
+        """
+        line_text, problems = self.document_problems.get(block_number, (None, []))
+        if line_text != text:
+            return []
+        return problems
+
+
     def setSearchString(self, string):
         try:
             if self.search_string != unicode(string):
@@ -116,3 +161,53 @@ class KeywordHighlighter(QSyntaxHighlighter):
 
     def formatToken(self, token, highlight_format):
         self.setFormat(token.fromIndex(), token.count(), highlight_format)
+
+
+    def documentText(self):
+        text = self.document().toPlainText()
+        try:
+            return unicode(text)
+        except NameError:
+            return text
+
+
+    def isValidating(self):
+        return self._running_validation is not None
+
+
+    def __startValidation(self):
+        if self.isValidating():
+            self._validation_timer.start()
+            return
+
+        text = self.documentText()
+        self._running_validation = BackgroundTask("ert_gui_document_validation_thread",
+                                                  partial(self.document_validator.validate, text),
+                                                  partial(self.__validationFinished, text))
+        self._running_validation.start()
+
+
+    def __validationFinished(self, text, problems, error):
+        self._running_validation = None
+
+        if error is not None:
+            sys.stderr.write("Validating the configuration failed: %s\n" % error)
+            return
+
+        if text != self.documentText():
+            # The document changed while validating; a new validation is on its way
+            return
+
+        lines = text.split("\n")
+        document_problems = {}
+        for problem in problems:
+            line_number = problem.lineNumber()
+            document_problems.setdefault(line_number, (lines[line_number], []))[1].append(problem)
+
+        changed_lines = set(self.document_problems) | set(document_problems)
+        self.document_problems = document_problems
+
+        for line_number in sorted(changed_lines):
+            block = self.document().findBlockByNumber(line_number)
+            if block.isValid():
+                self.rehighlightBlock(block)
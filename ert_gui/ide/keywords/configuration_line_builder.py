@@ -1,24 +1,56 @@
+from collections import OrderedDict
+
 from ert_gui.ide.keywords import ErtKeywords
 from ert_gui.ide.keywords.configuration_line_parser import ConfigurationLineParser
 from ert_gui.ide.keywords.data import ConfigurationLine, Argument, Keyword
 
 
 class ConfigurationLineBuilder(object):
+    """
+    Builds a validated ConfigurationLine from a line of text. With a
+    cache_size larger than zero the results for the last cache_size
+    distinct lines are kept and reused, so identical lines are parsed and
+    validated only once. A cached line is not validated again, call
+    clearCache() when something the validation depends on has changed,
+    e.g. the defines of the path arguments.
+    """
     DEFAULT_GROUP = "Unknown keyword"
     DEFAULT_DOCUMENTATION_LINK = "unknown_keyword"
 
-    def __init__(self, keywords):
+    def __init__(self, keywords, cache_size=0):
         super(ConfigurationLineBuilder, self).__init__()
 
         assert isinstance(keywords, ErtKeywords)
         self.__keywords = keywords
         self.__configuration_line_parser = ConfigurationLineParser()
         self.__configuration_line = None
+        self.__comment_index = -1
+        self.__cache_size = cache_size
+        self.__cache = OrderedDict()
 
 
     def processLine(self, line):
+        if line in self.__cache:
+            self.__configuration_line, self.__comment_index = self.__cache.pop(line)
+        else:
+            self.__buildLine(line)
+
+        if self.__cache_size > 0:
+            self.__cache[line] = (self.__configuration_line, self.__comment_index)
+            while len(self.__cache) > self.__cache_size:
+                self.__cache.popitem(last=False)
+
+    def clearCache(self):
+        self.__cache.clear()
+
+    def cacheCount(self):
+        """ @rtype: int """
+        return len(self.__cache)
+
+    def __buildLine(self, line):
         self.__configuration_line_parser.parseLine(line)
         self.__configuration_line = None
+        self.__comment_index = self.__configuration_line_parser.commentIndex()
 
         if self.__configuration_line_parser.hasKeyword():
             keyword = self.__configuration_line_parser.keyword()
@@ -52,10 +84,10 @@ class ConfigurationLineBuilder(object):
 
     def hasComment(self):
         """ @rtype: bool """
-        return self.__configuration_line_parser.hasComment()
+        return self.__comment_index >= 0
 
     def commentIndex(self):
-        return self.__configuration_line_parser.commentIndex()
+        return self.__comment_index
 
 
     def __matchArguments(self, keyword, arg_defs, args):
@@ -0,0 +1,23 @@
+from ert_gui.ide.keywords.definitions import ArgumentDefinition
+from ert_gui.ide.keywords.definitions import IntegerArgument
+from ert_gui.ide.keywords.definitions import PercentArgument
+
+
+class RealizationThresholdArgument(ArgumentDefinition):
+    """ Accepts either an absolute number of realizations, e.g. 45, or a percentage, e.g. 80% """
+
+    def __init__(self, **kwargs):
+        super(RealizationThresholdArgument, self).__init__(**kwargs)
+        self.__count_argument = IntegerArgument(from_value=1)
+        self.__percent_argument = PercentArgument(from_value=1, to_value=100)
+
+    def validate(self, token):
+        validation_status = super(RealizationThresholdArgument, self).validate(token)
+
+        if validation_status.failed() or token.strip() == "":
+            return validation_status
+
+        if token.endswith("%"):
+            return self.__percent_argument.validate(token)
+
+        return self.__count_argument.validate(token)
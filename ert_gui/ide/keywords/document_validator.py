@@ -0,0 +1,145 @@
+import re
+
+from ert_gui.ide.keywords.configuration_line_parser import ConfigurationLineParser
+
+
+class DocumentProblem(object):
+    """ A problem with a token of a line, found by looking at the whole document. """
+
+    def __init__(self, line_number, from_index, to_index, message):
+        super(DocumentProblem, self).__init__()
+        self.__line_number = line_number
+        self.__from_index = from_index
+        self.__to_index = to_index
+        self.__message = message
+
+    def lineNumber(self):
+        """ @rtype: int """
+        return self.__line_number
+
+    def fromIndex(self):
+        """ @rtype: int """
+        return self.__from_index
+
+    def toIndex(self):
+        """ @rtype: int """
+        return self.__to_index
+
+    def count(self):
+        """ @rtype: int """
+        return self.__to_index - self.__from_index
+
+    def message(self):
+        """ @rtype: str """
+        return self.__message
+
+    def __contains__(self, item):
+        return self.__from_index <= item < self.__to_index
+
+
+class DocumentValidator(object):
+    """
+    Validates a configuration as a whole, which the line by line validation
+    of the ConfigurationLineBuilder can not do:
+     - keywords which only take one value and are set more than once,
+     - DEFINE keys which are defined more than once,
+     - DEFINE keys and analysis modules which are used before they are
+       defined further down in the configuration.
+
+    Only the parser is used, so a validator can run in another thread than
+    the one highlighting the document.
+    """
+    SINGLE_VALUE_KEYWORDS = ("DATA_FILE", "ECLBASE", "END_DATE", "ENSPATH", "GRID", "HISTORY_SOURCE",
+                             "ITER_CASE", "ITER_COUNT", "JOBNAME", "LOG_FILE", "LOG_LEVEL", "MAX_RUNTIME",
+                             "MAX_SUBMIT", "MIN_REALIZATIONS", "NUM_REALIZATIONS", "OBS_CONFIG", "QUEUE_SYSTEM",
+                             "REFCASE", "RUNPATH", "RUNPATH_FILE", "SCHEDULE_FILE", "UMASK", "UPDATE_LOG_PATH")
+
+    MODULE_DEFINITIONS = {"ANALYSIS_LOAD": 0, "ANALYSIS_COPY": 1}
+    MODULE_REFERENCES = {"ANALYSIS_SELECT": 0, "ANALYSIS_SET_VAR": 0, "ANALYSIS_COPY": 0}
+
+    DEFINE_REFERENCE_PATTERN = re.compile(r"<[^<>\s]+>")
+
+    KEYWORD_ALREADY_SET = "The keyword is already set on line %d!"
+    DEFINE_ALREADY_SET = "The key %s is already defined on line %d!"
+    DEFINED_LATER = "%s is not defined until line %d!"
+
+    def __init__(self):
+        super(DocumentValidator, self).__init__()
+        self.__parser = ConfigurationLineParser()
+
+    def __parseLines(self, text):
+        """ @rtype: list of (int, Keyword, list of Argument) """
+        lines = []
+        for line_number, line in enumerate(text.split("\n")):
+            self.__parser.parseLine(line)
+            if self.__parser.hasKeyword():
+                keyword = self.__parser.keyword()
+                # An indented keyword is also matched as an argument
+                arguments = [argument for argument in self.__parser.arguments()
+                             if argument.fromIndex() >= keyword.toIndex()]
+                lines.append((line_number, keyword, arguments))
+        return lines
+
+    def validate(self, text):
+        """ @rtype: list of DocumentProblem """
+        lines = self.__parseLines(text)
+        problems = []
+        problems.extend(self.__duplicateKeywords(lines))
+        problems.extend(self.__duplicateDefines(lines))
+        problems.extend(self.__referencesDefinedLater(lines))
+        return sorted(problems, key=lambda problem: (problem.lineNumber(), problem.fromIndex()))
+
+    def __duplicateKeywords(self, lines):
+        first_lines = {}
+        for line_number, keyword, arguments in lines:
+            name = keyword.value()
+            if name not in DocumentValidator.SINGLE_VALUE_KEYWORDS:
+                continue
+
+            if name in first_lines:
+                message = DocumentValidator.KEYWORD_ALREADY_SET % (first_lines[name] + 1)
+                yield DocumentProblem(line_number, keyword.fromIndex(), keyword.toIndex(), message)
+            else:
+                first_lines[name] = line_number
+
+    def __duplicateDefines(self, lines):
+        first_lines = {}
+        for line_number, keyword, arguments in lines:
+            if keyword.value() != "DEFINE" or not arguments:
+                continue
+
+            key = arguments[0]
+            if key.value() in first_lines:
+                message = DocumentValidator.DEFINE_ALREADY_SET % (key.value(), first_lines[key.value()] + 1)
+                yield DocumentProblem(line_number, key.fromIndex(), key.toIndex(), message)
+            else:
+                first_lines[key.value()] = line_number
+
+    def __referencesDefinedLater(self, lines):
+        defines = {}
+        modules = {}
+        for line_number, keyword, arguments in lines:
+            if keyword.value() == "DEFINE" and arguments:
+                defines.setdefault(arguments[0].value(), line_number)
+
+            index = DocumentValidator.MODULE_DEFINITIONS.get(keyword.value())
+            if index is not None and index < len(arguments):
+                modules.setdefault(arguments[index].value(), line_number)
+
+        for line_number, keyword, arguments in lines:
+            first_argument = 1 if keyword.value() == "DEFINE" else 0
+            for argument in arguments[first_argument:]:
+                for match in DocumentValidator.DEFINE_REFERENCE_PATTERN.finditer(argument.value()):
+                    defined_on = defines.get(match.group(0))
+                    if defined_on is not None and defined_on > line_number:
+                        message = DocumentValidator.DEFINED_LATER % (match.group(0), defined_on + 1)
+                        from_index = argument.fromIndex() + match.start(0)
+                        yield DocumentProblem(line_number, from_index, from_index + len(match.group(0)), message)
+
+            index = DocumentValidator.MODULE_REFERENCES.get(keyword.value())
+            if index is not None and index < len(arguments):
+                module = arguments[index]
+                defined_on = modules.get(module.value())
+                if defined_on is not None and defined_on > line_number:
+                    message = DocumentValidator.DEFINED_LATER % (module.value(), defined_on + 1)
+                    yield DocumentProblem(line_number, module.fromIndex(), module.toIndex(), message)
@@ -0,0 +1,136 @@
+import fnmatch
+import hashlib
+import json
+import os
+from threading import Lock
+
+from res.enkf import ErtImplType
+
+
+class LoadManifest(object):
+    """
+    Records the key output files of every realization loaded into a case:
+    the summary files and the GEN_DATA result files, with their size,
+    modification time and SHA1 digest. The storage of a case holds one
+    iteration of every realization, so the manifest only keeps the
+    iteration a realization was last loaded from. A realization is
+    unchanged when it was last loaded from the same iteration and its run
+    path has the same key files with the same contents. Files with the same
+    size and modification time are not read again. The manifest is stored as MANIFEST_FILE in the storage
+    directory of the case.
+    """
+    MANIFEST_FILE = ".load_manifest.json"
+    VERSION = 2
+    SUMMARY_PATTERNS = ["*.SMSPEC", "*.UNSMRY", "*.FSMSPEC", "*.FUNSMRY"]
+    BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, directory, patterns=None):
+        super(LoadManifest, self).__init__()
+        self._directory = directory
+        self._patterns = list(patterns) if patterns is not None else list(LoadManifest.SUMMARY_PATTERNS)
+        self._lock = Lock()
+        self._entries = {}
+
+        try:
+            with open(self.path()) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == LoadManifest.VERSION:
+                self._entries = manifest["realizations"]
+        except (IOError, OSError, ValueError, KeyError):
+            self._entries = {}
+
+    @classmethod
+    def forCase(cls, ert, case_name):
+        """
+        The manifest of a case, looking for the summary files and the
+        result files of all GEN_DATA keywords.
+        @rtype: LoadManifest
+        """
+        patterns = list(LoadManifest.SUMMARY_PATTERNS)
+        ensemble_config = ert.ensembleConfig()
+        for key in ensemble_config.getKeylistFromImplType(ErtImplType.GEN_DATA):
+            result_file = ensemble_config.getNode(key).get_enkf_infile()
+            if result_file:
+                patterns.append(result_file.replace("%d", "*"))
+
+        mount_point = ert.getEnkfFsManager().getFileSystem(case_name).getMountPoint()
+        return cls(mount_point, patterns)
+
+    def path(self):
+        """ @rtype: str """
+        return os.path.join(self._directory, LoadManifest.MANIFEST_FILE)
+
+    @staticmethod
+    def _key(iens):
+        return "%d" % iens
+
+    @staticmethod
+    def _digest(filename):
+        sha1 = hashlib.sha1()
+        with open(filename, "rb") as f:
+            for block in iter(lambda: f.read(LoadManifest.BLOCK_SIZE), b""):
+                sha1.update(block)
+        return sha1.hexdigest()
+
+    def keyFiles(self, runpath):
+        """ @rtype: list[str]: the names of the key output files in runpath """
+        try:
+            names = os.listdir(runpath)
+        except OSError:
+            return []
+
+        return sorted(name for name in names
+                      if any(fnmatch.fnmatch(name, pattern) for pattern in self._patterns))
+
+    def isUnchanged(self, iens, iteration, runpath):
+        """ True if runpath has the same key output files as when the realization was recorded. """
+        with self._lock:
+            entry = self._entries.get(self._key(iens))
+
+        if entry is None or entry["iteration"] != iteration or entry["runpath"] != os.path.abspath(runpath):
+            return False
+
+        recorded_files = entry["files"]
+        names = self.keyFiles(runpath)
+        if not names or names != sorted(recorded_files):
+            return False
+
+        for name in names:
+            filename = os.path.join(runpath, name)
+            size, mtime, digest = recorded_files[name]
+            try:
+                stat = os.stat(filename)
+                if stat.st_size != size:
+                    return False
+                if stat.st_mtime != mtime and self._digest(filename) != digest:
+                    return False
+            except (IOError, OSError):
+                return False
+        return True
+
+    def record(self, iens, iteration, runpath):
+        """ Records the key output files of a realization loaded from iteration, replacing any earlier load. """
+        files = {}
+        for name in self.keyFiles(runpath):
+            filename = os.path.join(runpath, name)
+            try:
+                stat = os.stat(filename)
+                files[name] = [stat.st_size, stat.st_mtime, self._digest(filename)]
+            except (IOError, OSError):
+                continue
+
+        with self._lock:
+            self._entries[self._key(iens)] = {"iteration": iteration, "runpath": os.path.abspath(runpath),
+                                              "files": files}
+
+    def forget(self, iens):
+        with self._lock:
+            self._entries.pop(self._key(iens), None)
+
+    def save(self):
+        with self._lock:
+            manifest = {"version": LoadManifest.VERSION, "realizations": self._entries}
+            temporary_path = self.path() + ".tmp"
+            with open(temporary_path, "w") as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.rename(temporary_path, self.path())
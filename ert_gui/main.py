@@ -3,10 +3,17 @@ import os
 import sys
 import re
 from argparse import ArgumentParser, ArgumentTypeError
-from ert_gui import run_cli
+from ert_gui import run_cli, run_export, run_load_results, run_init_case, run_storage
 from ert_gui import ERT
-from ert_gui.ide.keywords.definitions import RangeStringArgument, ProperNameArgument, ProperNameFormatArgument, NumberListStringArgument
+from ert_gui.bulk_export import BulkExporter
+from ert_gui.result_loader import ResultLoader
+from ert_gui.storage_manager import StorageManager
+from ert_gui.profiler import (DEFAULT_PROFILE_DIRECTORY, ENVIRONMENT_VARIABLE as PROFILE_ENVIRONMENT_VARIABLE,
+                              enableProfiling, enableProfilingFromEnvironment)
+from ert_gui.ide.keywords.definitions import RangeStringArgument, ProperNameArgument, ProperNameFormatArgument, NumberListStringArgument, RealizationThresholdArgument
 from ert_gui.simulation.models.multiple_data_assimilation import MultipleDataAssimilation
+from ert_gui.simulation.models.progress_reporter import ProgressReporter
+from ert_gui.simulation.models.slow_realization_detector import SlowRealizationDetector
 
 
 def strip_error_message_and_raise_exception(validated):
@@ -58,6 +65,83 @@ def valid_name_not_default(user_input):
     valid_name(user_input)
     return user_input
 
+def valid_straggler_threshold(user_input):
+    validator = RealizationThresholdArgument()
+    validated = validator.validate(user_input)
+    if validated.failed():
+        strip_error_message_and_raise_exception(validated)
+    return user_input
+
+def non_negative_int(user_input):
+    try:
+        i = int(user_input)
+    except ValueError:
+        raise ArgumentTypeError("Must be a int")
+    if i >= 0:
+        return i
+    raise ArgumentTypeError("Must be a non-negative int")
+
+def add_straggler_arguments(parser):
+    parser.add_argument('--straggler-threshold', type=valid_straggler_threshold, default=None,
+                        help="Once this many realizations have succeeded, either as a number (e.g. 45) or "
+                        "as a percentage of the active realizations (e.g. 90%%), the remaining realizations "
+                        "are stopped after the grace time and the run proceeds. The cut-off never starts "
+                        "before MIN_REALIZATIONS is satisfied.")
+    parser.add_argument('--straggler-grace-time', type=non_negative_int, default=None,
+                        help="Number of seconds the remaining realizations are given to finish once the "
+                        "straggler threshold is reached. Defaults to 60 seconds.")
+
+def add_slow_realization_argument(parser):
+    parser.add_argument('--slow-realization-factor', type=positive_float, default=None, metavar='FACTOR',
+                        help="Flag the realizations running more than FACTOR times longer than they did in the "
+                        "previous iteration, e.g. %g. The flagged realizations are listed in the progress "
+                        "records, see --progress-format." % SlowRealizationDetector.DEFAULT_FACTOR)
+
+def add_trace_argument(parser):
+    parser.add_argument('--trace-file', default=None,
+                        help="Write the time spent in each phase of the run, and in each queue state for every "
+                        "realization, to this file in Chrome Trace Event format.")
+
+def positive_float(user_input):
+    try:
+        f = float(user_input)
+    except ValueError:
+        raise ArgumentTypeError("Must be a number")
+    if f > 0:
+        return f
+    raise ArgumentTypeError("Must be a positive number")
+
+def add_progress_arguments(parser):
+    parser.add_argument('--progress-format', choices=ProgressReporter.FORMATS, default=None,
+                        help="Report the progress of the run in this format. 'jsonl' writes one JSON "
+                        "record per line with the phase, queue state counts and completed realizations.")
+    parser.add_argument('--progress-file', default=None,
+                        help="Write the progress records to this file instead of stderr.")
+    parser.add_argument('--progress-interval', type=positive_float, default=ProgressReporter.DEFAULT_INTERVAL,
+                        help="Number of seconds between progress records. Defaults to %(default)s seconds.")
+
+def add_profile_argument(parser):
+    parser.add_argument('--profile', action='store_true', default=False,
+                        help="Profile the setup, the run phases and the plotting with cProfile and tracemalloc, "
+                        "and write the reports to '%s' at exit. Profiling can also be enabled with the %s "
+                        "environment variable." % (DEFAULT_PROFILE_DIRECTORY, PROFILE_ENVIRONMENT_VARIABLE))
+    parser.add_argument('--profile-dir', default=None, metavar='DIRECTORY',
+                        help="Write the profiling reports to this directory instead. Implies --profile.")
+
+def profile_directory(args):
+    """ @rtype: str or None: the directory for the profiling reports, or None if profiling is not requested """
+    if getattr(args, "profile_dir", None) is not None:
+        return args.profile_dir
+    if getattr(args, "profile", False):
+        return DEFAULT_PROFILE_DIRECTORY
+    return None
+
+def positive_nonzero_int(user_input):
+    i = non_negative_int(user_input)
+    if i > 0:
+        return i
+    raise ArgumentTypeError("Must be a positive int")
+
 def range_limited_int(user_input):
     try:
         i = int(user_input)
@@ -69,6 +153,8 @@ def range_limited_int(user_input):
 
 
 def runGui(args):
+    if profile_directory(args) is not None:
+        os.environ[PROFILE_ENVIRONMENT_VARIABLE] = os.path.abspath(profile_directory(args))
     os.execvp("python", ["python"] +
               ["-m", "ert_gui.gert_main"] + [args.config])
 
@@ -90,6 +176,7 @@ def ert_parser(parser, args):
     # gui_parser
     gui_parser = subparsers.add_parser('gui', help='opens up an independent graphical user interface for '
                                        'the user to interact with ERT.')
+    add_profile_argument(gui_parser)
     gui_parser.set_defaults(func=runGui)
 
     # test_run_parser
@@ -97,6 +184,9 @@ def ert_parser(parser, args):
         'test_run', help="run 'test_run' in cli")
     test_run_parser.add_argument('--verbose', action='store_true',
                                  help="Show verbose output", default=False)
+    add_trace_argument(test_run_parser)
+    add_progress_arguments(test_run_parser)
+    add_profile_argument(test_run_parser)
     test_run_parser.set_defaults(func=run_cli)
 
     # ensemble_experiment_parser
@@ -110,6 +200,10 @@ def ert_parser(parser, args):
                                             "For example, if 'Number of realizations:50 and Active realizations is 0-9', "
                                             "then only realizations 0,1,2,3,...,9 will be used to perform simulations "
                                             "while realizations 10,11, 12,...,49 will be excluded")
+    add_straggler_arguments(ensemble_experiment_parser)
+    add_trace_argument(ensemble_experiment_parser)
+    add_progress_arguments(ensemble_experiment_parser)
+    add_profile_argument(ensemble_experiment_parser)
     ensemble_experiment_parser.set_defaults(func=run_cli)
 
     # ensemble_smoother_parser
@@ -126,6 +220,11 @@ def ert_parser(parser, args):
                                           "For example, if 'Number of realizations:50 and Active realizations is 0-9', "
                                           "then only realizations 0,1,2,3,...,9 will be used to perform simulations "
                                           "while realizations 10,11, 12,...,49 will be excluded")
+    add_straggler_arguments(ensemble_smoother_parser)
+    add_slow_realization_argument(ensemble_smoother_parser)
+    add_trace_argument(ensemble_smoother_parser)
+    add_progress_arguments(ensemble_smoother_parser)
+    add_profile_argument(ensemble_smoother_parser)
     ensemble_smoother_parser.set_defaults(func=run_cli)
 
     # es_mda_parser
@@ -147,14 +246,117 @@ def ert_parser(parser, args):
                                help="Example Custom Relative Weights: '8,4,2,1'. This means Multiple Data "
                                "Assimilation Ensemble Smoother will half the weight applied to the "
                                "Observation Errors from one iteration to the next across 4 iterations.")
+    es_mda_parser.add_argument('--resume', action='store_true', default=False,
+                               help="Continue an interrupted run from the last completed iteration, "
+                               "using the checkpoint stored with the ensemble storage.")
+    add_straggler_arguments(es_mda_parser)
+    add_slow_realization_argument(es_mda_parser)
+    add_trace_argument(es_mda_parser)
+    add_progress_arguments(es_mda_parser)
+    add_profile_argument(es_mda_parser)
     es_mda_parser.set_defaults(func=run_cli)    
 
+    # export_parser
+    export_parser = subparsers.add_parser('export',
+                                          help="export summary, GEN_KW and GEN_DATA values for one or more "
+                                          "cases to Parquet or HDF5 files.")
+    export_parser.add_argument('--verbose', action='store_true',
+                               help="Show verbose output", default=False)
+    export_parser.add_argument('--cases', default=None,
+                               help="Comma separated list of the cases to export. Defaults to the current case.")
+    export_parser.add_argument('--keys', action='append', default=None, metavar='PATTERN',
+                               help="Only export the keys matching this shell style pattern, e.g. 'FOPR*' or "
+                               "'SNAKE_OIL_PARAM:*'. Can be given several times. Defaults to all keys.")
+    export_parser.add_argument('--data-type', dest='data_types', action='append', default=None,
+                               choices=BulkExporter.DATA_TYPES,
+                               help="Only export this type of data. Can be given several times. "
+                               "Defaults to all types.")
+    export_parser.add_argument('--format', choices=sorted(BulkExporter.FORMATS), default='parquet',
+                               help="File format of the export. Defaults to %(default)s.")
+    export_parser.add_argument('--output-dir', default='export',
+                               help="Directory to write the files to, one subdirectory per case and data type. "
+                               "Defaults to '%(default)s'.")
+    export_parser.add_argument('--chunk-size', type=positive_nonzero_int, default=BulkExporter.DEFAULT_CHUNK_SIZE,
+                               help="Number of keys per file. Only one chunk per worker is kept in memory. "
+                               "Defaults to %(default)s.")
+    export_parser.add_argument('--workers', type=positive_nonzero_int, default=1,
+                               help="Number of processes loading and writing chunks in parallel. Defaults to 1.")
+    add_profile_argument(export_parser)
+    export_parser.set_defaults(func=run_export)
+
+    # load_results_parser
+    load_results_parser = subparsers.add_parser('load_results',
+                                                help="load the results of the forward model from the run path "
+                                                "into a case.")
+    load_results_parser.add_argument('--verbose', action='store_true',
+                                     help="Show the load status of every realization", default=False)
+    load_results_parser.add_argument('--case', default=None,
+                                     help="Name of the case to load the results into. Defaults to the current case.")
+    load_results_parser.add_argument('--realizations', type=valid_realizations,
+                                     help="The realizations to load, e.g. '0-9,15'. Defaults to all realizations.")
+    load_results_parser.add_argument('--iteration', type=int, default=0,
+                                     help="The iteration to load from the run path. Defaults to %(default)s.")
+    load_results_parser.add_argument('--workers', type=positive_nonzero_int, default=ResultLoader.DEFAULT_WORKERS,
+                                     help="Number of threads checking and recording the output files of the "
+                                     "realizations. The results are loaded into the case one chunk at a time. "
+                                     "Defaults to %(default)s.")
+    load_results_parser.add_argument('--skip-unchanged', action='store_true', default=False,
+                                     help="Skip the realizations which already have data in the case and whose "
+                                     "summary and GEN_DATA files are unchanged since they were loaded.")
+    add_profile_argument(load_results_parser)
+    load_results_parser.set_defaults(func=run_load_results)
+
+    # init_case_parser
+    init_case_parser = subparsers.add_parser('init_case',
+                                             help="initialize the parameters of a case from scratch or from "
+                                             "another case.")
+    init_case_parser.add_argument('--verbose', action='store_true',
+                                  help="Show verbose output", default=False)
+    init_case_parser.add_argument('--case', default=None,
+                                  help="Name of the case to initialize. It is created if it does not exist. "
+                                  "Defaults to the current case.")
+    init_case_parser.add_argument('--source-case', default=None,
+                                  help="Initialize from this case instead of sampling from scratch.")
+    init_case_parser.add_argument('--report-step', type=int, default=0,
+                                  help="Report step of the source case to initialize from. Defaults to %(default)s.")
+    init_case_parser.add_argument('--parameters', default=None,
+                                  help="Comma separated list of the parameters to initialize. "
+                                  "Defaults to all parameters.")
+    init_case_parser.add_argument('--realizations', type=valid_realizations,
+                                  help="The realizations to initialize, e.g. '0-9,15'. Defaults to all realizations.")
+    add_profile_argument(init_case_parser)
+    init_case_parser.set_defaults(func=run_init_case)
+
+    # storage_parser
+    storage_parser = subparsers.add_parser('storage',
+                                           help="report the disk usage of the cases in storage, or delete or "
+                                           "archive cases.")
+    storage_parser.add_argument('--verbose', action='store_true',
+                                help="Show verbose output", default=False)
+    storage_parser.add_argument('--delete', action='append', default=None, metavar='CASE',
+                                help="Delete this case from storage. Can be given several times. Running cases, "
+                                "the current case and cases in use are never removed.")
+    storage_parser.add_argument('--archive', action='append', default=None, metavar='CASE',
+                                help="Pack this case into a .tar.gz archive and delete it from storage. "
+                                "Can be given several times.")
+    storage_parser.add_argument('--archive-dir', default=None,
+                                help="Directory to write the archives to. Defaults to the storage directory.")
+    storage_parser.add_argument('--workers', type=positive_nonzero_int, default=StorageManager.DEFAULT_WORKERS,
+                                help="Number of cases scanned in parallel. Defaults to %(default)s.")
+    add_profile_argument(storage_parser)
+    storage_parser.set_defaults(func=run_storage)
+
     return parser.parse_args(args)
 
 
 def main():
     parser = ArgumentParser(description="ERT - Ensemble Reservoir Tool")
     args = ert_parser(parser, sys.argv[1:])
+    if args.func in (run_cli, run_export, run_load_results, run_init_case, run_storage):
+        if profile_directory(args) is not None:
+            enableProfiling(profile_directory(args))
+        else:
+            enableProfilingFromEnvironment()
     args.func(args)
 
 
@@ -1,3 +1,6 @@
+import ert_gui
+ert_gui.configureMatplotlib()
+
 # At least for some combinations of pandas and matplotlib the numpy.datetime64
 # dates coming from pandas are not correctly recognized/converted by matplotlib.
 # Calling this converter.register() method seems to fix the problem.
@@ -2,6 +2,8 @@ from pandas import DataFrame
 from res.enkf.export import GenKwCollector, SummaryCollector, GenDataCollector, SummaryObservationCollector, \
     GenDataObservationCollector, CustomKWCollector
 
+from ert_gui.profiler import profiledRegion
+
 
 class PlotDataGatherer(object):
 
@@ -35,7 +37,8 @@ class PlotDataGatherer(object):
         if not self.canGatherDataForKey(key):
             raise UserWarning("Unable to gather data for key: %s" % key)
 
-        return self._dataGatherFunction(ert, case, key)
+        with profiledRegion("plot gather"):
+            return self._dataGatherFunction(ert, case, key)
 
     def gatherRefcaseData(self, ert, key):
         """ :rtype: pandas.DataFrame """
@@ -0,0 +1,172 @@
+import atexit
+import cProfile
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+class _Region(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.profile = cProfile.Profile()
+        self.calls = 0
+        self.wall_time = 0.0
+        self.allocation_reports = []
+
+
+class Profiler(object):
+    """
+    Profiles named regions of the program with cProfile, and with
+    tracemalloc where available. Nested regions suspend the profiling of
+    the enclosing region, so the statistics of a region exclude the time
+    spent in the regions inside it. Each region gets a pstats file and a
+    report of the largest allocations when save() is called.
+    """
+    TOP_ALLOCATIONS = 25
+
+    def __init__(self, directory):
+        super(Profiler, self).__init__()
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._regions = {}
+        self._local = threading.local()
+
+        if tracemalloc is not None and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def directory(self):
+        """ @rtype: str """
+        return self._directory
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _getRegion(self, name):
+        with self._lock:
+            if name not in self._regions:
+                self._regions[name] = _Region(name)
+            return self._regions[name]
+
+    @staticmethod
+    def _enable(region):
+        try:
+            region.profile.enable()
+            return True
+        except ValueError:
+            # Another profiler is active, e.g. in another thread on Python versions with one global profiler.
+            return False
+
+    @contextmanager
+    def region(self, name):
+        region = self._getRegion(name)
+        stack = self._stack()
+
+        if stack:
+            stack[-1].profile.disable()
+
+        profiling = self._enable(region)
+        stack.append(region)
+        snapshot = tracemalloc.take_snapshot() if tracemalloc is not None else None
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            if profiling:
+                region.profile.disable()
+            stack.pop()
+
+            with self._lock:
+                region.calls += 1
+                region.wall_time += time.time() - start_time
+                if snapshot is not None:
+                    ignore_tracemalloc = (tracemalloc.Filter(False, tracemalloc.__file__),)
+                    statistics = tracemalloc.take_snapshot().filter_traces(ignore_tracemalloc).compare_to(snapshot, "lineno")
+                    region.allocation_reports.append(statistics[:Profiler.TOP_ALLOCATIONS])
+
+            if stack:
+                self._enable(stack[-1])
+
+    @staticmethod
+    def _fileName(name):
+        return "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+
+    def save(self):
+        if not os.path.isdir(self._directory):
+            os.makedirs(self._directory)
+
+        with self._lock:
+            regions = sorted(self._regions.values(), key=lambda region: region.name)
+
+            summary_lines = ["%-40s %8s %12s" % ("Region", "Calls", "Wall time")]
+            for region in regions:
+                summary_lines.append("%-40s %8d %11.3fs" % (region.name, region.calls, region.wall_time))
+                base_name = os.path.join(self._directory, Profiler._fileName(region.name))
+
+                region.profile.dump_stats(base_name + ".pstats")
+                with open(base_name + ".txt", "w") as f:
+                    stats = pstats.Stats(base_name + ".pstats", stream=f)
+                    stats.sort_stats("cumulative").print_stats(50)
+
+                if region.allocation_reports:
+                    with open(base_name + ".allocations.txt", "w") as f:
+                        for index, report in enumerate(region.allocation_reports):
+                            f.write("Call %d\n" % (index + 1))
+                            for statistic in report:
+                                f.write("  %s\n" % statistic)
+
+        with open(os.path.join(self._directory, "regions.txt"), "w") as f:
+            f.write("\n".join(summary_lines) + "\n")
+
+        print("Profiling reports written to %s" % self._directory)
+
+
+_profiler = None
+
+DEFAULT_PROFILE_DIRECTORY = "ert_profile"
+ENVIRONMENT_VARIABLE = "ERT_PROFILE"
+
+
+def enableProfiling(directory=DEFAULT_PROFILE_DIRECTORY):
+    """ Starts profiling the named regions, the reports are written at exit. """
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler(os.path.abspath(directory))
+        atexit.register(_profiler.save)
+    return _profiler
+
+
+def enableProfilingFromEnvironment():
+    """
+    Enables profiling if ERT_PROFILE is set, its value is the report
+    directory, or 1 for the default directory.
+    """
+    value = os.getenv(ENVIRONMENT_VARIABLE)
+    if not value or value == "0":
+        return None
+    if value == "1":
+        value = DEFAULT_PROFILE_DIRECTORY
+    return enableProfiling(value)
+
+
+def getProfiler():
+    """ @rtype: Profiler or None """
+    return _profiler
+
+
+@contextmanager
+def profiledRegion(name):
+    if _profiler is None:
+        yield
+    else:
+        with _profiler.region(name):
+            yield
@@ -0,0 +1,176 @@
+from collections import OrderedDict
+from threading import Lock
+
+from ecl.util.util import BoolVector
+from res.enkf import RealizationStateEnum
+from ert_gui.task_pool import runTasks
+
+
+class LoadProgress(object):
+    """
+    The load status of every realization of a running load, and a flag
+    which stops the workers when set by cancel(). The optional listener is
+    called with the realization and its new status, from the worker
+    threads.
+    """
+    PENDING = "Pending"
+    LOADING = "Loading"
+    LOADED = "Loaded"
+    FAILED = "Failed"
+    MISSING = "Missing"
+    UNCHANGED = "Unchanged"
+    STATUSES = [PENDING, LOADING, LOADED, FAILED, MISSING, UNCHANGED]
+
+    def __init__(self, listener=None):
+        super(LoadProgress, self).__init__()
+        self._lock = Lock()
+        self._listener = listener
+        self._statuses = OrderedDict()
+        self._cancelled = False
+
+    def start(self, realizations):
+        with self._lock:
+            self._statuses = OrderedDict((iens, LoadProgress.PENDING) for iens in realizations)
+
+    def setStatus(self, iens, status):
+        with self._lock:
+            self._statuses[iens] = status
+        if self._listener is not None:
+            self._listener(iens, status)
+
+    def statuses(self):
+        """ @rtype: dict[int, str] """
+        with self._lock:
+            return OrderedDict(self._statuses)
+
+    def count(self, status):
+        """ @rtype: int """
+        with self._lock:
+            return sum(1 for value in self._statuses.values() if value == status)
+
+    def total(self):
+        """ @rtype: int """
+        return len(self._statuses)
+
+    def finished(self):
+        """ @rtype: int: the number of realizations which are done """
+        return self.total() - self.count(LoadProgress.PENDING) - self.count(LoadProgress.LOADING)
+
+    def cancel(self):
+        self._cancelled = True
+
+    def isCancelled(self):
+        return self._cancelled
+
+
+class ResultLoader(object):
+    """
+    Loads forward model results into a case, chunk_size realizations per
+    call to EnKFMain.loadFromForwardModel, which loads the realizations of
+    a chunk in parallel. The storage is not thread safe, so the chunks are
+    loaded one after the other; the worker threads only overlap the
+    checking and recording of the output files with the loading. The
+    status of every realization of a chunk is taken from the state map of
+    the case when not all of them were loaded. With a runpath index the
+    realizations without a run path are marked as missing instead of being
+    loaded.
+
+    With a runpath index and a load manifest the key output files of every
+    loaded realization are recorded, and skip_unchanged skips the
+    realizations which have data in the case and unchanged output files.
+    """
+    DEFAULT_WORKERS = 4
+    DEFAULT_CHUNK_SIZE = 20
+
+    def __init__(self, ert, workers=DEFAULT_WORKERS, runpath_index=None, manifest=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        @type runpath_index: ert_gui.runpath_index.RunpathIndex
+        @type manifest: ert_gui.load_manifest.LoadManifest
+        """
+        super(ResultLoader, self).__init__()
+        self._ert = ert
+        self._workers = max(1, workers)
+        self._runpath_index = runpath_index
+        self._manifest = manifest if runpath_index is not None else None
+        self._chunk_size = max(1, chunk_size)
+        self._storage_lock = Lock()
+
+    def load(self, case_name, realizations, iteration, progress=None, skip_unchanged=False):
+        """
+        @type case_name: str
+        @type realizations: list[int]
+        @type iteration: int
+        @type progress: LoadProgress
+        @type skip_unchanged: bool
+        @rtype: int: the number of loaded realizations
+        """
+        progress = progress or LoadProgress()
+        progress.start(realizations)
+
+        fs_manager = self._ert.getEnkfFsManager()
+        fs = fs_manager.getFileSystem(case_name)
+        ensemble_size = self._ert.getEnsembleSize()
+        manifest = self._manifest
+
+        has_data = set()
+        if manifest is not None and skip_unchanged:
+            has_data = set(iens for iens, state in enumerate(fs_manager.getStateMapForCase(case_name))
+                           if state == RealizationStateEnum.STATE_HAS_DATA)
+
+        members = []
+        for iens in realizations:
+            if self._runpath_index is None or self._runpath_index.exists(iens, iteration):
+                members.append(iens)
+            else:
+                progress.setStatus(iens, LoadProgress.MISSING)
+
+        chunks = [members[start:start + self._chunk_size] for start in range(0, len(members), self._chunk_size)]
+
+        def loadChunk(state, chunk):
+            runpaths = {}
+            to_load = []
+            for iens in chunk:
+                runpaths[iens] = self._runpath_index.runpath(iens, iteration) if manifest is not None else None
+                if iens in has_data and manifest.isUnchanged(iens, iteration, runpaths[iens]):
+                    progress.setStatus(iens, LoadProgress.UNCHANGED)
+                else:
+                    to_load.append(iens)
+
+            if not to_load:
+                return 0
+
+            mask = BoolVector(default_value=False, initial_size=ensemble_size)
+            for iens in to_load:
+                mask[iens] = True
+                progress.setStatus(iens, LoadProgress.LOADING)
+
+            with self._storage_lock:
+                try:
+                    loaded = self._ert.loadFromForwardModel(mask, iteration, fs)
+                except Exception:
+                    for iens in to_load:
+                        progress.setStatus(iens, LoadProgress.FAILED)
+                    raise
+
+                if loaded == len(to_load):
+                    loaded_members = set(to_load)
+                else:
+                    state_map = fs_manager.getStateMapForCase(case_name)
+                    loaded_members = set(iens for iens in to_load
+                                         if state_map[iens] == RealizationStateEnum.STATE_HAS_DATA)
+
+            for iens in to_load:
+                if manifest is not None:
+                    if iens in loaded_members:
+                        manifest.record(iens, iteration, runpaths[iens])
+                    else:
+                        manifest.forget(iens)
+                progress.setStatus(iens, LoadProgress.LOADED if iens in loaded_members else LoadProgress.FAILED)
+            return len(loaded_members)
+
+        try:
+            return runTasks(chunks, loadChunk, progress, self._workers, "ert_gui_load_worker")
+        finally:
+            if manifest is not None:
+                manifest.save()
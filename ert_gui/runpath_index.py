@@ -0,0 +1,224 @@
+import os
+import re
+from threading import Lock
+
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+
+
+class RunpathIndex(object):
+    """
+    Finds the run paths which exist on disk for the runpath format of the
+    configuration, e.g. "simulations/realization-%d/iter-%d". The first %d
+    is the realization and the second the iteration. Without a second %d
+    every iteration runs in the same run path, so the iteration is
+    ignored when looking up a run path. Unresolved <KEY> substitutions
+    match any name.
+
+    The directories are listed once per scan instead of probing every
+    formatted run path. The listings are cached with the modification
+    time of the directory, so refresh() only lists the directories which
+    changed since the previous scan. The state of a run path is taken from
+    the OK and ERROR marker files written by the forward model.
+    """
+    MISSING = "Missing"
+    PRESENT = "Present"
+    OK = "OK"
+    ERROR = "Error"
+
+    OK_FILE = "OK"
+    ERROR_FILE = "ERROR"
+
+    def __init__(self, runpath_format):
+        super(RunpathIndex, self).__init__()
+        self._runpath_format = runpath_format
+        self._components = self._parseFormat(runpath_format)
+        self._has_iteration = runpath_format.count("%d") > 1
+        self._listings = {}
+        self._runpaths = {}
+        self._states = {}
+        self._refresh_lock = Lock()
+        self.refresh()
+
+    @staticmethod
+    def runpathFormat(ert, case_name):
+        """ @rtype: str: the runpath format of the configuration for the case """
+        runpath_format = ert.getModelConfig().getRunpathAsString()
+        return runpath_format.replace("<ERTCASE>", case_name).replace("<ERT-CASE>", case_name)
+
+    @classmethod
+    def fromErt(cls, ert, case_name):
+        """ @rtype: RunpathIndex """
+        return cls(RunpathIndex.runpathFormat(ert, case_name))
+
+    @staticmethod
+    def _parseFormat(runpath_format):
+        """
+        Splits the format into path components. A component with
+        placeholders becomes a regular expression with one group for every
+        %d, the other components stay plain names.
+        """
+        components = []
+        for component in os.path.normpath(runpath_format).split(os.sep):
+            if "%d" not in component and not re.search("<[^>]*>", component):
+                components.append(component)
+                continue
+
+            pattern = ""
+            for part in re.split("(%d|<[^>]*>)", component):
+                if part == "%d":
+                    pattern += "([0-9]+)"
+                elif part.startswith("<") and part.endswith(">"):
+                    pattern += ".*?"
+                else:
+                    pattern += re.escape(part)
+            components.append(re.compile(pattern + "$"))
+        return components
+
+    def _listDirectory(self, path, listed):
+        """
+        The names of the entries of the directory path, and whether they
+        are directories, from the cache if the directory is unchanged.
+        @rtype: dict[str, bool] or None
+        """
+        listed.add(path)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            self._listings.pop(path, None)
+            return None
+
+        cached = self._listings.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            if scandir is not None:
+                entries = dict((entry.name, entry.is_dir()) for entry in scandir(path))
+            else:
+                entries = dict((name, os.path.isdir(os.path.join(path, name))) for name in os.listdir(path))
+        except OSError:
+            self._listings.pop(path, None)
+            return None
+
+        self._listings[path] = (mtime, entries)
+        return entries
+
+    def refresh(self):
+        """ Rescans the run paths, listing only the directories which changed. """
+        with self._refresh_lock:
+            return self._refresh()
+
+    def _refresh(self):
+        start = os.sep if os.path.isabs(self._runpath_format) else os.curdir
+        candidates = [(start, ())]
+        listed = set()
+        for component in self._components:
+            if component == "":
+                continue
+
+            next_candidates = []
+            for path, numbers in candidates:
+                if not hasattr(component, "match"):
+                    next_candidates.append((os.path.join(path, component), numbers))
+                    continue
+
+                entries = self._listDirectory(path, listed) or {}
+                for name, is_dir in entries.items():
+                    match = component.match(name)
+                    if match and is_dir:
+                        numbers_in_name = tuple(int(number) for number in match.groups())
+                        next_candidates.append((os.path.join(path, name), numbers + numbers_in_name))
+            candidates = next_candidates
+
+        runpaths = {}
+        states = {}
+        for path, numbers in candidates:
+            entries = self._listDirectory(path, listed)
+            if entries is None or not numbers:
+                continue
+
+            key = (numbers[0], numbers[1] if len(numbers) > 1 else 0)
+            runpaths[key] = os.path.normpath(path)
+            if RunpathIndex.ERROR_FILE in entries:
+                states[key] = RunpathIndex.ERROR
+            elif RunpathIndex.OK_FILE in entries:
+                states[key] = RunpathIndex.OK
+            else:
+                states[key] = RunpathIndex.PRESENT
+
+        # Forget the directories which are no longer part of any run path.
+        self._listings = dict((path, self._listings[path]) for path in listed if path in self._listings)
+        self._runpaths = runpaths
+        self._states = states
+        return self
+
+    def _key(self, iens, iteration):
+        return iens, iteration if self._has_iteration else 0
+
+    def runpath(self, iens, iteration=0):
+        """ @rtype: str or None """
+        return self._runpaths.get(self._key(iens, iteration))
+
+    def state(self, iens, iteration=0):
+        """ @rtype: str: one of MISSING, PRESENT, OK and ERROR """
+        return self._states.get(self._key(iens, iteration), RunpathIndex.MISSING)
+
+    def exists(self, iens, iteration=0):
+        return self._key(iens, iteration) in self._runpaths
+
+    def iterations(self):
+        """ @rtype: list[int] """
+        return sorted(set(iteration for _, iteration in self._runpaths))
+
+    def realizations(self, iteration=0):
+        """ @rtype: list[int] """
+        _, iteration = self._key(0, iteration)
+        return sorted(iens for iens, it in self._runpaths if it == iteration)
+
+    def matrix(self, ensemble_size, iteration_count=None):
+        """
+        The state of every realization in every iteration, one row per
+        realization.
+        @rtype: list[list[str]]
+        """
+        if iteration_count is None:
+            iterations = self.iterations()
+            iteration_count = iterations[-1] + 1 if iterations else 0
+
+        return [[self.state(iens, iteration) for iteration in range(iteration_count)]
+                for iens in range(ensemble_size)]
+
+
+class RunpathIndexCache(object):
+    """
+    Keeps one RunpathIndex per runpath format, so that the directory
+    listings cached by an index are reused. index() refreshes the index
+    it already has, which only lists the directories that changed since
+    the previous call. The ERT adapter clears the cache when a new
+    EnKFMain is adapted.
+    """
+
+    def __init__(self):
+        super(RunpathIndexCache, self).__init__()
+        self._lock = Lock()
+        self._indexes = {}
+
+    def clear(self):
+        with self._lock:
+            self._indexes = {}
+
+    def index(self, ert, case_name):
+        """ @rtype: RunpathIndex """
+        runpath_format = RunpathIndex.runpathFormat(ert, case_name)
+        # A relative runpath is listed from the working directory
+        key = (os.getcwd(), runpath_format)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = RunpathIndex(runpath_format)
+                self._indexes[key] = index
+                return index
+        return index.refresh()
@@ -1,7 +1,7 @@
 import math
 import time
 try:
-  from PyQt4.QtCore import QTimer, pyqtSignal, QVariant, Qt, QAbstractTableModel
+  from PyQt4.QtCore import QTimer, pyqtSignal, QVariant, Qt, QAbstractTableModel, QRect, QRectF
   from PyQt4.QtGui import (QWidget,
                            QPainter,
                            QColor,
@@ -13,11 +13,13 @@ try:
                            QLabel,
                            QPen,
                            QPushButton,
-                           QTextEdit,
-                           QTabWidget)
+                           QPlainTextEdit,
+                           QTextCursor,
+                           QTabWidget,
+                           qRgba)
 
 except ImportError:
-  from PyQt5.QtCore import QTimer, pyqtSignal, QVariant, Qt, QAbstractTableModel
+  from PyQt5.QtCore import QTimer, pyqtSignal, QVariant, Qt, QAbstractTableModel, QRect, QRectF
   from PyQt5.QtWidgets import (QWidget,
                                QFrame,
                                QDialog,
@@ -25,128 +27,223 @@ except ImportError:
                                QLabel,
                                QGridLayout,
                                QPushButton,
-                               QTextEdit,
+                               QPlainTextEdit,
                                QTabWidget)
-  from PyQt5.QtGui import QPainter, QColor, QImage, QPen
+  from PyQt5.QtGui import QPainter, QColor, QImage, QPen, QTextCursor, qRgba
+
+from ert_gui.simulation.file_tail import FileTail
+from ert_gui.simulation.models.slow_realization_detector import jobTimestamp
+from ert_gui.simulation.progress_grid import ProgressGrid
 
-from res.job_queue import JobStatusType
 
 class DetailedProgress(QFrame):
     clicked = pyqtSignal(int)
 
+    # Cells smaller than this are drawn without borders, text is drawn only when it fits.
+    MIN_BORDER_CELL_SIZE = 8
+    BORDER_THICKNESS = 4
+
     def __init__(self, state_colors, parent):
         super(DetailedProgress, self).__init__(parent)
         self.setLineWidth(1)
 
         self.state_colors = state_colors
         self._current_iteration = 0
-        self._current_progress = []
+        self._grid = ProgressGrid()
+        self._color_table = [qRgba(*color) for color in ProgressGrid.colorTable(state_colors)]
+        self._image = None
+        self._image_data = None
+        self._image_key = None
         self.selected_realization = -1
         self.grid_height = -1
         self.grid_width = -1
+        self.sub_grid_size = -1
 
     def mousePressEvent(self, event):
         super(DetailedProgress, self).mousePressEvent(event)
+        if self.grid_width <= 0:
+            return
+
         position = event.pos()
 
         x = int((float(position.x()) / self.width()) * self.grid_width)
         y = int((float(position.y()) / self.height()) * self.grid_height)
         index = y * self.grid_width + x
 
+        previous_selection = self.selected_realization
         self.selected_realization = index
         self.clicked.emit(index)
-        self.update()
-
-    def draw_window(self, x, y, progress, render_image):
-        nr_jobs = len(progress)
-        grid_size = int(math.ceil(math.sqrt(nr_jobs)))
-
-        for index, job in enumerate(progress):
-            y_off = index / grid_size
-            x_off = index - (y_off * grid_size)
-            color = QColor(*self.state_colors[job.status])
-            render_image.setPixel(x + x_off, y + y_off, color.rgb())
+        self.update(self.cellRect(previous_selection))
+        self.update(self.cellRect(index))
+
+    def _updateLayout(self):
+        """ @rtype: bool: True if the layout changed """
+        aspect_ratio = float(self.width()) / max(self.height(), 1)
+        layout = self._grid.layout(aspect_ratio)
+        changed = layout != (self.grid_width, self.grid_height, self.sub_grid_size)
+        self.grid_width, self.grid_height, self.sub_grid_size = layout
+        return changed
+
+    def cellSize(self):
+        """ @rtype: (float, float) """
+        return float(self.width()) / self.grid_width, float(self.height()) / self.grid_height
+
+    def cellRect(self, iens):
+        if iens < 0 or self.grid_width <= 0:
+            return QRect()
+
+        cell_width, cell_height = self.cellSize()
+        y = iens // self.grid_width
+        x = iens - (y * self.grid_width)
+        return QRect(int(x * cell_width), int(y * cell_height), int(math.ceil(cell_width)) + 1, int(math.ceil(cell_height)) + 1)
 
     def set_progress(self, progress, iteration):
         self.setMinimumHeight(200)
-        self._current_progress = sorted([(iens, jobs, status) for iens, (jobs, status) in progress.items()],
-                                        key = lambda x: x[0])
         self._current_iteration = iteration
-        self.update()
-
-    def has_realization_failed(self, progress):
-        for job in progress:
-            if job.status == 'Failure':
-                return True
+        changed = self._grid.update(progress)
+        if not changed:
+            return
 
-        return False
+        if self._updateLayout() or len(changed) > self.grid_width:
+            self.update()
+        else:
+            for iens in changed:
+                self.update(self.cellRect(iens))
+
+    def _foregroundImage(self):
+        key = (self._grid.version(), self.grid_width, self.grid_height, self.sub_grid_size)
+        if key != self._image_key:
+            pixels = self._grid.pixels(self.grid_width, self.grid_height, self.sub_grid_size)
+            height, width = pixels.shape
+            # The image does not copy the buffer, so it must be kept alive as long as the image is.
+            self._image_data = pixels.tobytes()
+            self._image = QImage(self._image_data, width, height, width, QImage.Format_Indexed8)
+            self._image.setColorTable(self._color_table)
+            self._image_key = key
+        return self._image
+
+    def _borderColor(self, iens):
+        if iens == self.selected_realization:
+            return QColor(240, 240, 240)
+
+        state = self._grid.realizationState(iens)
+        if state == ProgressGrid.REALIZATION_FAILED:
+            return QColor(*self.state_colors['Failure'])
+        elif state == ProgressGrid.REALIZATION_RUNNING:
+            return QColor(*self.state_colors['Running'])
+        return QColor(80, 80, 80)
 
     def paintEvent(self, event):
         super(DetailedProgress, self).paintEvent(event)
-        if not self._current_progress:
+        if self._grid.realizationCount() == 0:
             return
 
+        self._updateLayout()
+        image = self._foregroundImage()
+        dirty_rect = event.rect()
+
         painter = QPainter(self)
-        width = self.width()
-        height = self.height()
-        aspect_ratio = float(width)/height
-        nr_realizations = max([iens for iens, _ , _ in self._current_progress]) + 1
-        fm_size = max([len(progress) for _ , progress, _  in self._current_progress])
-        self.grid_height = math.ceil(math.sqrt(nr_realizations / aspect_ratio))
-        self.grid_width = math.ceil(self.grid_height * aspect_ratio)
-        sub_grid_size = math.ceil(math.sqrt(fm_size))
-        cell_height = height / self.grid_height
-        cell_width = width / self.grid_width
-
-        foreground_image = QImage(self.grid_width*sub_grid_size, self.grid_height*sub_grid_size, QImage.Format_ARGB32)
-        foreground_image.fill(QColor(0, 0, 0, 0))
-
-        for index, (iens, progress, _) in enumerate(self._current_progress):
-            y = int(iens / self.grid_width)
-            x = int(iens - (y * self.grid_width))
-            self.draw_window(x * sub_grid_size, y * sub_grid_size, progress, foreground_image)
-        painter.drawImage(self.contentsRect(), foreground_image)
-
-        for index, (iens, progress, state) in enumerate(self._current_progress):
-            y = int(iens / self.grid_width)
-            x = int(iens - (y * self.grid_width))
-
-            painter.setPen(QColor(80, 80, 80))
-            painter.drawText(x * cell_width, y * cell_height, cell_width, cell_height, Qt.AlignHCenter | Qt.AlignVCenter, str(iens))
-
-            if iens == self.selected_realization:
-                pen = QPen(QColor(240, 240, 240))
-            elif(self.has_realization_failed(progress)):
-                pen = QPen(QColor(*self.state_colors['Failure']))
-            elif(state == JobStatusType.JOB_QUEUE_RUNNING):
-                pen = QPen(QColor(*self.state_colors['Running']))
-            else:
-                pen = QPen(QColor(80, 80, 80))
-
-            thickness = 4
-            pen.setWidth(thickness)
-            painter.setPen(pen)
-            painter.drawRect((x * cell_width)+(thickness / 2),
-                             (y * cell_height) + (thickness / 2),
-                             cell_width - (thickness - 1),
-                             cell_height - (thickness - 1))
+        x_scale = float(image.width()) / self.width()
+        y_scale = float(image.height()) / self.height()
+        source_rect = QRectF(dirty_rect.x() * x_scale, dirty_rect.y() * y_scale,
+                             dirty_rect.width() * x_scale, dirty_rect.height() * y_scale)
+        painter.drawImage(QRectF(dirty_rect), image, source_rect)
+
+        cell_width, cell_height = self.cellSize()
+        metrics = painter.fontMetrics()
+        label_width = metrics.width(str(self._grid.realizationCount() - 1))
+        draw_text = cell_width > label_width + 2 * self.BORDER_THICKNESS and cell_height > metrics.height()
+        draw_borders = min(cell_width, cell_height) >= self.MIN_BORDER_CELL_SIZE
+
+        first_column = max(int(dirty_rect.left() / cell_width), 0)
+        last_column = min(int(dirty_rect.right() / cell_width), self.grid_width - 1)
+        first_row = max(int(dirty_rect.top() / cell_height), 0)
+        last_row = min(int(dirty_rect.bottom() / cell_height), self.grid_height - 1)
+
+        for y in range(first_row, last_row + 1):
+            for x in range(first_column, last_column + 1):
+                iens = y * self.grid_width + x
+                if self._grid.realizationState(iens) == ProgressGrid.REALIZATION_MISSING:
+                    continue
+
+                if draw_text:
+                    painter.setPen(QColor(80, 80, 80))
+                    painter.drawText(QRectF(x * cell_width, y * cell_height, cell_width, cell_height),
+                                     Qt.AlignHCenter | Qt.AlignVCenter, str(iens))
+
+                if draw_borders or iens == self.selected_realization:
+                    thickness = self.BORDER_THICKNESS if draw_borders else 1
+                    pen = QPen(self._borderColor(iens))
+                    pen.setWidth(thickness)
+                    painter.setPen(pen)
+                    painter.drawRect(QRectF((x * cell_width) + (thickness / 2.0),
+                                            (y * cell_height) + (thickness / 2.0),
+                                            cell_width - (thickness - 1),
+                                            cell_height - (thickness - 1)))
 
 
 class SingleProgressModel(QAbstractTableModel):
+    FILE_COLUMNS = ('stdout', 'stderr')
+
     def __init__(self, parent_view, state_colors):
         super(SingleProgressModel, self).__init__(parent_view)
         self.model_data = []
         self.model_header = []
         self.state_colors = state_colors
+        self._display_data = []
+        self._status_column = -1
+        self._background_colors = {}
+
+    def format_value(self, column, value, status):
+        """ Converts a job record value to the text shown in the table. """
+        if column.find("time") >= 0:
+            if status == "Pending" or status == "Waiting" or value is None:
+                return ""
+            return time.ctime(jobTimestamp(value))
+
+        if column in self.FILE_COLUMNS:
+            return "OPEN"
+
+        return str(value)
+
+    def format_row(self, row):
+        status = row[self._status_column] if self._status_column >= 0 else None
+        return [self.format_value(column, value, status) for column, value in zip(self.model_header, row)]
 
     def update_data(self, header, data):
-        self.model_data = data
-        self.model_header = header
+        """
+        Updates the model with job records, emitting dataChanged only for the
+        cells which differ from the current records. Returns True if the
+        model had to be reset because the columns or number of jobs changed.
+        @rtype: bool
+        """
+        if header != self.model_header or len(data) != len(self.model_data):
+            self.beginResetModel()
+            self.model_header = list(header)
+            self._status_column = self.model_header.index("status") if "status" in self.model_header else -1
+            self.model_data = [list(row) for row in data]
+            self._display_data = [self.format_row(row) for row in self.model_data]
+            self.endResetModel()
+            return True
+
+        for row_index, row in enumerate(data):
+            current_row = self.model_data[row_index]
+            changed_columns = [column for column, value in enumerate(row) if value != current_row[column]]
+            if not changed_columns:
+                continue
+
+            self.model_data[row_index] = list(row)
+            self._display_data[row_index] = self.format_row(self.model_data[row_index])
+            # The status decides the background colour and whether times are shown, so it repaints the whole row.
+            if self._status_column in changed_columns:
+                changed_columns = [0, len(row) - 1]
+            self.dataChanged.emit(self.index(row_index, min(changed_columns)),
+                                  self.index(row_index, max(changed_columns)))
+
+        return False
 
     def columnCount(self, parent=None):
-        if not self.model_data:
-            return 0
-        return len(self.model_data[0])
+        return len(self.model_header)
 
     def rowCount(self, parent=None):
         return len(self.model_data)
@@ -161,38 +258,31 @@ class SingleProgressModel(QAbstractTableModel):
 
     def get_file_name(self, index):
         col = self.get_column_name(index.column())
-        if col == 'stdout' or col == 'stderr':
-            return self.model_data[index.row()][index.column()] + "." + str(index.row())
+        if col in self.FILE_COLUMNS:
+            return str(self.model_data[index.row()][index.column()]) + "." + str(index.row())
         return ''
 
+    def _background_color(self, status):
+        if status not in self._background_colors:
+            color = QColor(*self.state_colors[status])
+            color.setAlpha(color.alpha() // 2)
+            self._background_colors[status] = color
+        return self._background_colors[status]
+
     def data(self, index, role):
         if not index.isValid():
             return QVariant()
 
-        status = self.model_data[index.row()][self.get_column_index("status")]
-        col = self.get_column_name(index.column())
-
         if role == Qt.BackgroundColorRole:
-            color = QColor(*self.state_colors[status])
-            color.setAlpha(color.alpha()/2)
-            if col == 'stdout' or col == 'stderr':
-                color = QColor(100,100,100,100) # make items stand out
-            return QVariant(color)
+            if self.get_column_name(index.column()) in self.FILE_COLUMNS:
+                return QVariant(QColor(100,100,100,100)) # make items stand out
+            status = self.model_data[index.row()][self._status_column]
+            return QVariant(self._background_color(status))
 
         if role != Qt.DisplayRole:
             return QVariant()
 
-        if self.get_column_name(index.column()).find("time") >= 0:
-            if status == "Pending" or status == "Waiting":
-                return QVariant()
-
-            timestamp = eval(self.model_data[index.row()][index.column()])
-            return QVariant(time.ctime(timestamp))
-
-        if col == 'stdout' or col == 'stderr':
-            return QVariant("OPEN")
-
-        return QVariant(self.model_data[index.row()][index.column()])
+        return QVariant(self._display_data[index.row()][index.column()])
 
     def headerData(self, index, orientation, role=Qt.DisplayRole):
         if role != Qt.DisplayRole:
@@ -230,13 +320,12 @@ class SingleTableView(QTableView):
         headers = []
         for job in jobs:
             data = job.dump_data()
-            row = [str(data[key]) for key in data]
-            model_data.append(row)
-            headers = list(data.keys())
+            if not headers:
+                headers = list(data.keys())
+            model_data.append([data[key] for key in headers])
 
-        self.model().update_data(headers, model_data)
-        self.resizeColumnsToContents()
-        self.model().modelReset.emit()
+        if self.model().update_data(headers, model_data):
+            self.resizeColumnsToContents()
 
         for file_name in self.open_files:
             if self.open_files[file_name].isVisible():
@@ -244,14 +333,16 @@ class SingleTableView(QTableView):
 
 
 class FileViewer(QDialog):
-    def __init__(self, parent, file_name, job_name, job_number,realization, iteration):
+    def __init__(self, parent, file_name, job_name, job_number,realization, iteration, max_lines=FileTail.DEFAULT_MAX_LINES):
         super(FileViewer, self).__init__(parent)
 
         self.setWindowTitle("{} # {} Realization: {} Iteration: {}" \
                             .format(job_name, job_number, realization, iteration))
 
-        self.text_cont = QTextEdit()
+        # The plain text edit only lays out the visible lines, and drops the oldest lines beyond max_lines.
+        self.text_cont = QPlainTextEdit()
         self.text_cont.setReadOnly(True)
+        self.text_cont.setMaximumBlockCount(max_lines)
         close_button = QPushButton("Close")
         close_button.clicked.connect(self.accept)
 
@@ -262,12 +353,35 @@ class FileViewer(QDialog):
         self.setMinimumWidth(400)
         self.setMinimumHeight(200)
 
+        self._max_lines = max_lines
+        self._tail = None
         self.reload(file_name)
 
+    def _append(self, text):
+        scroll_bar = self.text_cont.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+
+        cursor = QTextCursor(self.text_cont.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+
     def reload(self, file_name):
-        with open(file_name) as f:
-            text = f.read()
-        self.text_cont.setText(text)
+        if self._tail is None or self._tail.path != file_name:
+            self._tail = FileTail(file_name, self._max_lines)
+            self.text_cont.clear()
+
+        text = self._tail.read()
+        if self._tail.truncated:
+            self.text_cont.clear()
+
+        if self._tail.skipped_bytes:
+            self._append("[... {} bytes skipped ...]\n".format(self._tail.skipped_bytes))
+
+        if text:
+            self._append(text)
         self.show()
 
 
@@ -40,15 +40,19 @@ class EnsembleExperimentPanel(SimulationConfigPanel):
 
         self._active_realizations_field.getValidationSupport().validationChanged.connect(self.simulationConfigurationChanged)
 
+        self.addStragglerPolicyFields(layout)
+
         self.setLayout(layout)
 
 
     def isConfigurationValid(self):
-        return self._active_realizations_field.isValid()
+        return self._active_realizations_field.isValid() and self.isStragglerPolicyValid()
 
 
     def getSimulationArguments(self):
         active_realizations_mask = self._active_realizations_model.getActiveRealizationsMask()
-        return {"active_realizations": active_realizations_mask}
+        arguments = {"active_realizations": active_realizations_mask}
+        arguments.update(self.getStragglerPolicyArguments())
+        return arguments
 
 
@@ -12,7 +12,7 @@ from ert_gui.ertwidgets.models.ertmodel import getRealizationCount, getRunPath
 from ert_gui.ertwidgets.models.targetcasemodel import TargetCaseModel
 from ert_gui.ertwidgets.stringbox import StringBox
 from ert_gui.ide.keywords.definitions import RangeStringArgument, ProperNameArgument
-from ert_gui.simulation import SimulationConfigPanel
+from ert_gui.simulation.simulation_config_panel import SimulationConfigPanel
 from ert_gui.simulation.models import EnsembleSmoother
 
 
@@ -49,14 +49,19 @@ class EnsembleSmootherPanel(SimulationConfigPanel):
         self._target_case_field.getValidationSupport().validationChanged.connect(self.simulationConfigurationChanged)
         self._active_realizations_field.getValidationSupport().validationChanged.connect(self.simulationConfigurationChanged)
 
+        self.addStragglerPolicyFields(layout)
+        self.addSlowRealizationField(layout)
+
         self.setLayout(layout)
 
     def isConfigurationValid(self):
-        return self._target_case_field.isValid() and self._active_realizations_field.isValid()
+        return self._target_case_field.isValid() and self._active_realizations_field.isValid() and self.isStragglerPolicyValid()
 
     def getSimulationArguments(self):
         arguments = {"active_realizations": self._active_realizations_model.getActiveRealizationsMask(),
                      "target_case": self._target_case_model.getValue(),
                      "analysis_module": self._analysis_module_selector.getSelectedAnalysisModuleName()
                      }
+        arguments.update(self.getStragglerPolicyArguments())
+        arguments.update(self.getSlowRealizationArguments())
         return arguments
@@ -0,0 +1,77 @@
+import mmap
+import os
+
+
+class FileTail(object):
+    """
+    Reads a growing text file incrementally. The byte offset of the last
+    read is remembered so only appended data is read on later calls. When
+    there is more new data than MMAP_THRESHOLD bytes, the file is memory
+    mapped and only the last max_lines lines are read.
+    """
+    DEFAULT_MAX_LINES = 10000
+    MMAP_THRESHOLD = 4 * 1024 * 1024
+
+    def __init__(self, path, max_lines=DEFAULT_MAX_LINES):
+        super(FileTail, self).__init__()
+        self.path = path
+        self._max_lines = max_lines
+        self._offset = 0
+        self.skipped_bytes = 0
+        self.truncated = False
+
+    def offset(self):
+        """ @rtype: int """
+        return self._offset
+
+    def _tailStart(self, f, size):
+        """ Byte position of the first of the last max_lines lines after the current offset. """
+        mapped = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        try:
+            end = size
+            if mapped[size - 1:size] == b"\n":
+                end -= 1
+
+            for _ in range(self._max_lines):
+                position = mapped.rfind(b"\n", self._offset, end)
+                if position < 0:
+                    return self._offset
+                end = position
+
+            return end + 1
+        finally:
+            mapped.close()
+
+    def read(self):
+        """
+        Returns the text appended to the file since the last read. The
+        skipped_bytes and truncated attributes tell if data was left out or
+        if the file was truncated and has been read from the start again.
+        @rtype: str
+        """
+        self.skipped_bytes = 0
+        self.truncated = False
+
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return ""
+
+        if size < self._offset:
+            self._offset = 0
+            self.truncated = True
+
+        if size == self._offset:
+            return ""
+
+        with open(self.path, "rb") as f:
+            start = self._offset
+            if size - start > FileTail.MMAP_THRESHOLD:
+                start = self._tailStart(f, size)
+                self.skipped_bytes = start - self._offset
+
+            f.seek(start)
+            data = f.read(size - start)
+
+        self._offset = start + len(data)
+        return data.decode("utf-8", "replace")
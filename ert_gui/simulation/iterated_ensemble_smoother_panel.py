@@ -12,7 +12,7 @@ from ert_gui.ertwidgets.models.ertmodel import getRealizationCount, getRunPath,
 from ert_gui.ertwidgets.models.targetcasemodel import TargetCaseModel
 from ert_gui.ertwidgets.stringbox import StringBox
 from ert_gui.ide.keywords.definitions import RangeStringArgument, ProperNameFormatArgument
-from ert_gui.simulation import SimulationConfigPanel
+from ert_gui.simulation.simulation_config_panel import SimulationConfigPanel
 from ert_gui.simulation.models import IteratedEnsembleSmoother
 
 
@@ -57,6 +57,8 @@ class IteratedEnsembleSmootherPanel(SimulationConfigPanel):
         self._active_realizations_field.setValidator(RangeStringArgument(getRealizationCount()))
         layout.addRow("Active realizations", self._active_realizations_field)
 
+        self.addStragglerPolicyFields(layout)
+        self.addSlowRealizationField(layout)
 
         self._iterated_target_case_format_field.getValidationSupport().validationChanged.connect(self.simulationConfigurationChanged)
         self._active_realizations_field.getValidationSupport().validationChanged.connect(self.simulationConfigurationChanged)
@@ -65,7 +67,8 @@ class IteratedEnsembleSmootherPanel(SimulationConfigPanel):
         
     def isConfigurationValid(self):
         analysis_module = self._analysis_module_selector.getSelectedAnalysisModuleName()
-        return self._iterated_target_case_format_field.isValid() and self._active_realizations_field.isValid() and analysis_module is not None
+        return self._iterated_target_case_format_field.isValid() and self._active_realizations_field.isValid() and analysis_module is not None \
+            and self.isStragglerPolicyValid()
 
 
     def getSimulationArguments(self):
@@ -73,4 +76,6 @@ class IteratedEnsembleSmootherPanel(SimulationConfigPanel):
                      "target_case": self._iterated_target_case_format_model.getValue(),
                      "analysis_module": self._analysis_module_selector.getSelectedAnalysisModuleName()
                      }
+        arguments.update(self.getStragglerPolicyArguments())
+        arguments.update(self.getSlowRealizationArguments())
         return arguments
@@ -0,0 +1,57 @@
+try:
+  from PyQt4.QtCore import Qt
+  from PyQt4.QtGui import QTableWidget, QTableWidgetItem, QAbstractItemView
+except ImportError:
+  from PyQt5.QtCore import Qt
+  from PyQt5.QtWidgets import QTableWidget, QTableWidgetItem, QAbstractItemView
+
+
+class JobStatisticsWidget(QTableWidget):
+    """ Table with the runtime statistics for each forward model job. """
+    COLUMNS = [("name", "Job"),
+               ("success_count", "Succeeded"),
+               ("failure_count", "Failed"),
+               ("mean_runtime", "Mean"),
+               ("min_runtime", "Min"),
+               ("median_runtime", "Median"),
+               ("p90_runtime", "90%"),
+               ("max_runtime", "Max")]
+
+    def __init__(self, parent=None):
+        super(JobStatisticsWidget, self).__init__(0, len(JobStatisticsWidget.COLUMNS), parent)
+        self.setHorizontalHeaderLabels([title for _, title in JobStatisticsWidget.COLUMNS])
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.verticalHeader().setVisible(False)
+        self._version = None
+
+    @staticmethod
+    def formatValue(key, value):
+        if value is None:
+            return ""
+        if key.endswith("_runtime"):
+            minutes, seconds = divmod(value, 60)
+            if minutes >= 1:
+                return "%dm %02ds" % (minutes, seconds)
+            return "%.1fs" % value
+        return str(value)
+
+    def set_statistics(self, job_statistics):
+        """ @type job_statistics: JobRuntimeStatistics """
+        version = (id(job_statistics), job_statistics.version())
+        if version == self._version:
+            return
+        self._version = version
+
+        summary = job_statistics.summary()
+        self.setRowCount(len(summary))
+        for row, job in enumerate(summary):
+            for column, (key, _) in enumerate(JobStatisticsWidget.COLUMNS):
+                item = self.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    if column > 0:
+                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    self.setItem(row, column, item)
+                item.setText(JobStatisticsWidget.formatValue(key, job[key]))
+
+        self.resizeColumnsToContents()
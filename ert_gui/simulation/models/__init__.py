@@ -1,4 +1,11 @@
+from .straggler_policy import StragglerPolicy, StragglerMonitor
+from .slow_realization_detector import SlowRealizationDetector
+from .fake_job_queue import FakeQueueConfig, FakeJobQueue
+from .run_trace import RunTrace, QueueTracer
+from .job_runtime_statistics import JobRuntimeStatistics, RuntimeHistogram
+from .progress_reporter import ProgressReporter
 from .base_run_model import BaseRunModel, ErtRunError
+from .run_checkpoint import RunCheckpoint
 from .ensemble_experiment import EnsembleExperiment
 from .single_test_run import SingleTestRun
 from .ensemble_smoother import EnsembleSmoother
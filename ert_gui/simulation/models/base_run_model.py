@@ -1,9 +1,17 @@
+import os
 import time
+from contextlib import contextmanager
 from res.job_queue import JobStatusType
 from res.job_queue import JobQueueManager, ForwardModelStatus
 from ert_gui import ERT
+from ert_gui.profiler import profiledRegion
 from res.util import ResLog
 from ecl.util.util import BoolVector
+from ert_gui.simulation.models.straggler_policy import StragglerPolicy, StragglerMonitor
+from ert_gui.simulation.models.slow_realization_detector import SlowRealizationDetector
+from ert_gui.simulation.models.run_trace import RunTrace, QueueTracer
+from ert_gui.simulation.models.fake_job_queue import FakeQueueConfig, FakeJobQueue, queueIndex
+from ert_gui.simulation.models.job_runtime_statistics import JobRuntimeStatistics
 
 # A method decorated with the @job_queue decorator implements the following logic:
 #
@@ -51,6 +59,10 @@ class BaseRunModel(object):
         self.support_restart = True
         self._run_context = None
         self._last_run_iteration = -1
+        self._slow_realization_detector = None
+        self._slow_realization_reference_iteration = -1
+        self._run_trace = RunTrace()
+        self._job_statistics = JobRuntimeStatistics()
         self.reset( )
 
     def ert(self):
@@ -68,6 +80,7 @@ class BaseRunModel(object):
     def startSimulations(self, arguments):
         try:
             self.initial_realizations_mask = arguments["active_realizations"]
+            self.prepareRun(arguments)
             run_context = self.runSimulations(arguments)
             self.updateDetailedProgress()
             self.completed_realizations_mask = run_context.get_mask()
@@ -80,7 +93,25 @@ class BaseRunModel(object):
             self._fail_message = str(e)
             self._simulationEnded()
 
+        self.finishRun(arguments)
+
+    def prepareRun(self, arguments):
+        """
+        Sets up the slow realization detection and the job runtime
+        statistics of the run. Called before the simulations by both the GUI
+        and the command line.
+        """
+        self.configureSlowRealizationDetection(arguments)
+        self._job_statistics = JobRuntimeStatistics()
+
+    def finishRun(self, arguments):
+        """
+        Writes the timing trace and the job runtime statistics of the run.
+        Called after the simulations by both the GUI and the command line.
+        """
         self._run_context = None #delete last active run_context to notify fs_manager that storage is not being written to
+        self.saveTrace(arguments.get("trace_file") or os.getenv("ERT_TRACE_FILE"))
+        self.saveJobStatistics(arguments.get("job_statistics_file"))
 
     def runSimulations(self, job_queue, run_context):
         raise NotImplementedError("Method must be implemented by inheritors!")
@@ -90,6 +121,78 @@ class BaseRunModel(object):
         raise NotImplementedError("Method must be implemented by inheritors!")
 
 
+    def getTrace(self):
+        """ @rtype: RunTrace """
+        return self._run_trace
+
+    def saveTrace(self, trace_file):
+        if trace_file:
+            self._run_trace.save(trace_file)
+            print("Timing trace written to %s" % trace_file)
+
+    def getJobStatistics(self):
+        """ @rtype: JobRuntimeStatistics """
+        return self._job_statistics
+
+    def saveJobStatistics(self, path=None):
+        """ Writes the job runtime statistics, by default to the storage mount point. """
+        if path is None:
+            path = os.path.join(self.ert().getMountPoint(), JobRuntimeStatistics.FILE_NAME)
+        self._job_statistics.save(path)
+        print("Job runtime statistics written to %s" % path)
+
+    @contextmanager
+    def traceSpan(self, name, run_context=None, category="phase"):
+        args = {}
+        if run_context is not None:
+            args["iteration"] = run_context.get_iter()
+        with self._run_trace.span(name, category, **args), profiledRegion(name):
+            yield
+
+    @contextmanager
+    def traceQueue(self, run_context):
+        """ Times a simulation step, with the queue states of every realization. """
+        tracer = QueueTracer(self._run_trace, self._job_queue, run_context)
+        tracer.start()
+        try:
+            with self.traceSpan("Run forward model", run_context):
+                yield
+        finally:
+            tracer.stop()
+            # Pick up the final job states of the step, the GUI may not have polled all of them.
+            self.updateDetailedProgress()
+
+    def createJobQueue(self):
+        """
+        Creates the job queue for a simulation step. Setting the
+        ERT_FAKE_QUEUE environment variable replaces the configured queue
+        with a FakeJobQueue, e.g. ERT_FAKE_QUEUE="mean_runtime=600,failure_rate=0.05".
+        """
+        fake_queue_config = FakeQueueConfig.fromEnvironment()
+        if fake_queue_config is not None:
+            return FakeJobQueue(fake_queue_config)
+        return self._queue_config.create_job_queue()
+
+    def runSimpleStep(self, run_context):
+        """ @rtype: int: number of successful realizations """
+        if isinstance(self._job_queue, FakeJobQueue):
+            return self._job_queue.runStep(run_context)
+        return self.ert().getEnkfSimulationRunner().runSimpleStep(self._job_queue, run_context)
+
+    def runEnsembleExperiment(self, run_context):
+        """ @rtype: int: number of successful realizations """
+        if isinstance(self._job_queue, FakeJobQueue):
+            return self._job_queue.runStep(run_context)
+        return self.ert().getEnkfSimulationRunner().runEnsembleExperiment(self._job_queue, run_context)
+
+    def createRunPath(self, run_context):
+        with self.traceSpan("createRunPath", run_context):
+            self.ert().getEnkfSimulationRunner().createRunPath(run_context)
+
+    def runWorkflows(self, hook_runtime, run_context=None):
+        with self.traceSpan("Workflows %s" % hook_runtime, run_context, category="workflow"):
+            self.ert().getEnkfSimulationRunner().runWorkflows(hook_runtime)
+
     @job_queue(None)
     def killAllSimulations(self):
         self._job_queue.killAllJobs()
@@ -229,6 +332,47 @@ class BaseRunModel(object):
 
         return current_progress
 
+    def getProgressSnapshot(self):
+        """
+        Summary of the run state for progress reporting. It is built from
+        the queue states only; the status files are only read when slow
+        realization detection is enabled.
+        @rtype: dict
+        """
+        if self._slow_realization_detector is not None:
+            self.updateDetailedProgress()
+
+        run_context = self._run_context
+        job_queue = self._job_queue
+
+        successful_realizations = []
+        if run_context is not None and job_queue is not None:
+            queue_size = len(job_queue)
+            for run_arg in run_context:
+                if not run_arg:
+                    continue
+                try:
+                    queue_index = queueIndex(job_queue, run_arg)
+                except ValueError:
+                    continue
+                if queue_index < queue_size and job_queue.getJobStatus(queue_index) == JobStatusType.JOB_QUEUE_SUCCESS:
+                    successful_realizations.append(run_arg.iens)
+
+        queue_status = {str(status).replace("JOB_QUEUE_", "").lower(): count
+                        for status, count in self.getQueueStatus().items()}
+
+        return {"phase": self._phase,
+                "phase_count": self._phase_count,
+                "phase_name": self._phase_name,
+                "progress": self.getProgress(),
+                "iteration": run_context.get_iter() if run_context is not None else self._last_run_iteration,
+                "queue_status": queue_status,
+                "successful_realizations": successful_realizations,
+                "slow_realizations": self.getSlowRealizations(),
+                "running_time": self.getRunningTime(),
+                "finished": self.isFinished(),
+                "failed": self.hasRunFailed()}
+
     @staticmethod
     def is_forward_model_finished(progress):
         return not (any((job.status != 'Success' for job in progress)))
@@ -246,7 +390,7 @@ class BaseRunModel(object):
                 continue
             try:
                 # will throw if not yet submitted (is in a limbo state)
-                queue_index = run_arg.getQueueIndex()
+                queue_index = queueIndex(self._job_queue, run_arg)
             except ValueError:
                 continue
 
@@ -265,6 +409,7 @@ class BaseRunModel(object):
                     continue
 
                 jobs = fms.jobs
+                self._job_statistics.record(iteration, run_arg.iens, jobs)
             self.realization_progress[iteration][run_arg.iens] = jobs, status
 
     def getDetailedProgress(self):
@@ -279,6 +424,36 @@ class BaseRunModel(object):
         else:
             return {}, -1
 
+    def configureSlowRealizationDetection(self, arguments):
+        factor = arguments.get("slow_realization_factor")
+        if factor is None:
+            self._slow_realization_detector = None
+        else:
+            self._slow_realization_detector = SlowRealizationDetector(float(factor))
+        self._slow_realization_reference_iteration = -1
+
+    def getSlowRealizations(self):
+        """
+        Realizations in the current iteration running far past the runtime
+        they had in the previous iteration. Only available when detection
+        has been enabled through the slow_realization_factor argument.
+        @rtype: list[int]
+        """
+        if self._slow_realization_detector is None or not self._run_context:
+            return []
+
+        iteration = self._run_context.get_iter()
+        previous_progress = self.realization_progress.get(iteration - 1)
+        current_progress = self.realization_progress.get(iteration)
+        if not previous_progress or not current_progress:
+            return []
+
+        if self._slow_realization_reference_iteration != iteration - 1:
+            self._slow_realization_detector.recordIteration(previous_progress)
+            self._slow_realization_reference_iteration = iteration - 1
+
+        return self._slow_realization_detector.detect(current_progress)
+
     def isIndeterminate(self):
         """ @rtype: bool """
         return not self.isFinished() and self._indeterminate
@@ -297,3 +472,23 @@ class BaseRunModel(object):
 
     def count_active_realizations(self, run_context):
         return sum(run_context.get_mask( ))
+
+    @contextmanager
+    def stragglerCutoff(self, arguments, run_context):
+        """
+        Applies the straggler policy from the arguments, if any, to the job
+        queue while the body of the with statement runs the simulations.
+        """
+        policy = StragglerPolicy.fromArguments(arguments)
+        monitor = None
+        if policy is not None and self._job_queue is not None:
+            active_count = self.count_active_realizations(run_context)
+            sufficient = lambda success_count: self.ert().analysisConfig().haveEnoughRealisations(success_count, active_count)
+            monitor = StragglerMonitor(self._job_queue, policy, active_count, sufficient)
+            monitor.start()
+
+        try:
+            yield
+        finally:
+            if monitor is not None:
+                monitor.stop()
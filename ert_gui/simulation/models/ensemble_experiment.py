@@ -2,7 +2,7 @@ from res.enkf.enums import HookRuntime
 from res.enkf import ErtRunContext
 
 from ert_gui.simulation.models import BaseRunModel, ErtRunError
-from ert_gui.ertwidgets.models.ertmodel import getRealizationCount, getRunPath, getQueueConfig
+from ert_gui.ert_queries import getRealizationCount, getRunPath, getQueueConfig
 
 class EnsembleExperiment(BaseRunModel):
 
@@ -11,24 +11,25 @@ class EnsembleExperiment(BaseRunModel):
 
     def runSimulations__(self, arguments, run_msg):
 
-        self._job_queue = self._queue_config.create_job_queue( )
+        self._job_queue = self.createJobQueue()
         run_context = self.create_context( arguments )
 
         self.setPhase(0, "Running simulations...", indeterminate=False)
 
         self.setPhaseName("Pre processing...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().createRunPath( run_context )
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.PRE_SIMULATION )
+        self.createRunPath(run_context)
+        self.runWorkflows(HookRuntime.PRE_SIMULATION, run_context)
 
         self.setPhaseName( run_msg, indeterminate=False)
 
-        num_successful_realizations = self.ert().getEnkfSimulationRunner().runEnsembleExperiment(self._job_queue, run_context)
+        with self.stragglerCutoff(arguments, run_context), self.traceQueue(run_context):
+            num_successful_realizations = self.runEnsembleExperiment(run_context)
 
         num_successful_realizations += arguments.get('prev_successful_realizations', 0)
         self.checkHaveSufficientRealizations(num_successful_realizations)
 
         self.setPhaseName("Post processing...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.POST_SIMULATION )
+        self.runWorkflows(HookRuntime.POST_SIMULATION, run_context)
         self.setPhase(1, "Simulations completed.") # done...
 
         return run_context
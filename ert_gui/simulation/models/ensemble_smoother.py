@@ -2,7 +2,7 @@ from res.enkf.enums import HookRuntime
 from res.enkf.enums import RealizationStateEnum
 from res.enkf import ErtRunContext
 from ert_gui.simulation.models import BaseRunModel, ErtRunError
-from ert_gui.ertwidgets.models.ertmodel import getRealizationCount, getRunPath, getQueueConfig
+from ert_gui.ert_queries import getRealizationCount, getRunPath, getQueueConfig
 
 class EnsembleSmoother(BaseRunModel):
 
@@ -26,26 +26,28 @@ class EnsembleSmoother(BaseRunModel):
         # self.setAnalysisModule(arguments["analysis_module"])
 
         self.setPhaseName("Pre processing...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().createRunPath(prior_context)
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.PRE_SIMULATION )
+        self.createRunPath(prior_context)
+        self.runWorkflows(HookRuntime.PRE_SIMULATION, prior_context)
 
         self.setPhaseName("Running forecast...", indeterminate=False)
-        self._job_queue = self._queue_config.create_job_queue( )
-        num_successful_realizations = self.ert().getEnkfSimulationRunner().runSimpleStep(self._job_queue, prior_context)
+        self._job_queue = self.createJobQueue()
+        with self.stragglerCutoff(arguments, prior_context), self.traceQueue(prior_context):
+            num_successful_realizations = self.runSimpleStep(prior_context)
 
         self.checkHaveSufficientRealizations(num_successful_realizations)
 
         self.setPhaseName("Post processing...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.POST_SIMULATION )
+        self.runWorkflows(HookRuntime.POST_SIMULATION, prior_context)
 
         self.setPhaseName("Analyzing...")
 
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.PRE_UPDATE )
+        self.runWorkflows(HookRuntime.PRE_UPDATE, prior_context)
         es_update = self.ert().getESUpdate( )
-        success = es_update.smootherUpdate( prior_context )
+        with self.traceSpan("smootherUpdate", prior_context):
+            success = es_update.smootherUpdate(prior_context)
         if not success:
             raise ErtRunError("Analysis of simulation failed!")
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.POST_UPDATE )
+        self.runWorkflows(HookRuntime.POST_UPDATE, prior_context)
 
         self.setPhase(1, "Running simulations...")
         self.ert().getEnkfFsManager().switchFileSystem( prior_context.get_target_fs( ) )
@@ -54,18 +56,19 @@ class EnsembleSmoother(BaseRunModel):
 
         rerun_context = self.create_context( arguments, prior_context = prior_context )
 
-        self.ert().getEnkfSimulationRunner().createRunPath( rerun_context )
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.PRE_SIMULATION )
+        self.createRunPath(rerun_context)
+        self.runWorkflows(HookRuntime.PRE_SIMULATION, rerun_context)
 
         self.setPhaseName("Running forecast...", indeterminate=False)
 
-        self._job_queue = self._queue_config.create_job_queue( )
-        num_successful_realizations = self.ert().getEnkfSimulationRunner().runSimpleStep(self._job_queue, rerun_context)
+        self._job_queue = self.createJobQueue()
+        with self.stragglerCutoff(arguments, rerun_context), self.traceQueue(rerun_context):
+            num_successful_realizations = self.runSimpleStep(rerun_context)
 
         self.checkHaveSufficientRealizations(num_successful_realizations)
 
         self.setPhaseName("Post processing...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.POST_SIMULATION )
+        self.runWorkflows(HookRuntime.POST_SIMULATION, rerun_context)
 
         self.setPhase(2, "Simulations completed.")
 
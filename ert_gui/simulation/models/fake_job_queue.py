@@ -0,0 +1,313 @@
+#  Copyright (C) 2019 Equinor ASA, Norway.
+#
+#  This file is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+import json
+import math
+import os
+import random
+import time
+from threading import Lock
+
+from res.job_queue import JobStatusType
+
+
+class FakeQueueConfig(object):
+    """
+    Settings for the FakeJobQueue. Runtimes are in simulated seconds and
+    time_scale is the number of wall clock seconds per simulated second.
+    """
+    ENVIRONMENT_VARIABLE = "ERT_FAKE_QUEUE"
+
+    def __init__(self, mean_runtime=60.0, runtime_spread=0.5, failure_rate=0.0, pending_time=5.0,
+                 time_scale=0.01, job_count=5, max_running=0, seed=None, poll_interval=0.1):
+        super(FakeQueueConfig, self).__init__()
+        self.mean_runtime = float(mean_runtime)
+        self.runtime_spread = float(runtime_spread)
+        self.failure_rate = float(failure_rate)
+        self.pending_time = float(pending_time)
+        self.time_scale = float(time_scale)
+        self.job_count = int(job_count)
+        self.max_running = int(max_running)
+        self.seed = None if seed is None else int(seed)
+        self.poll_interval = float(poll_interval)
+
+    @classmethod
+    def fromString(cls, spec):
+        """
+        Parses a comma separated list of key=value pairs, e.g.
+        'mean_runtime=600,failure_rate=0.05,time_scale=0.001'.
+        @rtype: FakeQueueConfig
+        """
+        options = {}
+        for item in spec.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            key, sep, value = item.partition("=")
+            if not sep:
+                raise ValueError("Fake queue option must be on the form key=value, got: '%s'" % item)
+            options[key.strip()] = value.strip()
+
+        try:
+            return cls(**options)
+        except TypeError as e:
+            raise ValueError("Invalid fake queue option: %s" % e)
+
+    @classmethod
+    def fromEnvironment(cls):
+        """ @rtype: FakeQueueConfig or None """
+        spec = os.getenv(cls.ENVIRONMENT_VARIABLE)
+        if spec is None:
+            return None
+        return cls.fromString(spec)
+
+
+class _FakeRealization(object):
+
+    def __init__(self, run_arg, job_runtimes, failing_job):
+        self.run_arg = run_arg
+        self.job_runtimes = job_runtimes
+        self.failing_job = failing_job
+        self.pending_start = None
+        self.running_start = None
+        self.written_state = None
+
+
+class FakeJobQueue(object):
+    """
+    Stand-in for the job queue which replays the configured runtime and
+    failure distributions instead of running anything. The realizations
+    write status.json and OK/ERROR files to their runpaths like the real
+    forward model does, so that progress reporting can be exercised at
+    large ensemble sizes without a cluster. Results are not loaded into
+    storage, so runs with an update step will fail at the update.
+    """
+
+    UNFINISHED_STATES = (JobStatusType.JOB_QUEUE_WAITING | JobStatusType.JOB_QUEUE_PENDING |
+                         JobStatusType.JOB_QUEUE_RUNNING)
+
+    def __init__(self, config):
+        super(FakeJobQueue, self).__init__()
+        self._config = config
+        self._random = random.Random(config.seed)
+        self._lock = Lock()
+        self._statuses = []
+        self._queue_indices = {}
+        self._running = False
+        self._user_exit = False
+        self._start_wall_time = None
+
+    def __len__(self):
+        return len(self._statuses)
+
+    def getJobStatus(self, queue_index):
+        with self._lock:
+            return self._statuses[queue_index]
+
+    def queueIndex(self, iens):
+        """ @rtype: int """
+        if iens not in self._queue_indices:
+            raise ValueError("Realization %d has not been submitted" % iens)
+        return self._queue_indices[iens]
+
+    def isRunning(self):
+        return self._running
+
+    def getUserExit(self):
+        return self._user_exit
+
+    def kill_job(self, queue_index):
+        with self._lock:
+            if self._statuses[queue_index] in FakeJobQueue.UNFINISHED_STATES:
+                self._statuses[queue_index] = JobStatusType.JOB_QUEUE_IS_KILLED
+                return True
+        return False
+
+    def killAllJobs(self):
+        self._user_exit = True
+        for queue_index in range(len(self)):
+            self.kill_job(queue_index)
+        return True
+
+    def _sampleJobRuntimes(self):
+        sigma = self._config.runtime_spread
+        mu = math.log(self._config.mean_runtime) - 0.5 * sigma * sigma
+        runtime = self._random.lognormvariate(mu, sigma)
+
+        weights = [self._random.random() + 0.5 for _ in range(self._config.job_count)]
+        total_weight = sum(weights)
+        return [runtime * weight / total_weight for weight in weights]
+
+    def _submit(self, run_context):
+        realizations = []
+        for run_arg in run_context:
+            if not run_arg:
+                continue
+
+            failing_job = None
+            if self._random.random() < self._config.failure_rate:
+                failing_job = self._random.randrange(self._config.job_count)
+
+            with self._lock:
+                self._queue_indices[run_arg.iens] = len(self._statuses)
+                self._statuses.append(JobStatusType.JOB_QUEUE_WAITING)
+            realizations.append(_FakeRealization(run_arg, self._sampleJobRuntimes(), failing_job))
+
+        return realizations
+
+    def runStep(self, run_context):
+        """
+        Runs all active realizations of the run context through the fake
+        queue, blocking until they are done like runSimpleStep does.
+        @rtype: int: number of successful realizations
+        """
+        self._running = True
+        try:
+            realizations = self._submit(run_context)
+            self._start_wall_time = time.time()
+
+            unfinished = list(realizations)
+            while unfinished:
+                now = (time.time() - self._start_wall_time) / self._config.time_scale
+                unfinished = [realization for realization in unfinished if not self._advance(realization, now)]
+                if unfinished:
+                    time.sleep(self._config.poll_interval)
+
+            return sum(1 for status in self._statuses if status == JobStatusType.JOB_QUEUE_SUCCESS)
+        finally:
+            self._running = False
+
+    def _runningCount(self):
+        running_states = JobStatusType.JOB_QUEUE_PENDING | JobStatusType.JOB_QUEUE_RUNNING
+        with self._lock:
+            return sum(1 for status in self._statuses if status in running_states)
+
+    def _setStatus(self, realization, status):
+        with self._lock:
+            queue_index = self._queue_indices[realization.run_arg.iens]
+            if self._statuses[queue_index] == JobStatusType.JOB_QUEUE_IS_KILLED:
+                return False
+            self._statuses[queue_index] = status
+            return True
+
+    def _advance(self, realization, now):
+        """ Moves a realization forward to the simulated time now, returns True when it is finished. """
+        status = self.getJobStatus(self._queue_indices[realization.run_arg.iens])
+
+        if status == JobStatusType.JOB_QUEUE_IS_KILLED:
+            return True
+
+        if status == JobStatusType.JOB_QUEUE_WAITING:
+            max_running = self._config.max_running
+            if max_running > 0 and self._runningCount() >= max_running:
+                return False
+            realization.pending_start = now
+            self._setStatus(realization, JobStatusType.JOB_QUEUE_PENDING)
+            return False
+
+        if status == JobStatusType.JOB_QUEUE_PENDING:
+            if now - realization.pending_start < self._config.pending_time:
+                return False
+            realization.running_start = now
+            self._setStatus(realization, JobStatusType.JOB_QUEUE_RUNNING)
+
+        elapsed = now - realization.running_start
+        job_states = self._jobStates(realization, elapsed)
+        failed = "Failure" in job_states
+        finished = failed or all(state == "Success" for state in job_states)
+
+        if job_states != realization.written_state:
+            self._writeStatus(realization, job_states)
+            realization.written_state = job_states
+
+        if finished:
+            if failed:
+                self._writeMarker(realization, "ERROR", "Job %d failed\n" % realization.failing_job)
+                self._setStatus(realization, JobStatusType.JOB_QUEUE_FAILED)
+            else:
+                self._writeMarker(realization, "OK", "All jobs complete\n")
+                self._setStatus(realization, JobStatusType.JOB_QUEUE_SUCCESS)
+
+        return finished
+
+    def _jobStates(self, realization, elapsed):
+        states = []
+        job_start = 0.0
+        for index, runtime in enumerate(realization.job_runtimes):
+            if states and states[-1] != "Success":
+                states.append("Waiting")
+            elif elapsed < job_start + runtime:
+                states.append("Running")
+            elif index == realization.failing_job:
+                states.append("Failure")
+            else:
+                states.append("Success")
+            job_start += runtime
+        return states
+
+    def _writeStatus(self, realization, job_states):
+        runpath = realization.run_arg.runpath
+        if not os.path.isdir(runpath):
+            os.makedirs(runpath)
+
+        jobs = []
+        job_start = realization.running_start
+        end_time = None
+        for index, (runtime, state) in enumerate(zip(realization.job_runtimes, job_states)):
+            name = "FAKE_JOB_%d" % index
+            started = state != "Waiting"
+            finished = state in ("Success", "Failure")
+            if finished:
+                end_time = self._wallTime(job_start + runtime)
+
+            jobs.append({"name": name,
+                         "status": state,
+                         "error": "Fake failure" if state == "Failure" else None,
+                         "start_time": self._wallTime(job_start) if started else None,
+                         "end_time": end_time if finished else None,
+                         "stdout": "%s.stdout.%d" % (name, index),
+                         "stderr": "%s.stderr.%d" % (name, index),
+                         "current_memory_usage": 0,
+                         "max_memory_usage": 0})
+            job_start += runtime
+
+        if not ("Failure" in job_states or all(state == "Success" for state in job_states)):
+            end_time = None
+
+        data = {"run_id": "fake_%d" % realization.run_arg.iens,
+                "start_time": self._wallTime(realization.running_start),
+                "end_time": end_time,
+                "jobs": jobs}
+
+        with open(os.path.join(runpath, "status.json"), "w") as f:
+            json.dump(data, f)
+
+    def _writeMarker(self, realization, file_name, content):
+        with open(os.path.join(realization.run_arg.runpath, file_name), "w") as f:
+            f.write(content)
+
+    def _wallTime(self, simulated_time):
+        return self._start_wall_time + simulated_time * self._config.time_scale
+
+
+def queueIndex(job_queue, run_arg):
+    """
+    Queue index of a submitted realization, raises ValueError when the
+    realization has not been submitted to the queue yet.
+    @rtype: int
+    """
+    if isinstance(job_queue, FakeJobQueue):
+        return job_queue.queueIndex(run_arg.iens)
+    return run_arg.getQueueIndex()
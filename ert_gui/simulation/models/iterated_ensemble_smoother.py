@@ -1,8 +1,8 @@
 from res.enkf.enums import EnkfInitModeEnum, HookRuntime
 from res.enkf import ErtRunContext
-from ert_gui.ertwidgets.models.ertmodel import getNumberOfIterations
+from ert_gui.ert_queries import getNumberOfIterations
 from ert_gui.simulation.models import BaseRunModel, ErtRunError
-from ert_gui.ertwidgets.models.ertmodel import getRealizationCount, getRunPath, getQueueConfig
+from ert_gui.ert_queries import getRealizationCount, getRunPath, getQueueConfig
 
 class IteratedEnsembleSmoother(BaseRunModel):
 
@@ -19,22 +19,23 @@ class IteratedEnsembleSmoother(BaseRunModel):
         return self.ert().analysisConfig().getModule(module_name)
 
 
-    def _runAndPostProcess(self, run_context):
-        self._job_queue = self._queue_config.create_job_queue( )
+    def _runAndPostProcess(self, run_context, arguments):
+        self._job_queue = self.createJobQueue()
         phase_msg = "Running iteration %d of %d simulation iterations..." % (run_context.get_iter(), self.phaseCount() - 1)
         self.setPhase(run_context.get_iter(), phase_msg, indeterminate=False)
 
         self.setPhaseName("Pre processing...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().createRunPath( run_context )
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.PRE_SIMULATION )
+        self.createRunPath(run_context)
+        self.runWorkflows(HookRuntime.PRE_SIMULATION, run_context)
 
         self.setPhaseName("Running forecast...", indeterminate=False)
-        num_successful_realizations = self.ert().getEnkfSimulationRunner().runSimpleStep(self._job_queue, run_context)
+        with self.stragglerCutoff(arguments, run_context), self.traceQueue(run_context):
+            num_successful_realizations = self.runSimpleStep(run_context)
 
         self.checkHaveSufficientRealizations(num_successful_realizations)
 
         self.setPhaseName("Post processing...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.POST_SIMULATION )
+        self.runWorkflows(HookRuntime.POST_SIMULATION, run_context)
 
 
     def createTargetCaseFileSystem(self, phase, target_case_format):
@@ -48,15 +49,16 @@ class IteratedEnsembleSmoother(BaseRunModel):
         source_fs = self.ert().getEnkfFsManager().getCurrentFileSystem()
 
         self.setPhaseName("Pre processing update...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().runWorkflows(HookRuntime.PRE_UPDATE)
+        self.runWorkflows(HookRuntime.PRE_UPDATE, run_context)
         es_update = self.ert().getESUpdate()
 
-        success = es_update.smootherUpdate(run_context)
+        with self.traceSpan("smootherUpdate", run_context):
+            success = es_update.smootherUpdate(run_context)
         if not success:
             raise ErtRunError("Analysis of simulation failed!")
 
         self.setPhaseName("Post processing update...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().runWorkflows(HookRuntime.POST_UPDATE)
+        self.runWorkflows(HookRuntime.POST_UPDATE, run_context)
 
     def runSimulations(self, arguments):
         phase_count = getNumberOfIterations() + 1
@@ -68,7 +70,7 @@ class IteratedEnsembleSmoother(BaseRunModel):
 
         self.ert().analysisConfig().getAnalysisIterConfig().setCaseFormat( target_case_format )
 
-        self._runAndPostProcess( run_context )
+        self._runAndPostProcess( run_context, arguments )
 
         analysis_config = self.ert().analysisConfig()
         analysis_iter_config = analysis_config.getAnalysisIterConfig()
@@ -85,11 +87,11 @@ class IteratedEnsembleSmoother(BaseRunModel):
             if analysis_success:
                 run_context = self.create_context( arguments, current_iter, prior_context = run_context )
                 self.ert().getEnkfFsManager().switchFileSystem(run_context.get_target_fs())
-                self._runAndPostProcess(run_context)
+                self._runAndPostProcess(run_context, arguments)
                 num_retries = 0
             else:
                 run_context = self.create_context( arguments, current_iter, prior_context = run_context , rerun = True)
-                self._runAndPostProcess(run_context)
+                self._runAndPostProcess(run_context, arguments)
                 num_retries += 1
 
         if current_iter == (phase_count - 1):
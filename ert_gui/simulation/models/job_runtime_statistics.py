@@ -0,0 +1,204 @@
+#  Copyright (C) 2019 Equinor ASA, Norway.
+#
+#  This file is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+import json
+import math
+from collections import OrderedDict
+from threading import Lock
+
+from ert_gui.simulation.models.slow_realization_detector import jobTimestamp
+
+
+class RuntimeHistogram(object):
+    """
+    Histogram of runtimes with logarithmically spaced buckets, four per
+    doubling of the runtime. Bucket 0 holds runtimes below one second and
+    the last bucket everything above about 190 days.
+    """
+    BUCKETS_PER_DOUBLING = 4
+    BUCKET_COUNT = 96
+
+    def __init__(self):
+        super(RuntimeHistogram, self).__init__()
+        self.counts = [0] * RuntimeHistogram.BUCKET_COUNT
+        self.count = 0
+
+    @classmethod
+    def bucketIndex(cls, runtime):
+        """ @rtype: int """
+        if runtime < 1.0:
+            return 0
+        index = int(math.log(runtime, 2) * cls.BUCKETS_PER_DOUBLING) + 1
+        return min(index, cls.BUCKET_COUNT - 1)
+
+    @classmethod
+    def bucketBounds(cls, index):
+        """ @rtype: (float, float) """
+        if index == 0:
+            return 0.0, 1.0
+        lower = 2.0 ** (float(index - 1) / cls.BUCKETS_PER_DOUBLING)
+        upper = 2.0 ** (float(index) / cls.BUCKETS_PER_DOUBLING)
+        return lower, upper
+
+    def add(self, runtime):
+        self.counts[RuntimeHistogram.bucketIndex(runtime)] += 1
+        self.count += 1
+
+    def quantile(self, q):
+        """
+        Estimated q quantile, the geometric middle of the bucket holding it.
+        @rtype: float or None
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative > rank:
+                lower, upper = RuntimeHistogram.bucketBounds(index)
+                if lower == 0.0:
+                    return upper / 2.0
+                return math.sqrt(lower * upper)
+
+        return RuntimeHistogram.bucketBounds(RuntimeHistogram.BUCKET_COUNT - 1)[1]
+
+
+class JobStatistics(object):
+
+    def __init__(self, name):
+        super(JobStatistics, self).__init__()
+        self.name = name
+        self.success_count = 0
+        self.failure_count = 0
+        self.total_runtime = 0.0
+        self.min_runtime = None
+        self.max_runtime = None
+        self.histogram = RuntimeHistogram()
+
+    def addRuntime(self, runtime):
+        self.success_count += 1
+        self.total_runtime += runtime
+        self.min_runtime = runtime if self.min_runtime is None else min(self.min_runtime, runtime)
+        self.max_runtime = runtime if self.max_runtime is None else max(self.max_runtime, runtime)
+        self.histogram.add(runtime)
+
+    def addFailure(self):
+        self.failure_count += 1
+
+    def meanRuntime(self):
+        """ @rtype: float or None """
+        if self.histogram.count == 0:
+            return None
+        return self.total_runtime / self.histogram.count
+
+    def quantile(self, q):
+        """ @rtype: float or None """
+        value = self.histogram.quantile(q)
+        if value is None:
+            return None
+        return min(max(value, self.min_runtime), self.max_runtime)
+
+    def summary(self):
+        """ @rtype: dict """
+        return OrderedDict([("name", self.name),
+                            ("success_count", self.success_count),
+                            ("failure_count", self.failure_count),
+                            ("mean_runtime", self.meanRuntime()),
+                            ("min_runtime", self.min_runtime),
+                            ("median_runtime", self.quantile(0.5)),
+                            ("p90_runtime", self.quantile(0.9)),
+                            ("max_runtime", self.max_runtime)])
+
+
+def jobRuntime(job):
+    """ @rtype: float or None """
+    start_time = jobTimestamp(job.start_time)
+    end_time = jobTimestamp(job.end_time)
+    if start_time is None or end_time is None:
+        return None
+    return max(end_time - start_time, 0.0)
+
+
+class JobRuntimeStatistics(object):
+    """
+    Aggregates the runtimes and failures of the forward model jobs by job
+    name, across realizations and iterations. Every job is counted once,
+    when it reaches Success or Failure, so feeding it the full detailed
+    progress on every update only costs a status comparison per job.
+    """
+    FILE_NAME = "job_runtime_statistics.json"
+
+    def __init__(self):
+        super(JobRuntimeStatistics, self).__init__()
+        self._lock = Lock()
+        self._jobs = OrderedDict()
+        self._job_status = {}
+        self._version = 0
+
+    def version(self):
+        """ Incremented on every change, so views know when to refresh. """
+        return self._version
+
+    def record(self, iteration, iens, jobs):
+        with self._lock:
+            for index, job in enumerate(jobs):
+                key = (iteration, iens, index)
+                if self._job_status.get(key) == job.status:
+                    continue
+                self._job_status[key] = job.status
+
+                if job.status not in ("Success", "Failure"):
+                    continue
+
+                if job.name not in self._jobs:
+                    self._jobs[job.name] = JobStatistics(job.name)
+                statistics = self._jobs[job.name]
+
+                if job.status == "Failure":
+                    statistics.addFailure()
+                else:
+                    runtime = jobRuntime(job)
+                    if runtime is None:
+                        continue
+                    statistics.addRuntime(runtime)
+                self._version += 1
+
+    def jobStatistics(self, name):
+        """ @rtype: JobStatistics or None """
+        return self._jobs.get(name)
+
+    def summary(self):
+        """ @rtype: list[dict] """
+        with self._lock:
+            return [statistics.summary() for statistics in self._jobs.values()]
+
+    def save(self, path):
+        with self._lock:
+            jobs = []
+            for statistics in self._jobs.values():
+                histogram = []
+                for index, count in enumerate(statistics.histogram.counts):
+                    if count > 0:
+                        lower, upper = RuntimeHistogram.bucketBounds(index)
+                        histogram.append({"lower": lower, "upper": upper, "count": count})
+
+                job = statistics.summary()
+                job["histogram"] = histogram
+                jobs.append(job)
+
+        with open(path, "w") as f:
+            json.dump({"jobs": jobs}, f, indent=2)
@@ -13,12 +13,17 @@
 #
 #  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
 #  for more details.
+import os
+
 from res.enkf.enums import HookRuntime
 from res.enkf.enums import RealizationStateEnum
 from res.enkf import ErtRunContext
+from ecl.util.util import BoolVector
 
+from ert_gui import ERT
 from ert_gui.simulation.models import BaseRunModel, ErtRunError
-from ert_gui.ertwidgets.models.ertmodel import getRealizationCount, getRunPath, getQueueConfig
+from ert_gui.simulation.models.run_checkpoint import RunCheckpoint
+from ert_gui.ert_queries import getRealizationCount, getRunPath, getQueueConfig, caseExists, getCaseRealizationStates
 
 class MultipleDataAssimilation(BaseRunModel):
     """
@@ -47,6 +52,15 @@ class MultipleDataAssimilation(BaseRunModel):
         print("Running MDA ES for %s  iterations\t%s" % (iteration_count, ", ".join(str(weight) for weight in weights)))
         weights = self.normalizeWeights(weights)
 
+        checkpoint_path = self.checkpointPath()
+        if arguments.get("resume", False):
+            checkpoint = self.restoreCheckpoint(arguments, checkpoint_path)
+            weights = checkpoint.weights
+            iteration_count = len(weights)
+        else:
+            mask = arguments["active_realizations"]
+            checkpoint = RunCheckpoint(arguments["target_case"], weights, len(mask), mask.createActiveList())
+
         weight_string = ", ".join(str(round(weight,3)) for weight in weights)
         print("Running MDA ES on (weights normalized)\t%s" % weight_string)
 
@@ -55,23 +69,70 @@ class MultipleDataAssimilation(BaseRunModel):
         phase_string = "Running MDA ES %d iteration%s." % (iteration_count, ('s' if (iteration_count != 1) else ''))
         self.setPhaseName(phase_string, indeterminate=True)
 
+        start_iteration = checkpoint.iteration + 1
+        if start_iteration > 0:
+            print("Resuming MDA ES from iteration %d" % start_iteration)
+            self.setPhase(start_iteration, phase_string, indeterminate=True)
+
         run_context = None
-        for iteration, weight in enumerate(weights):
+        for iteration in range(start_iteration, iteration_count):
             run_context = self.create_context( arguments , iteration,  prior_context = run_context )
             self._simulateAndPostProcess(run_context, arguments )
 
-            self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.PRE_UPDATE )
+            self.runWorkflows(HookRuntime.PRE_UPDATE, run_context)
             self.update( run_context , weights[iteration])
-            self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.POST_UPDATE )
+            self.runWorkflows(HookRuntime.POST_UPDATE, run_context)
+
+            checkpoint.iteration = iteration
+            checkpoint.save(checkpoint_path)
 
         self.setPhaseName("Post processing...", indeterminate=True)
         run_context = self.create_context( arguments , len(weights),  prior_context = run_context, update = False)
         self._simulateAndPostProcess(run_context, arguments)
 
+        RunCheckpoint.remove(checkpoint_path)
         self.setPhase(iteration_count + 2, "Simulations completed.")
 
         return run_context
 
+    def checkpointPath(self):
+        """ @rtype: str """
+        return os.path.join(self.ert().getMountPoint(), RunCheckpoint.FILE_NAME)
+
+    def restoreCheckpoint(self, arguments, checkpoint_path):
+        """
+        Loads the checkpoint of an interrupted run and restores the active
+        realizations from it. The completed iteration is verified against the
+        state map of the corresponding target case, stepping back if the
+        target case was never populated.
+        @rtype: RunCheckpoint
+        """
+        checkpoint = RunCheckpoint.load(checkpoint_path)
+        if checkpoint is None:
+            raise ErtRunError("Unable to resume: no checkpoint found at '%s'." % checkpoint_path)
+
+        if checkpoint.target_case_format != arguments["target_case"]:
+            raise ErtRunError("Unable to resume: the checkpoint was written for target case format '%s', not '%s'."
+                              % (checkpoint.target_case_format, arguments["target_case"]))
+
+        # The interrupted run may have been in another process, so read the cases from storage again.
+        ERT.case_catalog.invalidate()
+        while checkpoint.iteration >= 0 and not self._isCasePopulated(checkpoint.caseName(checkpoint.iteration + 1)):
+            checkpoint.iteration -= 1
+
+        mask = BoolVector.createFromList(checkpoint.ensemble_size, checkpoint.active_realizations)
+        arguments["active_realizations"] = mask
+        self.initial_realizations_mask = mask
+        return checkpoint
+
+    @staticmethod
+    def _isCasePopulated(case_name):
+        if not caseExists(case_name):
+            return False
+
+        populated = RealizationStateEnum.STATE_INITIALIZED | RealizationStateEnum.STATE_HAS_DATA
+        return any(state in populated for state in getCaseRealizationStates(case_name))
+
     def count_active_realizations(self, run_context):
         return sum(run_context.get_mask( ))
 
@@ -85,34 +146,36 @@ class MultipleDataAssimilation(BaseRunModel):
 
         es_update = self.ert().getESUpdate( )
         es_update.setGlobalStdScaling(weight)
-        success = es_update.smootherUpdate( run_context )
+        with self.traceSpan("smootherUpdate", run_context):
+            success = es_update.smootherUpdate(run_context)
 
         if not success:
             raise UserWarning("Analysis of simulation failed for iteration: %d!" % next_iteration)
 
 
     def _simulateAndPostProcess(self, run_context, arguments):
-        self._job_queue = self._queue_config.create_job_queue( )
+        self._job_queue = self.createJobQueue()
         iteration = run_context.get_iter( )
 
         phase_string = "Running simulation for iteration: %d" % iteration
         self.setPhaseName(phase_string, indeterminate=True)
-        self.ert().getEnkfSimulationRunner().createRunPath(run_context)
+        self.createRunPath(run_context)
 
         phase_string = "Pre processing for iteration: %d" % iteration
         self.setPhaseName(phase_string)
-        self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.PRE_SIMULATION )
+        self.runWorkflows(HookRuntime.PRE_SIMULATION, run_context)
 
         phase_string = "Running forecast for iteration: %d" % iteration
         self.setPhaseName(phase_string, indeterminate=False)
-        num_successful_realizations = self.ert().getEnkfSimulationRunner().runSimpleStep(self._job_queue, run_context)
+        with self.stragglerCutoff(arguments, run_context), self.traceQueue(run_context):
+            num_successful_realizations = self.runSimpleStep(run_context)
 
         num_successful_realizations += arguments.get('prev_successful_realizations', 0)
         self.checkHaveSufficientRealizations(num_successful_realizations)
 
         phase_string = "Post processing for iteration: %d" % iteration
         self.setPhaseName(phase_string, indeterminate=True)
-        self.ert().getEnkfSimulationRunner().runWorkflows(HookRuntime.POST_SIMULATION)
+        self.runWorkflows(HookRuntime.POST_SIMULATION, run_context)
         return num_successful_realizations
 
 
@@ -163,7 +226,7 @@ class MultipleDataAssimilation(BaseRunModel):
         else:
             target_fs = None
 
-        if prior_context is None:
+        if prior_context is None and itr == 0:
             mask = arguments["active_realizations"]
         else:
             state = RealizationStateEnum.STATE_HAS_DATA | RealizationStateEnum.STATE_INITIALIZED
@@ -0,0 +1,88 @@
+#  Copyright (C) 2019 Equinor ASA, Norway.
+#
+#  This file is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+import json
+import sys
+import time
+from threading import Thread, Event
+
+
+class ProgressReporter(Thread):
+    """
+    Writes the progress of a run model as JSON lines, one "progress" record
+    every interval seconds and a "finished" record when stopped. The records
+    are built from BaseRunModel.getProgressSnapshot(), which only looks at
+    the queue states, and list the realizations which have completed since
+    the previous record. Without a path the records go to stderr, so they
+    are not mixed with the messages the run prints to stdout.
+    """
+    DEFAULT_INTERVAL = 5.0
+    FORMATS = ["jsonl"]
+
+    def __init__(self, model, path=None, interval=DEFAULT_INTERVAL):
+        super(ProgressReporter, self).__init__(name="ert_gui_progress_reporter")
+        self.daemon = True
+        self._model = model
+        self._path = path
+        self._interval = interval
+        self._stop_event = Event()
+        self._output = None
+        self._start_time = None
+        self._reported_realizations = set()
+
+    def _write(self, record):
+        self._output.write(json.dumps(record, sort_keys=True) + "\n")
+        self._output.flush()
+
+    def record(self, event="progress"):
+        """ @rtype: dict """
+        snapshot = self._model.getProgressSnapshot()
+        iteration = snapshot["iteration"]
+
+        completed = []
+        for iens in snapshot.pop("successful_realizations"):
+            if (iteration, iens) not in self._reported_realizations:
+                self._reported_realizations.add((iteration, iens))
+                completed.append(iens)
+
+        snapshot["event"] = event
+        snapshot["time"] = time.time()
+        snapshot["elapsed"] = snapshot["time"] - self._start_time
+        snapshot["completed_realizations"] = completed
+        snapshot["completed_count"] = sum(1 for reported_iteration, _ in self._reported_realizations
+                                          if reported_iteration == iteration)
+        return snapshot
+
+    def start(self):
+        self._start_time = time.time()
+        self._output = sys.stderr if self._path is None else open(self._path, "w")
+        super(ProgressReporter, self).start()
+
+    def run(self):
+        while not self._stop_event.wait(self._interval):
+            self._write(self.record())
+
+    def stop(self, error=None):
+        self._stop_event.set()
+        self.join()
+
+        record = self.record(event="finished")
+        if error is not None:
+            record["failed"] = True
+            record["error"] = error
+        self._write(record)
+
+        if self._output is not sys.stderr:
+            self._output.close()
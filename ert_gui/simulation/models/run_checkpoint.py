@@ -0,0 +1,76 @@
+#  Copyright (C) 2019 Equinor ASA, Norway.
+#
+#  This file is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+import json
+import os
+
+
+class RunCheckpoint(object):
+    """
+    Records how far a multi-iteration run has progressed. The checkpoint is
+    written after every completed simulate and update step, so that an
+    interrupted run can continue from the last finished iteration.
+    """
+    FILE_NAME = "es_mda_checkpoint.json"
+
+    def __init__(self, target_case_format, weights, ensemble_size, active_realizations, iteration=-1):
+        super(RunCheckpoint, self).__init__()
+        self.target_case_format = target_case_format
+        self.weights = list(weights)
+        self.ensemble_size = ensemble_size
+        self.active_realizations = list(active_realizations)
+        self.iteration = iteration
+
+    def caseName(self, iteration):
+        """ @rtype: str """
+        return self.target_case_format % iteration
+
+    def caseNames(self):
+        """ @rtype: list[str] """
+        return [self.caseName(iteration) for iteration in range(self.iteration + 2)]
+
+    def save(self, path):
+        data = {"target_case_format": self.target_case_format,
+                "weights": self.weights,
+                "ensemble_size": self.ensemble_size,
+                "active_realizations": self.active_realizations,
+                "iteration": self.iteration,
+                "case_names": self.caseNames()}
+
+        # Write to a temporary file first so a crash never leaves a truncated checkpoint behind.
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.rename(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """ @rtype: RunCheckpoint or None """
+        if not os.path.isfile(path):
+            return None
+
+        with open(path) as f:
+            data = json.load(f)
+
+        return cls(str(data["target_case_format"]),
+                   data["weights"],
+                   data["ensemble_size"],
+                   data["active_realizations"],
+                   iteration=data["iteration"])
+
+    @staticmethod
+    def remove(path):
+        if os.path.isfile(path):
+            os.remove(path)
@@ -0,0 +1,146 @@
+#  Copyright (C) 2019 Equinor ASA, Norway.
+#
+#  This file is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+import json
+import os
+import time
+from contextlib import contextmanager
+from threading import Thread, Event, Lock
+
+from res.job_queue import JobStatusType
+
+from ert_gui.simulation.models.fake_job_queue import queueIndex
+
+
+class RunTrace(object):
+    """
+    Collects timed spans for the phases of a run and writes them in the
+    Chrome Trace Event format, which can be opened in chrome://tracing or
+    any compatible trace viewer. The run model phases are recorded on
+    thread 0, each realization gets its own thread for its queue states.
+    """
+    PHASE_THREAD = 0
+
+    def __init__(self):
+        super(RunTrace, self).__init__()
+        self._pid = os.getpid()
+        self._lock = Lock()
+        self._events = []
+        self._thread_names = {}
+        self.setThreadName(RunTrace.PHASE_THREAD, "Run model")
+
+    def setThreadName(self, tid, name):
+        with self._lock:
+            self._thread_names[tid] = name
+
+    def addSpan(self, name, category, start_time, end_time, tid=PHASE_THREAD, args=None):
+        """ Start and end times are in seconds since the epoch. """
+        event = {"name": name,
+                 "cat": category,
+                 "ph": "X",
+                 "ts": int(start_time * 1e6),
+                 "dur": int((end_time - start_time) * 1e6),
+                 "pid": self._pid,
+                 "tid": tid,
+                 "args": args or {}}
+
+        with self._lock:
+            self._events.append(event)
+
+    @contextmanager
+    def span(self, name, category="phase", **args):
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            self.addSpan(name, category, start_time, time.time(), args=args)
+
+    def events(self):
+        """ @rtype: list[dict] """
+        with self._lock:
+            metadata = [{"name": "thread_name",
+                         "ph": "M",
+                         "pid": self._pid,
+                         "tid": tid,
+                         "args": {"name": name}} for tid, name in sorted(self._thread_names.items())]
+            return metadata + list(self._events)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, f)
+
+
+class QueueTracer(Thread):
+    """
+    Polls the job queue while a simulation step runs and records, for every
+    realization, how long it spent in each queue state. The time spent in
+    the done callback is where the results are loaded.
+    """
+    POLL_INTERVAL = 1.0
+
+    FINAL_STATES = (JobStatusType.JOB_QUEUE_NOT_ACTIVE | JobStatusType.JOB_QUEUE_SUCCESS |
+                    JobStatusType.JOB_QUEUE_FAILED | JobStatusType.JOB_QUEUE_IS_KILLED)
+
+    def __init__(self, trace, job_queue, run_context):
+        super(QueueTracer, self).__init__(name="ert_gui_queue_tracer")
+        self.daemon = True
+        self._trace = trace
+        self._job_queue = job_queue
+        self._run_context = run_context
+        self._stop_event = Event()
+        self._current_states = {}
+        self._spans = []
+
+    def _poll(self):
+        now = time.time()
+        for queue_index in range(len(self._job_queue)):
+            status = self._job_queue.getJobStatus(queue_index)
+            current = self._current_states.get(queue_index)
+            if current is not None and current[0] == status:
+                continue
+
+            if current is not None:
+                self._spans.append((queue_index, current[0], current[1], now))
+            self._current_states[queue_index] = (status, now)
+
+    def run(self):
+        while not self._stop_event.wait(QueueTracer.POLL_INTERVAL):
+            self._poll()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self._poll()
+
+        realizations = {}
+        for run_arg in self._run_context:
+            if not run_arg:
+                continue
+            try:
+                realizations[queueIndex(self._job_queue, run_arg)] = run_arg.iens
+            except ValueError:
+                continue
+
+        iteration = self._run_context.get_iter()
+        for queue_index, status, start_time, end_time in self._spans:
+            if status in QueueTracer.FINAL_STATES:
+                continue
+
+            iens = realizations.get(queue_index, queue_index)
+            tid = iens + 1
+            self._trace.setThreadName(tid, "Realization %d" % iens)
+            name = str(status).replace("JOB_QUEUE_", "").lower()
+            self._trace.addSpan(name, "queue", start_time, end_time, tid=tid,
+                                args={"iteration": iteration, "realization": iens})
@@ -1,6 +1,6 @@
 
 from ert_gui.simulation.models import BaseRunModel, ErtRunError, EnsembleExperiment
-from ert_gui.ertwidgets.models.ertmodel import getRealizationCount, getRunPath, getQueueConfig
+from ert_gui.ert_queries import getRealizationCount, getRunPath, getQueueConfig
 
 class SingleTestRun(EnsembleExperiment):
 
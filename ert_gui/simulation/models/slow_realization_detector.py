@@ -0,0 +1,116 @@
+#  Copyright (C) 2019 Equinor ASA, Norway.
+#
+#  This file is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+import datetime
+import time
+
+
+def jobTimestamp(value):
+    """
+    Converts a forward model job start or end time to seconds since the epoch.
+    @rtype: float or None
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, datetime.datetime):
+        return time.mktime(value.timetuple())
+
+    return float(value)
+
+
+def realizationStartTime(jobs):
+    """ @rtype: float or None """
+    start_times = [jobTimestamp(job.start_time) for job in jobs if job.start_time is not None]
+    return min(start_times) if start_times else None
+
+
+def realizationRuntime(jobs):
+    """
+    Runtime in seconds of a realization whose forward model has completed successfully.
+    @rtype: float or None
+    """
+    if not jobs or any(job.status != "Success" for job in jobs):
+        return None
+
+    start_time = realizationStartTime(jobs)
+    end_times = [jobTimestamp(job.end_time) for job in jobs if job.end_time is not None]
+    if start_time is None or not end_times:
+        return None
+
+    return max(end_times) - start_time
+
+
+class SlowRealizationDetector(object):
+    """
+    Uses the runtimes of the previous iteration to predict how long each
+    realization should run, and flags running realizations which are far
+    past the prediction. A realization's own previous runtime is used when
+    known, otherwise the median runtime of the previous iteration.
+    """
+    DEFAULT_FACTOR = 2.0
+
+    def __init__(self, factor=DEFAULT_FACTOR):
+        super(SlowRealizationDetector, self).__init__()
+        self._factor = factor
+        self._runtimes = {}
+        self._median_runtime = None
+
+    def recordIteration(self, progress):
+        """ @type progress: dict[int, (list, JobStatusType)] """
+        self._runtimes = {}
+        for iens, (jobs, _) in progress.items():
+            runtime = realizationRuntime(jobs)
+            if runtime is not None:
+                self._runtimes[iens] = runtime
+
+        runtimes = sorted(self._runtimes.values())
+        if runtimes:
+            middle = len(runtimes) // 2
+            if len(runtimes) % 2 == 1:
+                self._median_runtime = runtimes[middle]
+            else:
+                self._median_runtime = (runtimes[middle - 1] + runtimes[middle]) / 2.0
+        else:
+            self._median_runtime = None
+
+    def expectedRuntime(self, iens):
+        """ @rtype: float or None """
+        return self._runtimes.get(iens, self._median_runtime)
+
+    def detect(self, progress, now=None):
+        """
+        Returns the realizations in progress which have been running for more
+        than factor times their expected runtime.
+        @type progress: dict[int, (list, JobStatusType)]
+        @rtype: list[int]
+        """
+        if now is None:
+            now = time.time()
+
+        slow_realizations = []
+        for iens, (jobs, _) in sorted(progress.items()):
+            if not any(job.status == "Running" for job in jobs):
+                continue
+
+            expected_runtime = self.expectedRuntime(iens)
+            start_time = realizationStartTime(jobs)
+            if expected_runtime is None or start_time is None:
+                continue
+
+            if now - start_time > self._factor * expected_runtime:
+                slow_realizations.append(iens)
+
+        return slow_realizations
@@ -0,0 +1,117 @@
+#  Copyright (C) 2019 Equinor ASA, Norway.
+#
+#  This file is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+import math
+import time
+from threading import Thread, Event
+
+from res.job_queue import JobStatusType
+
+
+class StragglerPolicy(object):
+    """
+    Cut-off policy for slow realizations: once the number of successful
+    realizations reaches the threshold, the remaining jobs are given
+    grace_time seconds to finish before they are killed.
+    """
+    DEFAULT_GRACE_TIME = 60
+
+    def __init__(self, threshold, grace_time=DEFAULT_GRACE_TIME):
+        """
+        @type threshold: str
+        @type grace_time: int
+        """
+        super(StragglerPolicy, self).__init__()
+        self.threshold = threshold.strip()
+        self.grace_time = grace_time
+
+    def successThreshold(self, active_count):
+        """
+        Absolute number of successful realizations needed before the cut-off starts.
+        @rtype: int
+        """
+        if self.threshold.endswith("%"):
+            fraction = float(self.threshold[:-1]) * 0.01
+            return int(math.ceil(fraction * active_count))
+
+        return min(int(self.threshold), active_count)
+
+    @classmethod
+    def fromArguments(cls, arguments):
+        """ @rtype: StragglerPolicy or None """
+        threshold = arguments.get("straggler_threshold")
+        if not threshold:
+            return None
+
+        grace_time = arguments.get("straggler_grace_time")
+        if grace_time is None:
+            grace_time = cls.DEFAULT_GRACE_TIME
+
+        return cls(threshold, int(grace_time))
+
+
+class StragglerMonitor(Thread):
+    """
+    Watches a running job queue and applies a StragglerPolicy to it. The
+    sufficient callable is consulted with the success count so the cut-off
+    never starts before MIN_REALIZATIONS is satisfied.
+    """
+    POLL_INTERVAL = 1.0
+
+    UNFINISHED_STATES = (JobStatusType.JOB_QUEUE_NOT_ACTIVE | JobStatusType.JOB_QUEUE_WAITING |
+                         JobStatusType.JOB_QUEUE_SUBMITTED | JobStatusType.JOB_QUEUE_PENDING |
+                         JobStatusType.JOB_QUEUE_RUNNING | JobStatusType.JOB_QUEUE_UNKNOWN)
+
+    def __init__(self, job_queue, policy, active_count, sufficient):
+        super(StragglerMonitor, self).__init__(name="ert_gui_straggler_monitor")
+        self.daemon = True
+        self._job_queue = job_queue
+        self._policy = policy
+        self._threshold = policy.successThreshold(active_count)
+        self._sufficient = sufficient
+        self._stop_event = Event()
+        self.killed_count = 0
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def _successCount(self):
+        success_count = 0
+        for queue_index in range(len(self._job_queue)):
+            if self._job_queue.getJobStatus(queue_index) == JobStatusType.JOB_QUEUE_SUCCESS:
+                success_count += 1
+        return success_count
+
+    def _killRemaining(self):
+        for queue_index in range(len(self._job_queue)):
+            if self._job_queue.getJobStatus(queue_index) in StragglerMonitor.UNFINISHED_STATES:
+                if self._job_queue.kill_job(queue_index):
+                    self.killed_count += 1
+
+    def run(self):
+        cutoff_time = None
+        while not self._stop_event.wait(StragglerMonitor.POLL_INTERVAL):
+            if cutoff_time is None:
+                success_count = self._successCount()
+                if success_count >= self._threshold and self._sufficient(success_count):
+                    print("%d realizations have succeeded, remaining realizations will be stopped in %d seconds"
+                          % (success_count, self._policy.grace_time))
+                    cutoff_time = time.time() + self._policy.grace_time
+
+            elif time.time() >= cutoff_time:
+                self._killRemaining()
+                print("Stopped %d long running realizations" % self.killed_count)
+                return
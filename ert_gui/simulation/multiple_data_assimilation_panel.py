@@ -17,9 +17,9 @@
 import sys
 
 try:
-  from PyQt4.QtGui import QFormLayout, QLabel
+  from PyQt4.QtGui import QFormLayout, QLabel, QCheckBox
 except ImportError:
-  from PyQt5.QtWidgets import QFormLayout, QLabel
+  from PyQt5.QtWidgets import QFormLayout, QLabel, QCheckBox
 
 from ert_gui.ertwidgets import addHelpToWidget, CaseSelector, ActiveLabel, AnalysisModuleSelector
 from ert_gui.ertwidgets.models.activerealizationsmodel import ActiveRealizationsModel
@@ -28,7 +28,7 @@ from ert_gui.ertwidgets.models.targetcasemodel import TargetCaseModel
 from ert_gui.ertwidgets.models.valuemodel import ValueModel
 from ert_gui.ertwidgets.stringbox import StringBox
 from ert_gui.ide.keywords.definitions import NumberListStringArgument, RangeStringArgument, ProperNameFormatArgument
-from ert_gui.simulation import SimulationConfigPanel
+from ert_gui.simulation.simulation_config_panel import SimulationConfigPanel
 from ert_gui.simulation.models import MultipleDataAssimilation
 
 
@@ -66,6 +66,12 @@ class MultipleDataAssimilationPanel(SimulationConfigPanel):
         self._active_realizations_field.setValidator(RangeStringArgument(getRealizationCount()))
         layout.addRow("Active realizations", self._active_realizations_field)
 
+        self._resume_checkbox = QCheckBox()
+        self._resume_checkbox.setToolTip("Continue an interrupted run from the last completed iteration.")
+        layout.addRow("Resume from checkpoint:", self._resume_checkbox)
+
+        self.addStragglerPolicyFields(layout)
+        self.addSlowRealizationField(layout)
 
         self._target_case_format_field.getValidationSupport().validationChanged.connect(self.simulationConfigurationChanged)
         self._active_realizations_field.getValidationSupport().validationChanged.connect(self.simulationConfigurationChanged)
@@ -100,15 +106,19 @@ class MultipleDataAssimilationPanel(SimulationConfigPanel):
         updateVisualizationOfNormalizedWeights() # To normalize the default weights
 
     def isConfigurationValid(self):
-        return self._target_case_format_field.isValid() and self._active_realizations_field.isValid() and self._relative_iteration_weights_box.isValid()
+        return self._target_case_format_field.isValid() and self._active_realizations_field.isValid() and self._relative_iteration_weights_box.isValid() \
+               and self.isStragglerPolicyValid()
 
 
     def getSimulationArguments(self):
         arguments = {"active_realizations": self._active_realizations_model.getActiveRealizationsMask(),
                      "target_case": self._target_case_format_model.getValue(),
                      "analysis_module": self._analysis_module_selector.getSelectedAnalysisModuleName(),
-                     "weights": self.weights
+                     "weights": self.weights,
+                     "resume": self._resume_checkbox.isChecked()
                      }
+        arguments.update(self.getStragglerPolicyArguments())
+        arguments.update(self.getSlowRealizationArguments())
         return arguments
 
 
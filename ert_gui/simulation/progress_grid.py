@@ -0,0 +1,153 @@
+import math
+
+import numpy
+
+from res.job_queue import JobStatusType
+
+
+class ProgressGrid(object):
+    """
+    Realization x job status grid backing the DetailedProgress view. Job
+    states are stored as uint8 codes which index a colour table, with 0
+    meaning no job, so the whole grid can be turned into an indexed image
+    in one operation. Updates only touch the realizations which changed.
+    """
+    JOB_STATES = ["Waiting", "Pending", "Running", "Success", "Failure", "Unknown"]
+    STATE_CODES = {state: code + 1 for code, state in enumerate(JOB_STATES)}
+    NO_JOB = 0
+
+    REALIZATION_MISSING = 0
+    REALIZATION_IDLE = 1
+    REALIZATION_RUNNING = 2
+    REALIZATION_FAILED = 3
+
+    def __init__(self):
+        super(ProgressGrid, self).__init__()
+        self._job_states = numpy.zeros((0, 0), dtype=numpy.uint8)
+        self._realization_states = numpy.zeros(0, dtype=numpy.uint8)
+        self._rows = {}
+        self._version = 0
+
+    @classmethod
+    def stateCode(cls, status):
+        """ @rtype: int """
+        return cls.STATE_CODES.get(status, cls.STATE_CODES["Unknown"])
+
+    @classmethod
+    def colorTable(cls, state_colors):
+        """
+        The colours for the job state codes as (r, g, b, a) tuples, the first
+        entry is the transparent colour of cells without a job.
+        @rtype: list[tuple]
+        """
+        table = [(0, 0, 0, 0)]
+        for state in cls.JOB_STATES:
+            color = tuple(state_colors.get(state, state_colors.get("Unknown", (128, 128, 128))))
+            if len(color) == 3:
+                color += (255,)
+            table.append(color)
+        return table
+
+    def realizationCount(self):
+        """ @rtype: int """
+        return len(self._realization_states)
+
+    def jobCount(self):
+        """ @rtype: int """
+        return self._job_states.shape[1]
+
+    def version(self):
+        """ Incremented on every change, so views know when to rebuild their image. """
+        return self._version
+
+    def jobStates(self):
+        """ @rtype: numpy.ndarray """
+        return self._job_states
+
+    def realizationState(self, iens):
+        """ @rtype: int """
+        if iens >= self.realizationCount():
+            return ProgressGrid.REALIZATION_MISSING
+        return int(self._realization_states[iens])
+
+    def _resize(self, realization_count, job_count):
+        old_realizations, old_jobs = self._job_states.shape
+        if realization_count <= old_realizations and job_count <= old_jobs:
+            return
+
+        realization_count = max(realization_count, old_realizations)
+        job_count = max(job_count, old_jobs)
+
+        job_states = numpy.zeros((realization_count, job_count), dtype=numpy.uint8)
+        job_states[:old_realizations, :old_jobs] = self._job_states
+        self._job_states = job_states
+
+        realization_states = numpy.zeros(realization_count, dtype=numpy.uint8)
+        realization_states[:old_realizations] = self._realization_states
+        self._realization_states = realization_states
+
+    def update(self, progress):
+        """
+        Updates the grid from the detailed progress of an iteration and
+        returns the realizations whose state changed.
+        @type progress: dict[int, (list, JobStatusType)]
+        @rtype: list[int]
+        """
+        if not progress:
+            return []
+
+        self._resize(max(progress) + 1, max(len(jobs) for jobs, _ in progress.values()))
+
+        state_code = ProgressGrid.stateCode
+        changed = []
+        for iens, (jobs, queue_status) in progress.items():
+            row = tuple(state_code(job.status) for job in jobs)
+
+            if ProgressGrid.STATE_CODES["Failure"] in row:
+                realization_state = ProgressGrid.REALIZATION_FAILED
+            elif queue_status == JobStatusType.JOB_QUEUE_RUNNING:
+                realization_state = ProgressGrid.REALIZATION_RUNNING
+            else:
+                realization_state = ProgressGrid.REALIZATION_IDLE
+
+            if row != self._rows.get(iens) or realization_state != self._realization_states[iens]:
+                self._rows[iens] = row
+                self._job_states[iens, :len(row)] = row
+                self._job_states[iens, len(row):] = ProgressGrid.NO_JOB
+                self._realization_states[iens] = realization_state
+                changed.append(iens)
+
+        if changed:
+            self._version += 1
+
+        return sorted(changed)
+
+    def layout(self, aspect_ratio):
+        """
+        Number of realization cells horizontally and vertically, and the
+        side of the square sub grid holding the jobs of one realization.
+        @rtype: (int, int, int)
+        """
+        realization_count = max(self.realizationCount(), 1)
+        grid_height = int(math.ceil(math.sqrt(realization_count / aspect_ratio)))
+        grid_width = int(math.ceil(grid_height * aspect_ratio))
+        sub_grid_size = int(math.ceil(math.sqrt(max(self.jobCount(), 1))))
+        return grid_width, grid_height, sub_grid_size
+
+    def pixels(self, grid_width, grid_height, sub_grid_size):
+        """
+        The job state codes laid out as an image: realization iens occupies
+        cell (iens % grid_width, iens / grid_width) and its jobs fill the
+        cell's sub grid row by row.
+        @rtype: numpy.ndarray
+        """
+        cell_count = grid_width * grid_height
+        sub_cell_count = sub_grid_size * sub_grid_size
+
+        cells = numpy.zeros((cell_count, sub_cell_count), dtype=numpy.uint8)
+        realization_count = min(self.realizationCount(), cell_count)
+        cells[:realization_count, :self.jobCount()] = self._job_states[:realization_count]
+
+        cells = cells.reshape(grid_height, grid_width, sub_grid_size, sub_grid_size)
+        return numpy.ascontiguousarray(cells.transpose(0, 2, 1, 3).reshape(grid_height * sub_grid_size,
+                                                                           grid_width * sub_grid_size))
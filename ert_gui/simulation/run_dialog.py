@@ -30,7 +30,10 @@ except ImportError:
 
 
 from ert_gui.ertwidgets import resourceMovie, Legend
-from ert_gui.simulation import Progress, SimpleProgress, DetailedProgressWidget
+from ert_gui.simulation.progress import Progress
+from ert_gui.simulation.simple_progress import SimpleProgress
+from ert_gui.simulation.detailed_progress import DetailedProgressWidget
+from ert_gui.simulation.job_statistics_widget import JobStatisticsWidget
 from ert_gui.simulation.models import BaseRunModel, SimulationsTracker
 from ert_gui.tools.plot.plot_tool import PlotTool
 from res.job_queue import JobStatusType
@@ -85,6 +88,7 @@ class RunDialog(QDialog):
         legend_widget_container.setLayout(legend_layout)
 
         self.running_time = QLabel("")
+        self.slow_realizations = QLabel("")
 
         self.plot_tool = PlotTool()
         self.plot_tool.setParent(None)
@@ -114,6 +118,7 @@ class RunDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addWidget(self.processing_animation)
         button_layout.addWidget(self.running_time)
+        button_layout.addWidget(self.slow_realizations)
         button_layout.addStretch()
         button_layout.addWidget(self.show_details_button)
         button_layout.addWidget(self.plot_button)
@@ -125,6 +130,8 @@ class RunDialog(QDialog):
 
         self.detailed_progress = DetailedProgressWidget(self, self.state_colors)
         self.detailed_progress.setVisible(False)
+        self.job_statistics = JobStatisticsWidget()
+        self.job_statistics.setVisible(False)
         self.dummy_widget_container = QWidget() #Used to keep the other widgets from stretching
 
         layout = QVBoxLayout()
@@ -133,6 +140,7 @@ class RunDialog(QDialog):
         layout.addWidget(self.progress)
         layout.addWidget(legend_widget_container)
         layout.addWidget(self.detailed_progress)
+        layout.addWidget(self.job_statistics)
         layout.addWidget(self.dummy_widget_container)
         layout.addWidget(button_widget_container)
 
@@ -141,8 +149,9 @@ class RunDialog(QDialog):
         layout.setStretch(2, 0)
         layout.setStretch(3, 0)
         layout.setStretch(4, 1)
-        layout.setStretch(5, 1)
-        layout.setStretch(6, 0)
+        layout.setStretch(5, 0)
+        layout.setStretch(6, 1)
+        layout.setStretch(7, 0)
 
         self.setLayout(layout)
 
@@ -218,6 +227,7 @@ class RunDialog(QDialog):
         if self.checkIfRunFinished():
             self.total_progress.setProgress(self._run_model.getProgress())
             self.detailed_progress.set_progress(*self._run_model.getDetailedProgress())
+            self.updateJobStatistics()
             self.updateProgress()
             return
 
@@ -237,10 +247,26 @@ class RunDialog(QDialog):
 
             self.progress.setIndeterminate(False)
             self.updateProgress()
+            self.updateJobStatistics()
+            self.setSlowRealizations()
 
         self.setRunningTime()
 
 
+    def updateJobStatistics(self):
+        if self.job_statistics.isVisible():
+            self.job_statistics.set_statistics(self._run_model.getJobStatistics())
+
+
+    def setSlowRealizations(self):
+        slow_realizations = self._run_model.getSlowRealizations()
+        if slow_realizations:
+            realizations = ", ".join(str(iens) for iens in slow_realizations)
+            self.slow_realizations.setText("Slow realizations: %s" % realizations)
+        else:
+            self.slow_realizations.setText("")
+
+
     def setRunningTime(self):
         days = 0
         hours = 0
@@ -343,5 +369,7 @@ class RunDialog(QDialog):
     def toggle_detailed_progress(self):
 
         self.detailed_progress.setVisible(not(self.detailed_progress.isVisible()))
+        self.job_statistics.setVisible(self.detailed_progress.isVisible())
+        self.updateJobStatistics()
         self.dummy_widget_container.setVisible(not(self.detailed_progress.isVisible()))
         self.adjustSize()
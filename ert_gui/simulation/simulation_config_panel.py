@@ -2,10 +2,15 @@ import sys
 
 try:
   from PyQt4.QtCore import pyqtSignal
-  from PyQt4.QtGui import QWidget
+  from PyQt4.QtGui import QWidget, QCheckBox
 except ImportError:
   from PyQt5.QtCore import pyqtSignal
-  from PyQt5.QtWidgets import QWidget
+  from PyQt5.QtWidgets import QWidget, QCheckBox
+
+from ert_gui.ertwidgets.models.valuemodel import ValueModel
+from ert_gui.ertwidgets.stringbox import StringBox
+from ert_gui.ide.keywords.definitions import IntegerArgument, RealizationThresholdArgument
+from ert_gui.simulation.models import StragglerPolicy, SlowRealizationDetector
 
 
 class SimulationConfigPanel(QWidget):
@@ -17,6 +22,9 @@ class SimulationConfigPanel(QWidget):
         self.setContentsMargins(10, 10, 10, 10)
         self.__simulation_model = simulation_model
         self._advanced_option = advanced_option
+        self._straggler_threshold_field = None
+        self._straggler_grace_time_field = None
+        self._slow_realizations_checkbox = None
 
     @property
     def is_advanced_option(self):
@@ -34,3 +42,44 @@ class SimulationConfigPanel(QWidget):
     def getSimulationArguments(self):
         """" @rtype: dict[str, object]"""
         return {}
+
+    def addStragglerPolicyFields(self, layout):
+        """ Adds the optional straggler cut-off fields to a QFormLayout """
+        self._straggler_threshold_model = ValueModel(None)
+        self._straggler_threshold_field = StringBox(self._straggler_threshold_model, "config/simulation/straggler_threshold")
+        self._straggler_threshold_field.setValidator(RealizationThresholdArgument(optional=True))
+        layout.addRow("Stop stragglers after:", self._straggler_threshold_field)
+
+        self._straggler_grace_time_model = ValueModel(str(StragglerPolicy.DEFAULT_GRACE_TIME))
+        self._straggler_grace_time_field = StringBox(self._straggler_grace_time_model, "config/simulation/straggler_grace_time")
+        self._straggler_grace_time_field.setValidator(IntegerArgument(from_value=0))
+        layout.addRow("Straggler grace time (s):", self._straggler_grace_time_field)
+
+        self._straggler_threshold_field.getValidationSupport().validationChanged.connect(self.simulationConfigurationChanged)
+        self._straggler_grace_time_field.getValidationSupport().validationChanged.connect(self.simulationConfigurationChanged)
+
+    def isStragglerPolicyValid(self):
+        if self._straggler_threshold_field is None:
+            return True
+        return self._straggler_threshold_field.isValid() and self._straggler_grace_time_field.isValid()
+
+    def getStragglerPolicyArguments(self):
+        """ @rtype: dict[str, object] """
+        if self._straggler_threshold_field is None:
+            return {}
+
+        return {"straggler_threshold": self._straggler_threshold_model.getValue(),
+                "straggler_grace_time": self._straggler_grace_time_model.getValue()}
+
+    def addSlowRealizationField(self, layout):
+        """ Adds the optional slow realization detection field to a QFormLayout """
+        self._slow_realizations_checkbox = QCheckBox()
+        self._slow_realizations_checkbox.setToolTip("Report realizations running more than %g times longer than in the previous iteration."
+                                                    % SlowRealizationDetector.DEFAULT_FACTOR)
+        layout.addRow("Flag slow realizations:", self._slow_realizations_checkbox)
+
+    def getSlowRealizationArguments(self):
+        """ @rtype: dict[str, object] """
+        if self._slow_realizations_checkbox is None or not self._slow_realizations_checkbox.isChecked():
+            return {}
+        return {"slow_realization_factor": SlowRealizationDetector.DEFAULT_FACTOR}
@@ -18,10 +18,13 @@ from ErtQt.Qt import (
 from ert_gui import ERT
 from ert_gui.ertwidgets import addHelpToWidget, resourceIcon
 from ert_gui.ertwidgets.models.ertmodel import getCurrentCaseName
-from ert_gui.simulation import EnsembleExperimentPanel, EnsembleSmootherPanel
-from ert_gui.simulation import SingleTestRunPanel
-from ert_gui.simulation import IteratedEnsembleSmootherPanel, MultipleDataAssimilationPanel, SimulationConfigPanel
-from ert_gui.simulation import RunDialog
+from ert_gui.simulation.ensemble_experiment_panel import EnsembleExperimentPanel
+from ert_gui.simulation.ensemble_smoother_panel import EnsembleSmootherPanel
+from ert_gui.simulation.single_test_run_panel import SingleTestRunPanel
+from ert_gui.simulation.iterated_ensemble_smoother_panel import IteratedEnsembleSmootherPanel
+from ert_gui.simulation.multiple_data_assimilation_panel import MultipleDataAssimilationPanel
+from ert_gui.simulation.simulation_config_panel import SimulationConfigPanel
+from ert_gui.simulation.run_dialog import RunDialog
 from collections import OrderedDict
 
 class SimulationPanel(QWidget):
@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+ENVIRONMENT_VARIABLE = "ERT_STARTUP_TRACE"
+
+
+class StartupTrace(object):
+    """
+    Records the wall time of the phases of the GUI startup. The report is
+    written by finish(), to stderr when the destination is "-" and to a
+    file otherwise. Without a destination nothing is written.
+    """
+
+    def __init__(self, destination=None):
+        super(StartupTrace, self).__init__()
+        self._destination = destination
+        self._phases = []
+        self._finished = False
+
+    @classmethod
+    def fromEnvironment(cls):
+        """
+        A trace writing to the file named by ERT_STARTUP_TRACE, or to
+        stderr if the value is 1.
+        @rtype: StartupTrace
+        """
+        value = os.getenv(ENVIRONMENT_VARIABLE)
+        if not value or value == "0":
+            return cls()
+        if value == "1":
+            return cls("-")
+        return cls(os.path.abspath(value))
+
+    def isEnabled(self):
+        return self._destination is not None
+
+    def addPhase(self, name, start_time, end_time):
+        self._phases.append((name, start_time, end_time - start_time))
+
+    @contextmanager
+    def phase(self, name):
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            self.addPhase(name, start_time, time.time())
+
+    def phases(self):
+        """ @rtype: list[(str, float, float)]: name, start time and duration """
+        return list(self._phases)
+
+    def report(self):
+        """ @rtype: str """
+        if not self._phases:
+            return "No startup phases recorded\n"
+
+        start_time = min(start for _, start, _ in self._phases)
+        end_time = max(start + duration for _, start, duration in self._phases)
+
+        lines = ["%-30s %10s %10s" % ("Phase", "Start", "Duration")]
+        for name, start, duration in self._phases:
+            lines.append("%-30s %9.3fs %9.3fs" % (name, start - start_time, duration))
+        lines.append("%-30s %10s %9.3fs" % ("Total", "", end_time - start_time))
+        return "\n".join(lines) + "\n"
+
+    def finish(self):
+        if self._finished or self._destination is None:
+            return
+        self._finished = True
+
+        if self._destination == "-":
+            sys.stderr.write(self.report())
+        else:
+            with open(self._destination, "w") as f:
+                f.write(self.report())
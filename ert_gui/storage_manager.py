@@ -0,0 +1,140 @@
+import os
+import shutil
+import tarfile
+from multiprocessing.pool import ThreadPool
+
+
+class CaseUsage(object):
+    """ The disk usage of one case, in total and by node type. """
+
+    def __init__(self, name, path):
+        super(CaseUsage, self).__init__()
+        self.name = name
+        self.path = path
+        self.total = 0
+        self.file_count = 0
+        self.by_type = {}
+
+    def add(self, node_type, size):
+        self.total += size
+        self.file_count += 1
+        self.by_type[node_type] = self.by_type.get(node_type, 0) + size
+
+
+class StorageManager(object):
+    """
+    Reports how much disk space the cases in storage use, and deletes or
+    archives cases. The cases are scanned by a pool of threads. Block
+    files in the mod_<n> directories of a case are counted by their node
+    type, e.g. PARAMETER or DYNAMIC_FORECAST, everything else as METADATA.
+
+    A case is only removed when it is not running, not the current case
+    and not mounted by ERT.
+    """
+    DEFAULT_WORKERS = 4
+    METADATA = "METADATA"
+    ARCHIVE_EXTENSION = ".tar.gz"
+
+    def __init__(self, ert, workers=DEFAULT_WORKERS):
+        super(StorageManager, self).__init__()
+        self._ert = ert
+        self._workers = max(1, workers)
+
+    def storageRoot(self):
+        """ @rtype: str """
+        return os.path.abspath(self._ert.getModelConfig().getEnspath())
+
+    def casePath(self, case_name):
+        """ @rtype: str """
+        return os.path.join(self.storageRoot(), case_name)
+
+    def caseNames(self):
+        """ @rtype: list[str]: all cases in storage, including the hidden ones """
+        return [str(case) for case in self._ert.getEnkfFsManager().getCaseList()]
+
+    @staticmethod
+    def nodeType(relative_path):
+        """ @rtype: str: the node type of a file in a case directory """
+        directory, filename = os.path.split(relative_path)
+        if os.path.basename(directory).startswith("mod_"):
+            return filename.split(".")[0]
+        return StorageManager.METADATA
+
+    def scanCase(self, case_name):
+        """ @rtype: CaseUsage """
+        usage = CaseUsage(case_name, self.casePath(case_name))
+        for directory, _, filenames in os.walk(usage.path):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                try:
+                    size = os.lstat(path).st_size
+                except OSError:
+                    continue
+                usage.add(self.nodeType(os.path.relpath(path, usage.path)), size)
+        return usage
+
+    def scan(self, case_names=None):
+        """ @rtype: list[CaseUsage]: sorted by decreasing size """
+        if case_names is None:
+            case_names = self.caseNames()
+        if not case_names:
+            return []
+
+        pool = ThreadPool(min(self._workers, len(case_names)))
+        try:
+            usages = pool.map(self.scanCase, case_names)
+        finally:
+            pool.close()
+            pool.join()
+        return sorted(usages, key=lambda usage: (-usage.total, usage.name))
+
+    def removalProblem(self, case_name):
+        """ @rtype: str or None: why the case can not be removed, or None if it can """
+        fs_manager = self._ert.getEnkfFsManager()
+        if case_name not in self.caseNames():
+            return "Case %s does not exist" % case_name
+        if fs_manager.isCaseRunning(case_name):
+            return "Case %s is running" % case_name
+        if str(fs_manager.getCurrentFileSystem().getCaseName()) == case_name:
+            return "Case %s is the current case" % case_name
+        if fs_manager.isCaseMounted(case_name):
+            return "Case %s is in use" % case_name
+        return None
+
+    def _checkRemovable(self, case_name):
+        problem = self.removalProblem(case_name)
+        if problem is not None:
+            raise ValueError(problem)
+
+    def deleteCase(self, case_name):
+        self._checkRemovable(case_name)
+        shutil.rmtree(self.casePath(case_name))
+
+    def archiveCase(self, case_name, archive_directory=None):
+        """
+        Packs the case into a compressed archive and deletes it from
+        storage.
+        @rtype: str: the path of the archive
+        """
+        self._checkRemovable(case_name)
+        archive_directory = archive_directory or self.storageRoot()
+        archive_path = os.path.join(archive_directory, case_name + StorageManager.ARCHIVE_EXTENSION)
+        if os.path.exists(archive_path):
+            raise ValueError("Archive %s already exists" % archive_path)
+
+        temporary_path = archive_path + ".tmp"
+        with tarfile.open(temporary_path, "w:gz") as archive:
+            archive.add(self.casePath(case_name), arcname=case_name)
+        os.rename(temporary_path, archive_path)
+        shutil.rmtree(self.casePath(case_name))
+        return archive_path
+
+    @staticmethod
+    def formatSize(size):
+        """ @rtype: str """
+        if size < 1024:
+            return "%d B" % size
+        for unit in ["KB", "MB", "GB", "TB"]:
+            size /= 1024.0
+            if size < 1024 or unit == "TB":
+                return "%.1f %s" % (size, unit)
@@ -0,0 +1,114 @@
+from threading import Thread, Lock
+
+try:
+    from Queue import Queue, Empty
+except ImportError:
+    from queue import Queue, Empty
+
+
+class TaskProgress(object):
+    """
+    Progress of work running in other threads: the number of items done
+    out of the total, how many of them were skipped because there was
+    nothing to do, and a flag which stops the work when set by cancel().
+    """
+
+    def __init__(self):
+        super(TaskProgress, self).__init__()
+        self._lock = Lock()
+        self._total = 0
+        self._done = 0
+        self._skipped = 0
+        self._cancelled = False
+
+    def start(self, total):
+        with self._lock:
+            self._total = total
+            self._done = 0
+            self._skipped = 0
+
+    def advance(self, count=1):
+        with self._lock:
+            self._done += count
+
+    def skip(self):
+        with self._lock:
+            self._skipped += 1
+
+    def skipped(self):
+        """ @rtype: int """
+        return self._skipped
+
+    def cancel(self):
+        self._cancelled = True
+
+    def isCancelled(self):
+        return self._cancelled
+
+    def done(self):
+        """ @rtype: int """
+        return self._done
+
+    def total(self):
+        """ @rtype: int """
+        return self._total
+
+    def fraction(self):
+        """ @rtype: float """
+        with self._lock:
+            if self._total == 0:
+                return 1.0
+            return float(self._done) / self._total
+
+
+def runTasks(tasks, run_task, progress, workers, name, create_worker_state=lambda: None):
+    """
+    Runs run_task(state, task) for all tasks on a pool of worker threads,
+    named name_<index>, each with its own state from create_worker_state().
+    The progress only needs cancel() and isCancelled(): the workers stop
+    early when it is cancelled, and the first error of a task cancels it
+    and is raised once the workers have stopped.
+    @rtype: int: the sum of the results of run_task, where True counts as one
+    """
+    queue = Queue()
+    for task in tasks:
+        queue.put(task)
+
+    lock = Lock()
+    result = {"count": 0, "error": None}
+
+    def work():
+        state = create_worker_state()
+        while not progress.isCancelled():
+            try:
+                task = queue.get_nowait()
+            except Empty:
+                return
+
+            try:
+                success = run_task(state, task)
+            except Exception as e:
+                with lock:
+                    if result["error"] is None:
+                        result["error"] = e
+                progress.cancel()
+                return
+
+            if success:
+                with lock:
+                    result["count"] += int(success)
+
+    threads = []
+    for index in range(min(max(1, workers), queue.qsize())):
+        thread = Thread(target=work, name="%s_%d" % (name, index))
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+    if result["error"] is not None:
+        raise result["error"]
+
+    return result["count"]
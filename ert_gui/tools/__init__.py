@@ -1,2 +1,3 @@
 from .help_center import HelpCenter
-from .tool import Tool
\ No newline at end of file
+from .tool import Tool
+from .lazy_tool import LazyTool
@@ -0,0 +1,93 @@
+#  Copyright (C) 2019  Equinor ASA, Norway.
+#
+#  The file 'ensemble_array_file.py' is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+from threading import Lock
+
+import numpy
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+
+class EnsembleArrayFile(object):
+    """
+    Writes one keyword for all realizations to a single HDF5 file. The
+    "values" dataset has a realization axis and an index axis. It is
+    chunked by realization and gzip compressed. The "realizations" dataset
+    holds the realization number of each row and "loaded" marks the rows
+    which had data. Rows without data are NaN. For GEN_KW the parameter
+    names are in the "index" dataset.
+
+    Rows can be written from several threads, in any order.
+    """
+    FILE_TYPE = "Ensemble HDF5 file"
+    EXTENSION = ".h5"
+    CHUNK_REALIZATIONS = 64
+    CHUNK_VALUES = 128 * 1024
+
+    def __init__(self, filename, keyword, realizations, index_names=None):
+        super(EnsembleArrayFile, self).__init__()
+        if h5py is None:
+            raise ValueError("Exporting to an ensemble HDF5 file requires the h5py package")
+
+        self._lock = Lock()
+        self._file = h5py.File(filename, "w")
+        self._file.attrs["keyword"] = keyword
+        self._realizations = list(realizations)
+        self._file.create_dataset("realizations", data=numpy.array(self._realizations, dtype=numpy.int32))
+        self._loaded = numpy.zeros(len(self._realizations), dtype=bool)
+        self._values = None
+
+        if index_names is not None:
+            self._file.create_dataset("index", data=numpy.array([name.encode("utf-8") for name in index_names]))
+            self._createValues(len(index_names))
+
+    @staticmethod
+    def isAvailable():
+        return h5py is not None
+
+    def _createValues(self, width):
+        # Chunks of at most CHUNK_VALUES values, preferably whole rows of CHUNK_REALIZATIONS realizations.
+        width = max(width, 1)
+        chunk_width = min(width, EnsembleArrayFile.CHUNK_VALUES)
+        chunk_rows = min(max(len(self._realizations), 1), EnsembleArrayFile.CHUNK_REALIZATIONS,
+                         max(EnsembleArrayFile.CHUNK_VALUES // chunk_width, 1))
+
+        self._values = self._file.create_dataset("values", shape=(len(self._realizations), width),
+                                                 maxshape=(len(self._realizations), None),
+                                                 chunks=(chunk_rows, chunk_width),
+                                                 dtype=numpy.float64, fillvalue=numpy.nan,
+                                                 compression="gzip", shuffle=True)
+
+    def write(self, row, values):
+        """ Writes the values of the realization at position row in the realization list. """
+        values = numpy.asarray(values, dtype=numpy.float64)
+        with self._lock:
+            if self._values is None:
+                self._createValues(len(values))
+            elif len(values) > self._values.shape[1]:
+                self._values.resize(len(values), axis=1)
+
+            self._values[row, :len(values)] = values
+            self._loaded[row] = True
+
+    def close(self):
+        with self._lock:
+            if self._values is None:
+                self._createValues(0)
+            self._file.create_dataset("loaded", data=self._loaded)
+            self._file.close()
@@ -0,0 +1,88 @@
+#  Copyright (C) 2019  Equinor ASA, Norway.
+#
+#  The file 'export_manifest.py' is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+import hashlib
+import json
+import os
+from threading import Lock
+
+
+class ExportManifest(object):
+    """
+    Records a digest of the data behind every file exported to a
+    directory, so a repeated export can skip the files whose data has not
+    changed. The manifest is stored as MANIFEST_FILE in the directory.
+    """
+    MANIFEST_FILE = ".export_manifest.json"
+    VERSION = 1
+
+    def __init__(self, directory):
+        super(ExportManifest, self).__init__()
+        self._directory = directory
+        self._lock = Lock()
+        self._entries = {}
+
+        try:
+            with open(self.path()) as f:
+                manifest = json.load(f)
+            if manifest.get("version") == ExportManifest.VERSION:
+                self._entries = manifest["files"]
+        except (IOError, OSError, ValueError, KeyError):
+            self._entries = {}
+
+    def path(self):
+        """ @rtype: str """
+        return os.path.join(self._directory, ExportManifest.MANIFEST_FILE)
+
+    @staticmethod
+    def digest(file_type, values, template=None):
+        """
+        The digest of the values exported as file_type. For a template
+        based export, template is the templateDigest() of the template.
+        @rtype: str
+        """
+        data = "%s:%s" % (file_type, repr([float(value) for value in values]))
+        if template is not None:
+            data += ":%s" % template
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def templateDigest(template_file):
+        """ @rtype: str: the path and the SHA1 digest of the template file, or only the path if it can not be read """
+        sha1 = hashlib.sha1()
+        try:
+            with open(template_file, "rb") as f:
+                sha1.update(f.read())
+        except (IOError, OSError):
+            return os.path.abspath(template_file)
+        return "%s:%s" % (os.path.abspath(template_file), sha1.hexdigest())
+
+    def isUnchanged(self, filename, digest):
+        """ True if filename exists and was exported from data with this digest. """
+        with self._lock:
+            unchanged = self._entries.get(os.path.basename(filename)) == digest
+        return unchanged and os.path.isfile(filename)
+
+    def record(self, filename, digest):
+        with self._lock:
+            self._entries[os.path.basename(filename)] = digest
+
+    def save(self):
+        with self._lock:
+            manifest = {"version": ExportManifest.VERSION, "files": self._entries}
+            temporary_path = self.path() + ".tmp"
+            with open(temporary_path, "w") as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.rename(temporary_path, self.path())
@@ -19,13 +19,33 @@ import os.path
 from res.enkf import EnkfConfigNode, EnkfNode, EnkfFieldFileFormatEnum, ErtImplType
 from res.enkf import GenKw, GenDataFileType, GenData, NodeId
 from ert_gui import ERT
+from ert_gui.task_pool import TaskProgress, runTasks
+from ert_gui.tools.export.ensemble_array_file import EnsembleArrayFile
+from ert_gui.tools.export.export_manifest import ExportManifest
 
 
 class ExportModel(object):
-    def __init__(self):
+    DEFAULT_WORKERS = 4
+    FIELD_CHUNK_SIZE = 16
+
+    def __init__(self, workers=DEFAULT_WORKERS):
         super(ExportModel, self).__init__()
+        self._workers = max(1, workers)
+
+    def _runTasks(self, tasks, run_task, progress, create_worker_state=lambda: None):
+        """
+        Runs the tasks with runTasks and advances the progress by the
+        realizations of every finished task.
+        @rtype: int: the number of tasks for which run_task returned True
+        """
+        def runTask(state, task):
+            success = run_task(state, task)
+            progress.advance(len(task) if isinstance(task, list) else 1)
+            return success
+
+        return runTasks(tasks, runTask, progress, self._workers, "ert_gui_export_worker", create_worker_state)
 
-    def exportField(self, keyword, path, iactive, file_type, report_step, selected_case):
+    def exportField(self, keyword, path, iactive, file_type, report_step, selected_case, progress=None):
         """
         @type keyword: str
         @type path: str
@@ -33,7 +53,9 @@ class ExportModel(object):
         @type file_type: EnkfFieldFileFormatEnum
         @type report_step: int
         @type selected_case: str
+        @type progress: TaskProgress
         """
+        progress = progress or TaskProgress()
 
         fs = ERT.ert.getEnkfFsManager().getFileSystem(selected_case)
         if file_type == EnkfFieldFileFormatEnum.ECL_GRDECL_FILE:
@@ -41,17 +63,28 @@ class ExportModel(object):
         elif file_type == EnkfFieldFileFormatEnum.RMS_ROFF_FILE:
             extension = ".roff"
 
-        iens_list = iactive.createActiveList()
+        iens_list = list(iactive.createActiveList())
         path_fmt = os.path.join(path, keyword + "_%d" + extension)
         config_node = ERT.ert.ensembleConfig()[keyword]
         mc = ERT.ert.getModelConfig()
         init_file = config_node.getInitFile(mc.getRunpathFormat())
         if init_file:
             print('Using init file:%s' % init_file)
-        EnkfNode.exportMany(config_node, path_fmt, fs, iens_list, file_type=file_type, arg=init_file)
+
+        # exportMany loads and writes a list of realizations in one call, so
+        # the realizations are exported in chunks instead of one by one.
+        chunks = [iens_list[index:index + ExportModel.FIELD_CHUNK_SIZE]
+                  for index in range(0, len(iens_list), ExportModel.FIELD_CHUNK_SIZE)]
+
+        def exportChunk(state, chunk):
+            EnkfNode.exportMany(config_node, path_fmt, fs, chunk, file_type=file_type, arg=init_file)
+            return True
+
+        progress.start(len(iens_list))
+        self._runTasks(chunks, exportChunk, progress)
         return True
 
-    def exportGenKw(self, keyword, path, iactive, file_type, report_step, selected_case):
+    def exportGenKw(self, keyword, path, iactive, file_type, report_step, selected_case, progress=None):
         """
         @type keyword: str
         @type path: str
@@ -59,25 +92,50 @@ class ExportModel(object):
         @type file_type: EnkfFieldFileFormatEnum
         @type report_step: int
         @type selected_case: str
+        @type progress: TaskProgress
+        @rtype: int: the number of realizations exported
         """
+        progress = progress or TaskProgress()
+
         enkf_config_node = ERT.ert.ensembleConfig().getNode(keyword)
         assert isinstance(enkf_config_node, EnkfConfigNode)
-        node = EnkfNode(enkf_config_node)
         fs = ERT.ert.getEnkfFsManager().getFileSystem(selected_case)
 
-        for index, value in enumerate(iactive):
-            if value:
-                if node.tryLoad(fs, NodeId(report_step, index)):
-                    gen_kw = GenKw.createCReference(node.valuePointer())
-                    filename = str(path + "/" + keyword + "_{0}").format(index)
-                    if file_type == "Parameter list":
-                        filename += ".txt"
-                        gen_kw.exportParameters(filename)
-                    else:
-                        filename += ".inc"
-                        gen_kw.exportTemplate(filename)
-
-    def exportGenData(self, keyword, path, iactive, file_type, report_step, selected_case):
+        manifest = ExportManifest(path)
+        # The template based files also depend on the template of the keyword
+        template = None
+        if file_type != "Parameter list":
+            template_file = enkf_config_node.getKeywordModelConfig().getTemplateFile()
+            template = ExportManifest.templateDigest(template_file) if template_file else None
+
+        def exportRealization(node, index):
+            if not node.tryLoad(fs, NodeId(report_step, index)):
+                return False
+
+            gen_kw = GenKw.createCReference(node.valuePointer())
+            filename = str(path + "/" + keyword + "_{0}").format(index)
+            filename += ".txt" if file_type == "Parameter list" else ".inc"
+
+            digest = ExportManifest.digest(file_type, [gen_kw[i] for i in range(len(gen_kw))], template)
+            if manifest.isUnchanged(filename, digest):
+                progress.skip()
+                return False
+
+            if file_type == "Parameter list":
+                gen_kw.exportParameters(filename)
+            else:
+                gen_kw.exportTemplate(filename)
+            manifest.record(filename, digest)
+            return True
+
+        realizations = [index for index, value in enumerate(iactive) if value]
+        progress.start(len(realizations))
+        try:
+            return self._runTasks(realizations, exportRealization, progress, lambda: EnkfNode(enkf_config_node))
+        finally:
+            manifest.save()
+
+    def exportGenData(self, keyword, path, iactive, file_type, report_step, selected_case, progress=None):
         """
         @type keyword: str
         @type path: str
@@ -85,7 +143,11 @@ class ExportModel(object):
         @type file_type: EnkfFieldFileFormatEnum
         @type report_step: int
         @type selected_case: str
+        @type progress: TaskProgress
+        @rtype: int: the number of realizations exported
         """
+        progress = progress or TaskProgress()
+
         fs = ERT.ert.getEnkfFsManager().getFileSystem(selected_case)
         config_node = ERT.ert.ensembleConfig().getNode(keyword)
         gen_data_config_node = config_node.getDataModelConfig()
@@ -94,14 +156,74 @@ class ExportModel(object):
         if export_type == GenDataFileType.GEN_DATA_UNDEFINED:
             export_type = gen_data_config_node.getInputFormat()
 
-        node = EnkfNode(config_node)
+        manifest = ExportManifest(path)
+
+        def exportRealization(node, index):
+            if not node.tryLoad(fs, NodeId(int(report_step), index)):
+                return False
+
+            gen_data = node.asGenData()
+            filename = str(path + "/" + keyword + "_{0}").format(index) + ".txt"
+
+            digest = ExportManifest.digest(export_type, gen_data.getData())
+            if manifest.isUnchanged(filename, digest):
+                progress.skip()
+                return False
+
+            gen_data.export(filename, export_type, None)
+            manifest.record(filename, digest)
+            return True
+
+        realizations = [index for index, active in enumerate(iactive) if active]
+        progress.start(len(realizations))
+        try:
+            return self._runTasks(realizations, exportRealization, progress, lambda: EnkfNode(config_node))
+        finally:
+            manifest.save()
+
+    def exportEnsembleFile(self, keyword, path, iactive, file_type, report_step, selected_case, progress=None):
+        """
+        Exports a GEN_KW or GEN_DATA keyword for all the active realizations
+        to one EnsembleArrayFile, path/keyword.h5.
+        @type keyword: str
+        @type path: str
+        @type iactive: BoolVector
+        @type report_step: int
+        @type selected_case: str
+        @type progress: TaskProgress
+        @rtype: int: the number of realizations exported
+        """
+        progress = progress or TaskProgress()
+
+        fs = ERT.ert.getEnkfFsManager().getFileSystem(selected_case)
+        config_node = ERT.ert.ensembleConfig().getNode(keyword)
+        is_gen_kw = config_node.getImplementationType() == ErtImplType.GEN_KW
+
+        index_names = None
+        if is_gen_kw:
+            index_names = [str(name) for name in config_node.getKeywordModelConfig().getKeyWords()]
+
+        realizations = [index for index, active in enumerate(iactive) if active]
+        filename = os.path.join(path, keyword + EnsembleArrayFile.EXTENSION)
+        array_file = EnsembleArrayFile(filename, keyword, realizations, index_names)
+
+        def exportRealization(node, task):
+            row, index = task
+            if not node.tryLoad(fs, NodeId(int(report_step), index)):
+                return False
 
-        for index, active in enumerate(iactive):
-            if active:
-                node_id = NodeId(int(report_step), index)
+            if is_gen_kw:
+                gen_kw = GenKw.createCReference(node.valuePointer())
+                values = [gen_kw[name] for name in index_names]
+            else:
+                values = list(node.asGenData().getData())
 
-                if node.tryLoad(fs, node_id):
-                    gen_data = node.asGenData()
+            array_file.write(row, values)
+            return True
 
-                    filename = str(path + "/" + keyword + "_{0}").format(index) + ".txt"
-                    gen_data.export(filename, export_type, None)
+        progress.start(len(realizations))
+        try:
+            return self._runTasks(list(enumerate(realizations)), exportRealization, progress,
+                                  lambda: EnkfNode(config_node))
+        finally:
+            array_file.close()
@@ -29,6 +29,7 @@ from ert_gui.ertwidgets.models.ertmodel import getCurrentCaseName
 from ert_gui.ertwidgets.stringbox import StringBox
 from ert_gui.ide.keywords.definitions import RangeStringArgument
 from ert_gui.tools.export import ExportKeywordModel
+from ert_gui.tools.export.ensemble_array_file import EnsembleArrayFile
 
 
 class ExportPanel(QWidget):
@@ -88,6 +89,10 @@ class ExportPanel(QWidget):
         self._field_kw_file_types = ["Eclipse GRDECL", "RMS roff"]
         self._gen_data_file_types = ["Gen data"]
 
+        if EnsembleArrayFile.isAvailable():
+            self._gen_kw_file_types.append(EnsembleArrayFile.FILE_TYPE)
+            self._gen_data_file_types.append(EnsembleArrayFile.FILE_TYPE)
+
         self._file_type_model = self._field_kw_file_types
         self._file_type_combo = QComboBox()
         self._file_type_combo.setSizeAdjustPolicy(QComboBox.AdjustToContents)
@@ -23,8 +23,12 @@ from ert_gui.tools.export import ExportPanel, Exporter, ExportKeywordModel
 
 
 class ExportTool(Tool):
+    NAME = "Export Data"
+    HELP_LINK = "tools/export"
+    ICON = "ide/table_export"
+
     def __init__(self):
-        super(ExportTool, self).__init__("Export Data", "tools/export", resourceIcon("ide/table_export"))
+        super(ExportTool, self).__init__(ExportTool.NAME, ExportTool.HELP_LINK, resourceIcon(ExportTool.ICON))
         self.__export_widget = None
         self.__dialog = None
         self.__exporter = None
@@ -33,7 +37,7 @@ class ExportTool(Tool):
     def trigger(self):
         if self.__export_widget is None:
             self.__export_widget = ref(ExportPanel(self.parent()))
-            self.__exporter = Exporter()
+            self.__exporter = Exporter(self.parent())
             self.__export_widget().runExport.connect(self.__exporter.runExport)
 
         self.__export_widget().setSelectedCase(getCurrentCaseName())
@@ -15,6 +15,7 @@
 #  for more details.
 import os
 import sys
+from functools import partial
 
 try:
   from PyQt4.QtCore import QDir
@@ -25,23 +26,31 @@ except ImportError:
 
 
 from res.enkf import EnkfFieldFileFormatEnum
+from ert_gui.ertwidgets.backgroundtask import ProgressDialogTask
+from ert_gui.task_pool import TaskProgress
 from ert_gui.tools.export import ExportModel, ExportKeywordModel
+from ert_gui.tools.export.ensemble_array_file import EnsembleArrayFile
 
 
 class Exporter():
-    def __init__(self):
+    def __init__(self, parent=None):
+        self.__parent = parent
         self.__export_keyword_model = ExportKeywordModel()
+        self.__running_export = None
 
     def runExport(self, values):
         keyword = values["keyword"]
         file_name = self.createExportFileNameMask(keyword, values["selected_case"], values["report_step"], values["path"])
+        arguments = (keyword, file_name, values["iactive"], values["file_type_key"], values["report_step"], values["selected_case"])
 
-        if self.__export_keyword_model.isFieldKw(keyword):
-            self.exportField(keyword, file_name, values["iactive"], values["file_type_key"], values["report_step"], values["selected_case"])
+        if values["file_type_key"] == EnsembleArrayFile.FILE_TYPE:
+            self.exportEnsembleFile(*arguments)
+        elif self.__export_keyword_model.isFieldKw(keyword):
+            self.exportField(*arguments)
         elif self.__export_keyword_model.isGenKw(keyword):
-            self.exportGenKw(keyword, file_name, values["iactive"], values["file_type_key"], values["report_step"], values["selected_case"])
+            self.exportGenKw(*arguments)
         elif self.__export_keyword_model.isGenParamKw(keyword) or self.__export_keyword_model.isGenDataKw(keyword):
-            self.exportGenData(keyword, file_name, values["iactive"], values["file_type_key"], values["report_step"], values["selected_case"])
+            self.exportGenData(*arguments)
         else:
             sys.stderr.write('** WARNING: Cannot export unknown keyword type "%s".\n' % keyword)
 
@@ -51,15 +60,56 @@ class Exporter():
         else:
             file_type = EnkfFieldFileFormatEnum.RMS_ROFF_FILE
 
-        result = ExportModel().exportField(keyword, file_name, iactive, file_type, report_step, selected_case)
-        if not result:
-            QMessageBox.warning(self, "Warning", '''Something did not work!''', QMessageBox.Ok)
+        self.__startExport(keyword, partial(ExportModel().exportField, keyword, file_name, iactive, file_type,
+                                            report_step, selected_case))
 
     def exportGenData(self, keyword, file_name, iactive, file_type_key, report_step, selected_case):
-        ExportModel().exportGenData(keyword, file_name, iactive, file_type_key, report_step, selected_case)
+        self.__startExport(keyword, partial(ExportModel().exportGenData, keyword, file_name, iactive, file_type_key,
+                                            report_step, selected_case))
 
     def exportGenKw(self, keyword, file_name, iactive, file_type_key, report_step, selected_case):
-        ExportModel().exportGenKw(keyword, file_name, iactive, file_type_key, report_step, selected_case)
+        self.__startExport(keyword, partial(ExportModel().exportGenKw, keyword, file_name, iactive, file_type_key,
+                                            report_step, selected_case))
+
+    def exportEnsembleFile(self, keyword, file_name, iactive, file_type_key, report_step, selected_case):
+        self.__startExport(keyword, partial(ExportModel().exportEnsembleFile, keyword, file_name, iactive, file_type_key,
+                                            report_step, selected_case))
+
+    def isRunning(self):
+        return self.__running_export is not None
+
+    def __startExport(self, keyword, export_function):
+        """
+        Runs export_function(progress=...) in a background thread, with a
+        progress dialog which can cancel it.
+        """
+        if self.isRunning():
+            QMessageBox.warning(self.__parent, "Export", "An export is already running.", QMessageBox.Ok)
+            return
+
+        progress = TaskProgress()
+        self.__running_export = ProgressDialogTask(self.__parent, "Export", "Exporting %s" % keyword, export_function,
+                                                   progress, partial(self.__exportFinished, keyword, progress),
+                                                   name="ert_gui_export_thread")
+        self.__running_export.start()
+
+    def __exportFinished(self, keyword, progress, value, error):
+        self.__running_export = None
+
+        if error is not None:
+            QMessageBox.warning(self.__parent, "Warning", "Exporting %s failed:\n%s" % (keyword, error),
+                                QMessageBox.Ok)
+        elif value is False:
+            QMessageBox.warning(self.__parent, "Warning", '''Something did not work!''', QMessageBox.Ok)
+        elif progress.isCancelled():
+            QMessageBox.information(self.__parent, "Export cancelled",
+                                    "Exported %d of %d realizations of %s before the export was cancelled."
+                                    % (progress.done(), progress.total(), keyword))
+        elif progress.skipped() > 0:
+            QMessageBox.information(self.__parent, "Export",
+                                    "Exported %d realizations of %s, skipped %d realizations which were "
+                                    "unchanged since the previous export."
+                                    % (value or 0, keyword, progress.skipped()))
 
     def createExportFileNameMask(self, keyword, current_case, report_step, path):
         impl_type = None
@@ -72,6 +72,10 @@ class IdePanel(QPlainTextEdit):
                         if pos in argument:
                             self.setToolTip(configuration_line.validationStatusForToken(argument).message())
 
+                for problem in user_data.problems:
+                    if pos in problem:
+                        self.setToolTip(problem.message())
+
             else:
                 self.setToolTip("")
 
@@ -7,8 +7,12 @@ from ert_gui.tools.ide import IdeWindow
 
 
 class IdeTool(Tool):
+    NAME = "Configure"
+    HELP_LINK = "tools/ide"
+    ICON = "ide/widgets"
+
     def __init__(self, path, help_tool):
-        super(IdeTool, self).__init__("Configure", "tools/ide", resourceIcon("ide/widgets"))
+        super(IdeTool, self).__init__(IdeTool.NAME, IdeTool.HELP_LINK, resourceIcon(IdeTool.ICON))
 
         self.ide_window = None
         self.path = path
@@ -0,0 +1,39 @@
+from ert_gui.ertwidgets import resourceIcon
+from ert_gui.tools import Tool
+
+
+class LazyTool(Tool):
+    """
+    Toolbar entry for a tool which is created the first time it is
+    triggered. The name, help link and icon are the NAME, HELP_LINK and
+    ICON of the tool class. The factory is called without arguments and
+    returns the tool; it defaults to the tool class. The enabled argument
+    may be a function, which is called by updateEnabled(); the entry is
+    disabled until then.
+    """
+    def __init__(self, tool_class, factory=None, enabled=True):
+        enabled_function = enabled if callable(enabled) else None
+        if enabled_function is not None:
+            enabled = False
+
+        super(LazyTool, self).__init__(tool_class.NAME, tool_class.HELP_LINK, resourceIcon(tool_class.ICON), enabled)
+        self.__factory = factory or tool_class
+        self.__enabled_function = enabled_function
+        self.__tool = None
+
+    def tool(self):
+        """ @rtype: Tool """
+        if self.__tool is None:
+            self.__tool = self.__factory()
+            self.__tool.setParent(self.parent())
+        return self.__tool
+
+    def isCreated(self):
+        return self.__tool is not None
+
+    def updateEnabled(self):
+        if self.__enabled_function is not None:
+            self.setEnabled(self.__enabled_function())
+
+    def trigger(self):
+        self.tool().trigger()
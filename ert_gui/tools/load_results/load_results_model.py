@@ -13,23 +13,30 @@
 #
 #  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
 #  for more details.
-import os
-
 from ert_gui import ERT
+from ert_gui.ert_queries import getCurrentCaseName
+from ert_gui.load_manifest import LoadManifest
+from ert_gui.result_loader import ResultLoader
 
 
 class LoadResultsModel(object):
 
     @staticmethod
-    def loadResults(selected_case, realisations, iteration):
+    def loadResults(selected_case, realisations, iteration, progress=None, workers=ResultLoader.DEFAULT_WORKERS,
+                    skip_unchanged=False):
         """
         @type selected_case: str
         @type realisations: BoolVector
         @type iteration: int
+        @type progress: ert_gui.result_loader.LoadProgress
+        @type skip_unchanged: bool: skip realizations whose output files are unchanged since they were loaded
         @rtype int: number of loaded realisations
         """
-        fs = ERT.ert.getEnkfFsManager().getFileSystem(selected_case)
-        return ERT.ert.loadFromForwardModel(realisations, iteration, fs)
+        runpath_index = ERT.runpath_indexes.index(ERT.ert, selected_case)
+        manifest = LoadManifest.forCase(ERT.ert, selected_case)
+        loader = ResultLoader(ERT.ert, workers=workers, runpath_index=runpath_index, manifest=manifest)
+        return loader.load(selected_case, list(realisations.createActiveList()), iteration, progress,
+                           skip_unchanged=skip_unchanged)
 
     @staticmethod
     def isValidRunPath():
@@ -57,21 +64,12 @@ class LoadResultsModel(object):
 
     @staticmethod
     def getIterationCount():
-        """ @rtype: int """
+        """ @rtype: int: the last iteration with a run path on disk """
         run_path = ERT.ert.getModelConfig().getRunpathAsString()
         try:
             results = run_path % (0, 0)
         except TypeError:
             return 0
 
-        iteration = 0
-        valid_directory = True
-        while valid_directory:
-            formatted = run_path % (0, iteration + 1)
-            valid_directory = os.path.exists(formatted)
-            if valid_directory:
-                iteration += 1
-
-        return iteration
-
-
+        iterations = ERT.runpath_indexes.index(ERT.ert, getCurrentCaseName()).iterations()
+        return iterations[-1] if iterations else 0
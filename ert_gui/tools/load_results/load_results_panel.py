@@ -14,22 +14,40 @@
 #  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
 #  for more details.
 import sys
+from functools import partial
 
 try:
-  from PyQt4.QtGui import QWidget, QFormLayout, QComboBox, QTextEdit
+  from PyQt4.QtCore import pyqtSignal
+  from PyQt4.QtGui import (QWidget, QFormLayout, QComboBox, QTextEdit, QCheckBox, QLabel, QListView, QListWidget,
+                           QListWidgetItem, QProgressBar, QColor)
 except ImportError:
-  from PyQt5.QtWidgets import QWidget, QFormLayout, QComboBox, QTextEdit
+  from PyQt5.QtCore import pyqtSignal
+  from PyQt5.QtGui import QColor
+  from PyQt5.QtWidgets import (QWidget, QFormLayout, QComboBox, QTextEdit, QCheckBox, QLabel, QListView, QListWidget,
+                               QListWidgetItem, QProgressBar)
 
+from ert_gui import ERT
+from ert_gui.ertwidgets.backgroundtask import BackgroundTask
 from ert_gui.ertwidgets.models.activerealizationsmodel import ActiveRealizationsModel
 from ert_gui.ertwidgets.models.all_cases_model import AllCasesModel
 from ert_gui.ertwidgets.models.ertmodel import getCurrentCaseName
 from ert_gui.ertwidgets.models.valuemodel import ValueModel
 from ert_gui.ertwidgets.stringbox import StringBox
 from ert_gui.ide.keywords.definitions import RangeStringArgument, IntegerArgument
+from ert_gui.result_loader import LoadProgress
 from ert_gui.tools.load_results import LoadResultsModel
 
 
 class LoadResultsPanel(QWidget):
+    STATUS_COLORS = {LoadProgress.PENDING: (240, 240, 240),
+                     LoadProgress.LOADING: (255, 200, 0),
+                     LoadProgress.LOADED: (0, 200, 0),
+                     LoadProgress.FAILED: (255, 100, 100),
+                     LoadProgress.MISSING: (160, 160, 160),
+                     LoadProgress.UNCHANGED: (150, 220, 150)}
+
+    loadingStarted = pyqtSignal()
+    loadingFinished = pyqtSignal()
 
     def __init__(self):
         QWidget.__init__(self)
@@ -72,6 +90,28 @@ class LoadResultsPanel(QWidget):
         self._iterations_field.setValidator(IntegerArgument())
         layout.addRow("Iteration to load:", self._iterations_field)
 
+        self._skip_unchanged_checkbox = QCheckBox()
+        self._skip_unchanged_checkbox.setToolTip("Skip the realizations which already have data in the case and "
+                                                 "whose output files are unchanged since they were loaded")
+        layout.addRow("Only load changed realizations:", self._skip_unchanged_checkbox)
+
+        self._progress_bar = QProgressBar()
+        self._progress_bar.setValue(0)
+        self._status_label = QLabel()
+        layout.addRow("Progress:", self._progress_bar)
+        layout.addRow("", self._status_label)
+
+        self._status_list = QListWidget()
+        self._status_list.setViewMode(QListView.IconMode)
+        self._status_list.setFlow(QListView.LeftToRight)
+        self._status_list.setWrapping(True)
+        self._status_list.setUniformItemSizes(True)
+        self._status_list.setFixedHeight(120)
+        layout.addRow("Realizations:", self._status_list)
+
+        self._status_items = {}
+        self._running_load = None
+
         self.setLayout(layout)
 
     def readCurrentRunPath(self):
@@ -82,7 +122,18 @@ class LoadResultsPanel(QWidget):
         return run_path
 
 
+    def isLoading(self):
+        return self._running_load is not None
+
     def load(self):
+        """
+        Starts loading the results in a background thread. The status of
+        every realization is shown while it runs.
+        @rtype: bool: whether the load was started
+        """
+        if self.isLoading():
+            return False
+
         all_cases = self._case_model.getAllItems()
         selected_case  = all_cases[self._case_combo.currentIndex()]
         realizations = self._active_realizations_model.getActiveRealizationsMask()
@@ -94,12 +145,75 @@ class LoadResultsPanel(QWidget):
         except ValueError as e:
             print('Expected a (whole) number in iteration field, got "%s". Error message: %s.'  % (iteration, e))
             return False
-        loaded = LoadResultsModel.loadResults(selected_case, realizations, iteration)
-        if loaded > 0:
-            print('Successfully loaded %d realisations.' % loaded)
+
+        progress = LoadProgress()
+        progress.start(list(realizations.createActiveList()))
+        skip_unchanged = self._skip_unchanged_checkbox.isChecked()
+
+        def runLoad():
+            return LoadResultsModel.loadResults(selected_case, realizations, iteration, progress,
+                                                skip_unchanged=skip_unchanged)
+
+        self.__createStatusItems(progress.statuses())
+        task = BackgroundTask("ert_gui_load_results_thread", runLoad, partial(self.__loadFinished, progress),
+                              partial(self.__updateStatus, progress))
+        self._running_load = (task, progress)
+        self.loadingStarted.emit()
+        task.start()
+        return True
+
+    def cancel(self):
+        if self.isLoading():
+            _, progress = self._running_load
+            progress.cancel()
+            self._status_label.setText("Cancelling...")
+
+    def __createStatusItems(self, statuses):
+        self._status_list.clear()
+        self._status_items = {}
+        for iens, status in statuses.items():
+            item = QListWidgetItem(str(iens))
+            self._status_list.addItem(item)
+            self._status_items[iens] = [item, None]
+            self.__setItemStatus(iens, status)
+        self._progress_bar.setRange(0, max(len(statuses), 1))
+        self._progress_bar.setValue(0)
+
+    def __setItemStatus(self, iens, status):
+        item, current_status = self._status_items[iens]
+        if status != current_status:
+            item.setBackground(QColor(*LoadResultsPanel.STATUS_COLORS[status]))
+            item.setToolTip("Realization %d: %s" % (iens, status))
+            self._status_items[iens][1] = status
+
+    def __updateStatus(self, progress):
+        for iens, status in progress.statuses().items():
+            self.__setItemStatus(iens, status)
+
+        self._progress_bar.setValue(progress.finished())
+        if not progress.isCancelled():
+            self._status_label.setText("Loaded %d, unchanged %d, failed %d, no run path %d of %d realizations"
+                                       % (progress.count(LoadProgress.LOADED), progress.count(LoadProgress.UNCHANGED),
+                                          progress.count(LoadProgress.FAILED),
+                                          progress.count(LoadProgress.MISSING), progress.total()))
+
+    def __loadFinished(self, progress, value, error):
+        self._running_load = None
+        # The realization states of the case have changed
+        ERT.emitErtChange()
+
+        loaded = progress.count(LoadProgress.LOADED)
+        if error is not None:
+            self._status_label.setText("Loading failed: %s" % error)
+            sys.stderr.write("Loading results failed: %s\n" % error)
+        elif progress.isCancelled():
+            self._status_label.setText("Cancelled after loading %d of %d realizations" % (loaded, progress.total()))
+        elif loaded > 0:
+            self._status_label.setText("Successfully loaded %d of %d realizations" % (loaded, progress.total()))
         else:
-            print('No realisations loaded.')
-        return loaded
+            self._status_label.setText("No realizations loaded")
+
+        self.loadingFinished.emit()
 
     def setCurrectCase(self):
         current_case = getCurrentCaseName()
@@ -21,8 +21,12 @@ from ert_gui.tools.load_results import LoadResultsPanel
 
 
 class LoadResultsTool(Tool):
+    NAME = "Load results manually"
+    HELP_LINK = "tools/load_manually"
+    ICON = "ide/table_import"
+
     def __init__(self):
-        super(LoadResultsTool, self).__init__("Load results manually", "tools/load_manually", resourceIcon("ide/table_import"))
+        super(LoadResultsTool, self).__init__(LoadResultsTool.NAME, LoadResultsTool.HELP_LINK, resourceIcon(LoadResultsTool.ICON))
         self.__import_widget = None
         self.__dialog = None
         self.setEnabled(LoadResultsModel.isValidRunPath())
@@ -30,11 +34,24 @@ class LoadResultsTool(Tool):
     def trigger(self):
         if self.__import_widget is None:
             self.__import_widget = LoadResultsPanel()
+            self.__import_widget.loadingStarted.connect(self.__loadingStarted)
+            self.__import_widget.loadingFinished.connect(self.__loadingFinished)
         self.__dialog = ClosableDialog("Load results manually", self.__import_widget, self.parent())
         self.__import_widget.setCurrectCase()
+        self.__dialog.addButton("Cancel", self.__import_widget.cancel)
         self.__dialog.addButton("Load", self.load)
+        self.__dialog.toggleButton("Cancel", False)
         self.__dialog.exec_()
 
     def load(self):
         self.__import_widget.load()
-        self.__dialog.accept()
+
+    def __loadingStarted(self):
+        self.__dialog.disableCloseButton()
+        self.__dialog.toggleButton("Load", False)
+        self.__dialog.toggleButton("Cancel", True)
+
+    def __loadingFinished(self):
+        self.__dialog.enableCloseButton()
+        self.__dialog.toggleButton("Load", True)
+        self.__dialog.toggleButton("Cancel", False)
@@ -1,19 +1,25 @@
 import sys
+from functools import partial
 
 try:
   from PyQt4.QtCore import Qt
-  from PyQt4.QtGui import QToolButton, QTextEdit, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSpinBox
+  from PyQt4.QtGui import QToolButton, QTextEdit, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSpinBox, \
+      QMessageBox
 except ImportError:
   from PyQt5.QtCore import Qt
-  from PyQt5.QtWidgets import QToolButton, QTextEdit, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSpinBox
+  from PyQt5.QtWidgets import QToolButton, QTextEdit, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSpinBox, \
+      QMessageBox
 
 from ert_gui import ERT
+from ert_gui.case_initializer import CaseInitializer
+from ert_gui.task_pool import TaskProgress
 from ert_gui.ertwidgets import addHelpToWidget, showWaitCursorWhileWaiting
+from ert_gui.ertwidgets.backgroundtask import ProgressDialogTask
 from ert_gui.ertwidgets.caselist import CaseList
 from ert_gui.ertwidgets.caseselector import CaseSelector
 from ert_gui.ertwidgets.checklist import CheckList
-from ert_gui.ertwidgets.models.ertmodel import getRealizationCount, initializeCurrentCaseFromScratch, getCaseRealizationStates, getParameterList, getHistoryLength, \
-    initializeCurrentCaseFromExisting, getCurrentCaseName
+from ert_gui.ertwidgets.models.ertmodel import getRealizationCount, getCaseRealizationStates, getParameterList, getHistoryLength, \
+    canInitializeCurrentCaseFromExisting, getCurrentCaseName
 from ert_gui.ertwidgets.models.selectable_list_model import SelectableListModel
 
 
@@ -51,6 +57,7 @@ class CaseInitializationConfigurationPanel(QTabWidget):
         QTabWidget.__init__(self)
         self.setWindowTitle("Case Management")
         self.setMinimumWidth(600)
+        self._running_initialization = None
 
         self.addCreateNewCaseTab()
         self.addInitializeFromScratchTab()
@@ -90,7 +97,9 @@ class CaseInitializationConfigurationPanel(QTabWidget):
         def initializeFromScratch():
             parameters = parameter_model.getSelectedItems()
             members = members_model.getSelectedItems()
-            initializeCurrentCaseFromScratch(parameters, members)
+            initializer = CaseInitializer(ERT.ert)
+            self.runInitialization("Initialize from scratch", partial(initializer.initializeFromScratch,
+                                                                      parameters, members))
 
         initialize_button.clicked.connect(initializeFromScratch)
         layout.addWidget(initialize_button, 0, Qt.AlignCenter)
@@ -131,7 +140,13 @@ class CaseInitializationConfigurationPanel(QTabWidget):
             report_step = history_length_spinner.value()
             parameters = parameter_model.getSelectedItems()
             members = members_model.getSelectedItems()
-            initializeCurrentCaseFromExisting(source_case_name, target_case_name,  report_step, parameters, members)
+            if not canInitializeCurrentCaseFromExisting(source_case_name, target_case_name):
+                return
+
+            initializer = CaseInitializer(ERT.ert)
+            self.runInitialization("Initialize from existing", partial(initializer.initializeFromExisting,
+                                                                       source_case_name, report_step,
+                                                                       parameters, members))
 
         initialize_button.clicked.connect(initializeFromExisting)
         layout.addWidget(initialize_button, 0, Qt.AlignCenter)
@@ -143,6 +158,33 @@ class CaseInitializationConfigurationPanel(QTabWidget):
         widget.setLayout(layout)
         self.addTab(widget, "Initialize from existing")
 
+    def isInitializing(self):
+        return self._running_initialization is not None
+
+    def runInitialization(self, title, initialize):
+        """
+        Runs initialize(progress=...) in a background thread, with a
+        progress dialog which can cancel it.
+        """
+        if self.isInitializing():
+            return
+
+        progress = TaskProgress()
+        self._running_initialization = ProgressDialogTask(self, title, title, initialize, progress,
+                                                          partial(self._initializationFinished, title, progress),
+                                                          name="ert_gui_case_initialization_thread")
+        self._running_initialization.start()
+
+    def _initializationFinished(self, title, progress, initialized, error):
+        self._running_initialization = None
+        ERT.emitErtChange()
+
+        if error is not None:
+            QMessageBox.warning(self, "Warning", "%s failed:\n%s" % (title, error), QMessageBox.Ok)
+        elif progress.isCancelled():
+            QMessageBox.information(self, title, "Initialized %d of %d realizations before it was cancelled."
+                                    % (progress.done(), progress.total()))
+
     def createTimeStepRow(self):
         history_length_spinner = QSpinBox()
         addHelpToWidget(history_length_spinner, "config/init/history_length")
@@ -5,8 +5,12 @@ from ert_gui.tools.manage_cases.case_init_configuration import CaseInitializatio
 
 
 class ManageCasesTool(Tool):
+    NAME = "Manage Cases"
+    HELP_LINK = "tools/manage_cases"
+    ICON = "ide/database_gear"
+
     def __init__(self):
-        super(ManageCasesTool, self).__init__("Manage Cases", "tools/manage_cases", resourceIcon("ide/database_gear"))
+        super(ManageCasesTool, self).__init__(ManageCasesTool.NAME, ManageCasesTool.HELP_LINK, resourceIcon(ManageCasesTool.ICON))
 
 
     def trigger(self):
@@ -4,8 +4,12 @@ from ert_gui.tools.plot import PlotWindow
 
 
 class PlotTool(Tool):
+    NAME = "Create Plot"
+    HELP_LINK = "tools/plot"
+    ICON = "ide/chart_curve_add"
+
     def __init__(self):
-        super(PlotTool, self).__init__("Create Plot", "tools/plot", resourceIcon("ide/chart_curve_add"))
+        super(PlotTool, self).__init__(PlotTool.NAME, PlotTool.HELP_LINK, resourceIcon(PlotTool.ICON))
 
     def trigger(self):
         plot_window = PlotWindow(self.parent())
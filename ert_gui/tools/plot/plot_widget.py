@@ -8,10 +8,14 @@ except ImportError:
   from PyQt5.QtCore import Qt, pyqtSignal
   from PyQt5.QtWidgets import QWidget, QVBoxLayout, QAction
 
+import ert_gui
+ert_gui.configureMatplotlib()
+
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt4agg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT
 
 from ert_gui.ertwidgets import resourceIcon
+from ert_gui.profiler import profiledRegion
 
 
 class CustomNavigationToolbar(NavigationToolbar2QT):
@@ -86,8 +90,9 @@ class PlotWidget(QWidget):
             self.resetPlot()
             plot_context = self._plotContextFunction(self.getFigure())
             try:
-                self._plotFunction(plot_context)
-                self._canvas.draw()
+                with profiledRegion("plot draw"):
+                    self._plotFunction(plot_context)
+                    self._canvas.draw()
             except Exception as e:
                 exc_type, exc_value, exc_tb = sys.exc_info()
                 sys.stderr.write("%s\n" % ("-" * 80))
@@ -5,16 +5,25 @@ from .plugin import Plugin
 class PluginHandler(object):
 
     def __init__(self, ert, plugin_jobs, parent_window):
-        """ @type plugin_jobs: list of WorkflowJob """
+        """
+        The plugin scripts are loaded when the plugins are first accessed.
+        @type plugin_jobs: list of WorkflowJob
+        """
         self.__ert = ert
-        self.__plugins = []
+        self.__plugin_jobs = list(plugin_jobs)
+        self.__parent_window = parent_window
+        self.__loaded_plugins = None
 
-        for job in plugin_jobs:
-            plugin = Plugin(self.__ert, job)
-            self.__plugins.append(plugin)
-            plugin.setParentWindow(parent_window)
+    def __plugins(self):
+        if self.__loaded_plugins is None:
+            plugins = []
+            for job in self.__plugin_jobs:
+                plugin = Plugin(self.__ert, job)
+                plugins.append(plugin)
+                plugin.setParentWindow(self.__parent_window)
 
-        self.__plugins = sorted(self.__plugins, key=Plugin.getName)
+            self.__loaded_plugins = sorted(plugins, key=Plugin.getName)
+        return self.__loaded_plugins
 
 
     def ert(self):
@@ -23,15 +32,16 @@ class PluginHandler(object):
 
     def __iter__(self):
         """ @rtype: Plugin """
+        plugins = self.__plugins()
         index = 0
-        while index < len(self.__plugins):
-            yield self.__plugins[index]
+        while index < len(plugins):
+            yield plugins[index]
             index += 1
 
     def __getitem__(self, index):
         """ @rtype: Plugin """
-        return self.__plugins[index]
+        return self.__plugins()[index]
 
 
     def __len__(self):
-        return len(self.__plugins)
+        return len(self.__plugin_jobs)
@@ -20,20 +20,28 @@ class PluginsTool(Tool):
         enabled = len(plugin_handler) > 0
         super(PluginsTool, self).__init__("Plugins", "tools/plugins", resourceIcon("ide/plugin"), enabled, popup_menu=True)
 
-        self.__plugins = {}
+        self.__plugin_handler = plugin_handler
+        self.__plugins = None
+
+        # The plugins are loaded when the menu is first opened.
+        self.__menu = QMenu()
+        self.__menu.aboutToShow.connect(self.__populateMenu)
+        self.getAction().setMenu(self.__menu)
+
+    def __populateMenu(self):
+        if self.__plugins is not None:
+            return
 
-        menu = QMenu()
-        for plugin in plugin_handler:
+        self.__plugins = {}
+        for plugin in self.__plugin_handler:
             plugin_runner = PluginRunner(plugin)
             plugin_runner.setPluginFinishedCallback(self.trigger)
 
             self.__plugins[plugin] = plugin_runner
-            plugin_action = menu.addAction(plugin.getName())
+            plugin_action = self.__menu.addAction(plugin.getName())
             plugin_action.setToolTip(plugin.getDescription())
             plugin_action.triggered.connect(plugin_runner.run)
 
-        self.getAction().setMenu(menu)
-
 
     def trigger(self):
         ERT.emitErtChange() # plugin may have added new cases.
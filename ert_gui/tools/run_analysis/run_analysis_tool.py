@@ -44,8 +44,12 @@ def analyse(target, source):
 
 
 class RunAnalysisTool(Tool):
+    NAME = "Run Analysis"
+    HELP_LINK = "tools/run_analysis"
+    ICON = "ide/table_import"
+
     def __init__(self):
-        super(RunAnalysisTool, self).__init__("Run Analysis", "tools/run_analysis", resourceIcon("ide/table_import"))
+        super(RunAnalysisTool, self).__init__(RunAnalysisTool.NAME, RunAnalysisTool.HELP_LINK, resourceIcon(RunAnalysisTool.ICON))
         self._run_widget = None
         self._dialog = None
         self._selected_case_name = None
@@ -77,5 +81,5 @@ class RunAnalysisTool(Tool):
             msg.exec_()
             return
 
-        ert_gui.ERT.ertChanged.emit()
+        ert_gui.ERT.emitErtChange()
         self._dialog.accept()
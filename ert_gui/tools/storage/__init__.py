@@ -0,0 +1,2 @@
+from .storage_panel import StoragePanel
+from .storage_tool import StorageTool
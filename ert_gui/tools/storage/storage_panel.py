@@ -0,0 +1,166 @@
+#  Copyright (C) 2019  Equinor ASA, Norway.
+#
+#  The file 'storage_panel.py' is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+from functools import partial
+
+try:
+  from PyQt4.QtCore import Qt, QTimer, pyqtSignal
+  from PyQt4.QtGui import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTreeWidget, QTreeWidgetItem,
+                           QAbstractItemView, QMessageBox)
+except ImportError:
+  from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+  from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTreeWidget, QTreeWidgetItem,
+                               QAbstractItemView, QMessageBox)
+
+from ert_gui import ERT
+from ert_gui.ertwidgets.backgroundtask import BackgroundTask
+from ert_gui.storage_manager import StorageManager
+
+
+class StoragePanel(QWidget):
+    """
+    Shows the disk usage of every case in storage, by node type, and
+    deletes or archives the selected cases. Scanning, deleting and
+    archiving run in a background thread.
+    """
+    busyChanged = pyqtSignal(bool)
+
+    def __init__(self):
+        QWidget.__init__(self)
+        self.setMinimumWidth(700)
+        self.setMinimumHeight(400)
+
+        self._manager = StorageManager(ERT.ert)
+        self._running_task = None
+
+        layout = QVBoxLayout()
+        self._storage_label = QLabel("Storage: %s" % self._manager.storageRoot())
+        layout.addWidget(self._storage_label)
+
+        self._case_tree = QTreeWidget()
+        self._case_tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self._case_tree.setRootIsDecorated(False)
+        self._case_tree.setSortingEnabled(False)
+        layout.addWidget(self._case_tree)
+
+        self._status_label = QLabel()
+        layout.addWidget(self._status_label)
+
+        button_layout = QHBoxLayout()
+        self._refresh_button = QPushButton("Refresh")
+        self._refresh_button.clicked.connect(self.refresh)
+        self._delete_button = QPushButton("Delete")
+        self._delete_button.clicked.connect(self.deleteSelected)
+        self._archive_button = QPushButton("Archive")
+        self._archive_button.setToolTip("Pack the selected cases into .tar.gz archives in the storage directory "
+                                        "and delete them from storage")
+        self._archive_button.clicked.connect(self.archiveSelected)
+        button_layout.addWidget(self._refresh_button)
+        button_layout.addStretch()
+        button_layout.addWidget(self._delete_button)
+        button_layout.addWidget(self._archive_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+
+        # Scan once the dialog is shown.
+        QTimer.singleShot(0, self.refresh)
+
+    def isBusy(self):
+        return self._running_task is not None
+
+    def selectedCases(self):
+        """ @rtype: list[str] """
+        return [str(item.data(0, Qt.UserRole)) for item in self._case_tree.selectedItems()]
+
+    def refresh(self):
+        self.__runTask("Scanning storage...", self._manager.scan, self.__showUsage)
+
+    def deleteSelected(self):
+        self.__removeSelected("Delete", self._manager.deleteCase)
+
+    def archiveSelected(self):
+        self.__removeSelected("Archive", self._manager.archiveCase)
+
+    def __removeSelected(self, action, remove_case):
+        cases = self.selectedCases()
+        if not cases or self.isBusy():
+            return
+
+        problems = [problem for problem in (self._manager.removalProblem(case) for case in cases) if problem]
+        if problems:
+            QMessageBox.warning(self, action, "The selected cases can not be removed:\n%s" % "\n".join(problems))
+            return
+
+        answer = QMessageBox.question(self, action, "%s %d case(s)?\n%s" % (action, len(cases), "\n".join(cases)),
+                                      QMessageBox.Yes | QMessageBox.No)
+        if answer != QMessageBox.Yes:
+            return
+
+        def removeCases():
+            for case in cases:
+                remove_case(case)
+
+        self.__runTask("%s %s..." % (action, ", ".join(cases)), removeCases, self.__casesRemoved)
+
+    def __casesRemoved(self, result):
+        ERT.emitErtChange()
+        self.refresh()
+
+    def __runTask(self, description, task, on_done):
+        if self.isBusy():
+            return
+
+        self._running_task = BackgroundTask("ert_gui_storage_thread", task, partial(self.__taskFinished, on_done))
+        self.__setBusy(True)
+        self._status_label.setText(description)
+        self._running_task.start()
+
+    def __taskFinished(self, on_done, value, error):
+        self._running_task = None
+        self.__setBusy(False)
+        self._status_label.setText("")
+
+        if error is not None:
+            QMessageBox.warning(self, "Warning", error, QMessageBox.Ok)
+            self.refresh()
+        else:
+            on_done(value)
+
+    def __setBusy(self, busy):
+        for button in (self._refresh_button, self._delete_button, self._archive_button):
+            button.setEnabled(not busy)
+        self.busyChanged.emit(busy)
+
+    def __showUsage(self, usages):
+        node_types = sorted(set(node_type for usage in usages for node_type in usage.by_type))
+        self._case_tree.clear()
+        self._case_tree.setColumnCount(3 + len(node_types))
+        self._case_tree.setHeaderLabels(["Case", "Size", "Files"] + node_types)
+
+        for usage in usages:
+            columns = [usage.name, StorageManager.formatSize(usage.total), str(usage.file_count)]
+            columns += [StorageManager.formatSize(usage.by_type.get(node_type, 0)) for node_type in node_types]
+            item = QTreeWidgetItem(columns)
+            item.setData(0, Qt.UserRole, usage.name)
+            for column in range(1, len(columns)):
+                item.setTextAlignment(column, Qt.AlignRight)
+            self._case_tree.addTopLevelItem(item)
+
+        for column in range(self._case_tree.columnCount()):
+            self._case_tree.resizeColumnToContents(column)
+
+        total = sum(usage.total for usage in usages)
+        self._status_label.setText("%d cases, %s in total" % (len(usages), StorageManager.formatSize(total)))
@@ -0,0 +1,34 @@
+#  Copyright (C) 2019  Equinor ASA, Norway.
+#
+#  The file 'storage_tool.py' is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+from ert_gui.ertwidgets import resourceIcon
+from ert_gui.ertwidgets.closabledialog import ClosableDialog
+from ert_gui.tools import Tool
+from ert_gui.tools.storage import StoragePanel
+
+
+class StorageTool(Tool):
+    NAME = "Manage Storage"
+    HELP_LINK = "tools/storage"
+    ICON = "ide/disk"
+
+    def __init__(self):
+        super(StorageTool, self).__init__(StorageTool.NAME, StorageTool.HELP_LINK, resourceIcon(StorageTool.ICON))
+
+    def trigger(self):
+        storage_panel = StoragePanel()
+        dialog = ClosableDialog("Manage Storage", storage_panel, self.parent())
+        storage_panel.busyChanged.connect(lambda busy: dialog.disableCloseButton() if busy else dialog.enableCloseButton())
+        dialog.exec_()
@@ -7,9 +7,13 @@ from ert_gui.tools.workflows import RunWorkflowWidget
 
 
 class WorkflowsTool(Tool):
+    NAME = "Run Workflow"
+    HELP_LINK = "tools/workflows"
+    ICON = "ide/to_do_list_checked_1"
+
     def __init__(self):
         enabled = len(getWorkflowNames()) > 0
-        super(WorkflowsTool, self).__init__("Run Workflow", "tools/workflows", resourceIcon("ide/to_do_list_checked_1"), enabled)
+        super(WorkflowsTool, self).__init__(WorkflowsTool.NAME, WorkflowsTool.HELP_LINK, resourceIcon(WorkflowsTool.ICON), enabled)
 
 
     def trigger(self):
@@ -40,6 +40,7 @@ setup(
             'ert_gui.tools.plot',
             'ert_gui.tools.plugins',
             'ert_gui.tools.run_analysis',
+            'ert_gui.tools.storage',
             'ert_gui.tools.workflows',
             'ert_gui.tools.plot.customize',
             'ert_gui.tools.plot.widgets',
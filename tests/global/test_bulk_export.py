@@ -0,0 +1,55 @@
+import os
+
+import pandas as pd
+
+from tests import ErtTest
+from res.test import ErtTestContext
+from ert_gui.bulk_export import BulkExporter
+
+
+class BulkExportTest(ErtTest):
+
+    def test_select_keys_and_chunks(self):
+        config_file = self.createTestPath(os.path.join("local", "snake_oil", "snake_oil.ert"))
+        with ErtTestContext('BulkExportSelectKeys', config_file) as work_area:
+            ert = work_area.getErt()
+            exporter = BulkExporter(ert, "export", chunk_size=2)
+
+            keys = exporter.selectKeys(BulkExporter.SUMMARY, ["WOPR:*", "FOPR"])
+            self.assertIn("WOPR:OP1", keys)
+            self.assertIn("FOPR", keys)
+            self.assertNotIn("FOPT", keys)
+
+            all_gen_kw = exporter.selectKeys(BulkExporter.GEN_KW)
+            self.assertEqual(all_gen_kw, list(ert.getKeyManager().genKwKeys()))
+
+            self.assertEqual(exporter.chunks(["a", "b", "c", "d", "e"]), [["a", "b"], ["c", "d"], ["e"]])
+            self.assertEqual(exporter.chunks([]), [])
+
+            tasks = exporter.tasks(["default_0", "default_1"], [BulkExporter.SUMMARY], ["WOPR:*", "FOPR"])
+            chunk_count = len(exporter.chunks(keys))
+            self.assertEqual(len(tasks), 2 * chunk_count)
+            self.assertEqual(tasks[0], ("default_0", BulkExporter.SUMMARY, 0, keys[:2]))
+
+            with self.assertRaises(ValueError):
+                BulkExporter(ert, "export", file_format="csv")
+
+    def test_export_gen_kw(self):
+        try:
+            BulkExporter.checkFormatAvailable("hdf5")
+        except ValueError:
+            return
+
+        config_file = self.createTestPath(os.path.join("local", "snake_oil", "snake_oil.ert"))
+        with ErtTestContext('BulkExportGenKw', config_file) as work_area:
+            ert = work_area.getErt()
+            exporter = BulkExporter(ert, "export", file_format="hdf5", chunk_size=3)
+
+            keys = exporter.selectKeys(BulkExporter.GEN_KW)
+            written = exporter.export(["default_0"], [BulkExporter.GEN_KW])
+            self.assertEqual(len(written), len(exporter.chunks(keys)))
+            self.assertEqual(written[0], os.path.join("export", "default_0", "gen_kw", "chunk_0000.h5"))
+
+            data = pd.concat([pd.read_hdf(path, "data").set_index("Realization") for path in written], axis=1)
+            self.assertEqual(list(data.columns), keys)
+            self.assertEqual(len(data), ert.getEnsembleSize())
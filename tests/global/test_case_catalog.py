@@ -0,0 +1,112 @@
+from res.enkf import RealizationStateEnum
+
+from tests import ErtTest
+from ert_gui import ERT, ert_queries
+from ert_gui.case_catalog import CaseCatalog
+from ert_gui.ert_adapter import ErtAdapter
+
+
+class _FakeFsManager(object):
+    def __init__(self):
+        self.cases = ["default", "hidden", "iter_1"]
+        self.calls = []
+
+    def getCaseList(self):
+        self.calls.append("getCaseList")
+        return list(self.cases)
+
+    def isCaseHidden(self, case):
+        self.calls.append("isCaseHidden")
+        return case == "hidden"
+
+    def isCaseInitialized(self, case):
+        self.calls.append("isCaseInitialized")
+        return case == "default"
+
+    def isCaseRunning(self, case):
+        self.calls.append("isCaseRunning")
+        return case == "iter_1"
+
+    def getStateMapForCase(self, case):
+        self.calls.append("getStateMapForCase")
+        if case == "iter_1":
+            return [RealizationStateEnum.STATE_HAS_DATA, RealizationStateEnum.STATE_UNDEFINED]
+        return [RealizationStateEnum.STATE_INITIALIZED]
+
+
+class _FakeErt(object):
+    def __init__(self):
+        self.fs_manager = _FakeFsManager()
+
+    def getEnkfFsManager(self):
+        return self.fs_manager
+
+
+class _FakeNotifier(object):
+    def __init__(self, ert):
+        self.ert = ert
+        self.changes = 0
+
+    def emitErtChange(self):
+        self.changes += 1
+
+
+class CaseCatalogTest(ErtTest):
+
+    def test_cases_are_read_once(self):
+        ert = _FakeErt()
+        catalog = CaseCatalog(_FakeNotifier(ert))
+
+        for _ in range(10):
+            self.assertEqual(catalog.caseNames(), ["default", "iter_1"])
+        self.assertEqual(catalog.caseNames(include_hidden=True), ["default", "hidden", "iter_1"])
+        self.assertEqual(ert.fs_manager.calls.count("getCaseList"), 1)
+        self.assertEqual(ert.fs_manager.calls.count("isCaseHidden"), 3)
+
+        self.assertTrue(catalog.exists("default"))
+        self.assertFalse(catalog.exists("hidden"))
+        self.assertFalse(catalog.exists("missing"))
+
+        for _ in range(5):
+            self.assertTrue(catalog.isInitialized("default"))
+            self.assertFalse(catalog.isInitialized("iter_1"))
+            self.assertTrue(catalog.isRunning("iter_1"))
+            self.assertTrue(catalog.hasData("iter_1"))
+            self.assertFalse(catalog.hasData("default"))
+        self.assertEqual(ert.fs_manager.calls.count("isCaseInitialized"), 2)
+        self.assertEqual(ert.fs_manager.calls.count("isCaseRunning"), 1)
+        self.assertEqual(ert.fs_manager.calls.count("getStateMapForCase"), 2)
+
+        ert.fs_manager.cases.append("iter_2")
+        self.assertNotIn("iter_2", catalog.caseNames())
+        catalog.refresh()
+        self.assertIn("iter_2", catalog.caseNames())
+        self.assertEqual(ert.fs_manager.calls.count("getCaseList"), 2)
+
+    def test_adapter_invalidates_the_catalog(self):
+        adapter = ErtAdapter()
+        ert = _FakeErt()
+        notifier = _FakeNotifier(ert)
+        adapter.adapt(notifier)
+        self.assertEqual(adapter.case_catalog.caseNames(), ["default", "iter_1"])
+
+        ert.fs_manager.cases.append("iter_2")
+        adapter.emitErtChange()
+        self.assertEqual(notifier.changes, 1)
+        self.assertEqual(adapter.case_catalog.caseNames(), ["default", "iter_1", "iter_2"])
+
+        other_ert = _FakeErt()
+        other_ert.fs_manager.cases = ["other"]
+        adapter.adapt(_FakeNotifier(other_ert))
+        self.assertEqual(adapter.case_catalog.caseNames(), ["other"])
+
+    def test_running_cases_are_not_cached(self):
+        ert = _FakeErt()
+        ERT.adapt(_FakeNotifier(ert))
+        self.assertEqual(ert_queries.getAllCasesNotRunning(), ["default"])
+        self.assertTrue(ERT.case_catalog.isRunning("iter_1"))
+
+        # A run starting or finishing does not invalidate the catalog
+        ert.fs_manager.isCaseRunning = lambda case: case == "default"
+        self.assertEqual(ert_queries.getAllCasesNotRunning(), ["iter_1"])
+        self.assertEqual(ert_queries.getAllCasesWithDataAndNotRunning(), ["iter_1"])
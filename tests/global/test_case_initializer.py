@@ -0,0 +1,59 @@
+from tests import ErtTest
+from ert_gui.case_initializer import CaseInitializer
+from ert_gui.task_pool import TaskProgress
+
+
+class _FakeFsManager(object):
+    def __init__(self, progress=None, cancel_after=None):
+        self.calls = []
+        self._progress = progress
+        self._cancel_after = cancel_after
+
+    def customInitializeCurrentFromExistingCase(self, source_case, source_report_step, mask, parameters):
+        members = [iens for iens in range(len(mask)) if mask[iens]]
+        self.calls.append((source_case, source_report_step, members, list(parameters)))
+        if self._cancel_after is not None and len(self.calls) == self._cancel_after:
+            self._progress.cancel()
+
+
+class _FakeErt(object):
+    def __init__(self, fs_manager, ensemble_size=25):
+        self._fs_manager = fs_manager
+        self._ensemble_size = ensemble_size
+
+    def getEnsembleSize(self):
+        return self._ensemble_size
+
+    def getEnkfFsManager(self):
+        return self._fs_manager
+
+
+class CaseInitializerTest(ErtTest):
+
+    def test_initialize_from_existing_in_chunks(self):
+        fs_manager = _FakeFsManager()
+        initializer = CaseInitializer(_FakeErt(fs_manager), chunk_size=10)
+        progress = TaskProgress()
+
+        members = [str(member) for member in range(25)]
+        initialized = initializer.initializeFromExisting("default", 3, ["COEFFS"], members, progress)
+
+        self.assertEqual(initialized, 25)
+        self.assertEqual([call[2] for call in fs_manager.calls], [list(range(10)), list(range(10, 20)),
+                                                                 list(range(20, 25))])
+        self.assertTrue(all(call[:2] == ("default", 3) for call in fs_manager.calls))
+        self.assertEqual(fs_manager.calls[0][3], ["COEFFS"])
+        self.assertEqual(progress.done(), 25)
+        self.assertEqual(progress.fraction(), 1.0)
+
+    def test_cancel_stops_between_chunks(self):
+        progress = TaskProgress()
+        fs_manager = _FakeFsManager(progress, cancel_after=2)
+        initializer = CaseInitializer(_FakeErt(fs_manager), chunk_size=5)
+
+        initialized = initializer.initializeFromExisting("default", 0, ["COEFFS"], list(range(25)), progress)
+
+        self.assertEqual(initialized, 10)
+        self.assertEqual(len(fs_manager.calls), 2)
+        self.assertEqual(progress.done(), 10)
+        self.assertEqual(progress.total(), 25)
@@ -1,9 +1,11 @@
 from tests import ErtTest
 from res.test import ErtTestContext
+import json
 import os
 import subprocess
 from res.enkf import EnKFMain, ResConfig
 from ecl.util.util import BoolVector
+from ecl.util.test import TestAreaContext
 from ert_gui import cli
 from ert_gui import ERT
 from ert_gui.cli import ErtCliNotifier
@@ -124,15 +126,16 @@ class EntryPointTest(ErtTest):
             ert = work_area.getErt()
             notifier = ErtCliNotifier(ert, config_file)
             ERT.adapt(notifier)
-            args = Namespace(realizations="0-4,7,8", weights="6,4,2", target_case="test_case")
+            args = Namespace(realizations="0-4,7,8", weights="6,4,2", target_case="test_case", resume=False)
 
             model, argument = cli._setup_multiple_data_assimilation(args)
             self.assertTrue(isinstance(model, MultipleDataAssimilation))
-            self.assertEquals(4, len(argument.keys()))
+            self.assertEquals(5, len(argument.keys()))
             self.assertTrue("active_realizations" in argument)
             self.assertTrue("target_case" in argument)
             self.assertTrue("analysis_module" in argument)
             self.assertTrue("weights" in argument)
+            self.assertTrue("resume" in argument)
 
     def test_analysis_module_name_iterable(self):
 
@@ -179,3 +182,21 @@ class EntryPointTest(ErtTest):
             active_name, modules, iterable=True)
 
         self.assertIsNone(name)
+
+    def test_progress_reporter_stopped_on_interrupt(self):
+        class Model(object):
+            def getProgressSnapshot(self):
+                return {"iteration": 0, "successful_realizations": [1]}
+
+        with TestAreaContext("test_progress_reporter_stopped_on_interrupt"):
+            args = Namespace(progress_format="jsonl", progress_file="progress.jsonl", progress_interval=60)
+            with self.assertRaises(KeyboardInterrupt):
+                with cli._progress_reporting(args, Model()):
+                    raise KeyboardInterrupt()
+
+            with open("progress.jsonl") as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertEqual(1, len(records))
+        self.assertEqual("finished", records[0]["event"])
+        self.assertEqual("KeyboardInterrupt", records[0]["error"])
@@ -0,0 +1,40 @@
+import json
+import subprocess
+import sys
+
+from tests import ErtTest
+
+# Seconds the ert_gui modules may add to the import of the command line
+# entry point, on top of the libres and libecl imports it cannot avoid.
+IMPORT_TIME_BUDGET = 1.0
+
+GUI_MODULES = ["PyQt4", "PyQt5", "ErtQt", "matplotlib"]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.time()
+import res.enkf, ecl.util.util
+libraries = time.time()
+import ert_gui.main
+done = time.time()
+print(json.dumps({"libraries": libraries - start, "ert_gui": done - libraries, "modules": list(sys.modules)}))
+"""
+
+
+class CliImportTest(ErtTest):
+
+    def importCli(self):
+        output = subprocess.check_output([sys.executable, "-c", IMPORT_SCRIPT])
+        return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+    def test_cli_does_not_import_gui_modules(self):
+        modules = self.importCli()["modules"]
+        for module in modules:
+            self.assertNotIn(module.split(".")[0], GUI_MODULES)
+            self.assertFalse(module.startswith("ert_gui.ertwidgets"), module)
+            self.assertFalse(module.startswith("ert_gui.tools"), module)
+
+    def test_cli_import_time(self):
+        # The best of a few runs, to not fail on a busy machine.
+        import_time = min(self.importCli()["ert_gui"] for _ in range(3))
+        self.assertLess(import_time, IMPORT_TIME_BUDGET)
@@ -0,0 +1,77 @@
+import os
+
+from ecl.util.test import TestAreaContext
+
+from tests import ErtTest
+from ert_gui.load_manifest import LoadManifest
+
+
+def _write(filename, content):
+    with open(filename, "w") as f:
+        f.write(content)
+
+
+class LoadManifestTest(ErtTest):
+
+    def test_unchanged_outputs_are_recognized(self):
+        with TestAreaContext("load_manifest"):
+            os.makedirs("storage")
+            os.makedirs("runpath")
+            _write("runpath/SNAKE_OIL_0.SMSPEC", "header")
+            _write("runpath/SNAKE_OIL_0.UNSMRY", "values")
+            _write("runpath/snake_oil_opr_diff_199.txt", "1.0\n2.0\n")
+            _write("runpath/jobs.json", "{}")
+
+            manifest = LoadManifest("storage", LoadManifest.SUMMARY_PATTERNS + ["snake_oil_opr_diff_*.txt"])
+            self.assertEqual(manifest.keyFiles("runpath"), ["SNAKE_OIL_0.SMSPEC", "SNAKE_OIL_0.UNSMRY",
+                                                            "snake_oil_opr_diff_199.txt"])
+            self.assertFalse(manifest.isUnchanged(0, 0, "runpath"))
+
+            manifest.record(0, 0, "runpath")
+            manifest.save()
+
+            manifest = LoadManifest("storage", LoadManifest.SUMMARY_PATTERNS + ["snake_oil_opr_diff_*.txt"])
+            self.assertTrue(manifest.isUnchanged(0, 0, "runpath"))
+            self.assertFalse(manifest.isUnchanged(0, 1, "runpath"))
+
+            # Touching a file without changing it keeps the realization unchanged.
+            os.utime("runpath/SNAKE_OIL_0.UNSMRY", (0, 0))
+            self.assertTrue(manifest.isUnchanged(0, 0, "runpath"))
+
+            _write("runpath/SNAKE_OIL_0.UNSMRY", "VALUES")
+            os.utime("runpath/SNAKE_OIL_0.UNSMRY", (0, 0))
+            self.assertFalse(manifest.isUnchanged(0, 0, "runpath"))
+
+            manifest.record(0, 0, "runpath")
+            self.assertTrue(manifest.isUnchanged(0, 0, "runpath"))
+            os.remove("runpath/snake_oil_opr_diff_199.txt")
+            self.assertFalse(manifest.isUnchanged(0, 0, "runpath"))
+
+    def test_runpath_without_outputs_is_never_unchanged(self):
+        with TestAreaContext("load_manifest_empty"):
+            os.makedirs("runpath")
+            manifest = LoadManifest(".")
+            manifest.record(3, 0, "runpath")
+            self.assertFalse(manifest.isUnchanged(3, 0, "runpath"))
+
+            manifest.forget(3)
+            manifest.save()
+            self.assertTrue(os.path.isfile(LoadManifest.MANIFEST_FILE))
+
+    def test_only_the_last_loaded_iteration_is_unchanged(self):
+        with TestAreaContext("load_manifest_iterations"):
+            for iteration in range(2):
+                os.makedirs("iter-%d" % iteration)
+                _write("iter-%d/SNAKE_OIL_0.UNSMRY" % iteration, "iteration %d" % iteration)
+
+            manifest = LoadManifest(".")
+            manifest.record(0, 0, "iter-0")
+            self.assertTrue(manifest.isUnchanged(0, 0, "iter-0"))
+
+            manifest.record(0, 1, "iter-1")
+            self.assertFalse(manifest.isUnchanged(0, 0, "iter-0"))
+            self.assertTrue(manifest.isUnchanged(0, 1, "iter-1"))
+
+            manifest.record(0, 0, "iter-0")
+            self.assertTrue(manifest.isUnchanged(0, 0, "iter-0"))
+            self.assertFalse(manifest.isUnchanged(0, 1, "iter-1"))
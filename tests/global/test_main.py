@@ -2,7 +2,7 @@ import argparse
 import sys
 import unittest
 
-from ert_gui.main import ert_parser
+from ert_gui.main import ert_parser, profile_directory
 from argparse import ArgumentParser
 
 
@@ -86,6 +86,162 @@ class MainTest(unittest.TestCase):
         self.assertEquals(parsed.weights, "3, 2, 1")
         self.assertEquals(parsed.func.__name__, "run_cli")
         self.assertFalse(parsed.verbose)    
+        self.assertFalse(parsed.resume)
+
+    def test_argparse_exec_ensemble_experiment_straggler_policy(self):
+        parser = ArgumentParser(prog="test_main")
+        parsed = ert_parser(parser, ['ensemble_experiment', "--straggler-threshold", "90%",
+                                     "--straggler-grace-time", "30", 'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.straggler_threshold, "90%")
+        self.assertEquals(parsed.straggler_grace_time, 30)
+
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['ensemble_experiment', "--straggler-grace-time", "0",
+                                                               'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.straggler_grace_time, 0)
+
+        with self.assertRaises(SystemExit):
+            ert_parser(ArgumentParser(prog="test_main"), ['ensemble_experiment', "--straggler-grace-time", "-1",
+                                                          'test-data/local/poly_example/poly.ert'])
+
+    def test_argparse_exec_ensemble_experiment_faulty_straggler_threshold(self):
+        parser = ArgumentParser(prog="test_main")
+        with self.assertRaises(SystemExit):
+            ert_parser(parser, ['ensemble_experiment', "--straggler-threshold", "150%",
+                                'test-data/local/poly_example/poly.ert'])
+
+    def test_argparse_exec_es_mda_slow_realization_factor(self):
+        parser = ArgumentParser(prog="test_main")
+        parsed = ert_parser(parser, ['es_mda', "--slow-realization-factor", "2.5",
+                                     'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.slow_realization_factor, 2.5)
+
+        with self.assertRaises(SystemExit):
+            ert_parser(ArgumentParser(prog="test_main"), ['es_mda', "--slow-realization-factor", "0",
+                                                          'test-data/local/poly_example/poly.ert'])
+
+    def test_argparse_exec_test_run_trace_file(self):
+        parser = ArgumentParser(prog="test_main")
+        parsed = ert_parser(parser, ['test_run', "--trace-file", "trace.json",
+                                     'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.trace_file, "trace.json")
+
+    def test_argparse_exec_ensemble_experiment_progress_format(self):
+        parser = ArgumentParser(prog="test_main")
+        parsed = ert_parser(parser, ['ensemble_experiment', "--progress-format", "jsonl",
+                                     "--progress-interval", "0.5", 'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.progress_format, "jsonl")
+        self.assertEquals(parsed.progress_interval, 0.5)
+        self.assertIsNone(parsed.progress_file)
+
+        with self.assertRaises(SystemExit):
+            ert_parser(ArgumentParser(prog="test_main"), ['ensemble_experiment', "--progress-format", "xml",
+                                                          'test-data/local/poly_example/poly.ert'])
+
+    def test_argparse_exec_profile(self):
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['test_run', 'test-data/local/poly_example/poly.ert'])
+        self.assertIsNone(profile_directory(parsed))
+
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['test_run', '--profile-dir', 'profile_dir',
+                                                               'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(profile_directory(parsed), "profile_dir")
+
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['test_run', '--profile', '--verbose',
+                                                               'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(profile_directory(parsed), "ert_profile")
+
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['es_mda', '--profile',
+                                                               'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.config, 'test-data/local/poly_example/poly.ert')
+        self.assertEquals(profile_directory(parsed), "ert_profile")
+
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['gui', '--profile-dir', 'gui_profile',
+                                                               'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(profile_directory(parsed), "gui_profile")
+
+    def test_argparse_exec_es_mda_resume(self):
+        parser = ArgumentParser(prog="test_main")
+        parsed = ert_parser(
+            parser, ['es_mda', '--resume', 'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.mode, "es_mda")
+        self.assertTrue(parsed.resume)
+
+    def test_argparse_exec_export(self):
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['export', 'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.mode, "export")
+        self.assertEquals(parsed.func.__name__, "run_export")
+        self.assertIsNone(parsed.cases)
+        self.assertIsNone(parsed.keys)
+        self.assertEquals(parsed.format, "parquet")
+        self.assertEquals(parsed.workers, 1)
+
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['export', '--cases', 'default,iter_1',
+                                                               '--keys', 'FOPR*', '--keys', 'COEFFS:*',
+                                                               '--data-type', 'summary', '--format', 'hdf5',
+                                                               '--chunk-size', '50', '--workers', '4',
+                                                               'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.cases, "default,iter_1")
+        self.assertEquals(parsed.keys, ["FOPR*", "COEFFS:*"])
+        self.assertEquals(parsed.data_types, ["summary"])
+        self.assertEquals(parsed.format, "hdf5")
+        self.assertEquals(parsed.chunk_size, 50)
+        self.assertEquals(parsed.workers, 4)
+
+        with self.assertRaises(SystemExit):
+            ert_parser(ArgumentParser(prog="test_main"), ['export', '--workers', '0',
+                                                          'test-data/local/poly_example/poly.ert'])
+
+    def test_argparse_exec_load_results(self):
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['load_results', 'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.mode, "load_results")
+        self.assertEquals(parsed.func.__name__, "run_load_results")
+        self.assertIsNone(parsed.case)
+        self.assertIsNone(parsed.realizations)
+        self.assertEquals(parsed.iteration, 0)
+        self.assertEquals(parsed.workers, 4)
+        self.assertFalse(parsed.skip_unchanged)
+
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['load_results', '--case', 'iter_1',
+                                                               '--realizations', '0-4,7', '--iteration', '1',
+                                                               '--workers', '8', '--skip-unchanged',
+                                                               'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.case, "iter_1")
+        self.assertEquals(parsed.realizations, "0-4,7")
+        self.assertEquals(parsed.iteration, 1)
+        self.assertEquals(parsed.workers, 8)
+        self.assertTrue(parsed.skip_unchanged)
+
+    def test_argparse_exec_init_case(self):
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['init_case', 'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.mode, "init_case")
+        self.assertEquals(parsed.func.__name__, "run_init_case")
+        self.assertIsNone(parsed.case)
+        self.assertIsNone(parsed.source_case)
+        self.assertIsNone(parsed.parameters)
+        self.assertEquals(parsed.report_step, 0)
+
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['init_case', '--case', 'prior', '--source-case', 'default',
+                                                               '--report-step', '5', '--parameters', 'COEFFS',
+                                                               '--realizations', '0-9',
+                                                               'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.case, "prior")
+        self.assertEquals(parsed.source_case, "default")
+        self.assertEquals(parsed.report_step, 5)
+        self.assertEquals(parsed.parameters, "COEFFS")
+        self.assertEquals(parsed.realizations, "0-9")
+
+    def test_argparse_exec_storage(self):
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['storage', 'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.mode, "storage")
+        self.assertEquals(parsed.func.__name__, "run_storage")
+        self.assertIsNone(parsed.delete)
+        self.assertIsNone(parsed.archive)
+
+        parsed = ert_parser(ArgumentParser(prog="test_main"), ['storage', '--delete', 'iter_1', '--delete', 'iter_2',
+                                                               '--archive', 'iter_3', '--archive-dir', 'archive',
+                                                               'test-data/local/poly_example/poly.ert'])
+        self.assertEquals(parsed.delete, ["iter_1", "iter_2"])
+        self.assertEquals(parsed.archive, ["iter_3"])
+        self.assertEquals(parsed.archive_dir, "archive")
 
 if __name__ == '__main__':
     unittest.main()
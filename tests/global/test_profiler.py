@@ -0,0 +1,34 @@
+import os
+
+from ecl.util.test import TestAreaContext
+
+from tests import ErtTest
+from ert_gui.profiler import Profiler
+
+
+def _work(count):
+    return sum(i * i for i in range(count))
+
+
+class ProfilerTest(ErtTest):
+
+    def test_regions(self):
+        with TestAreaContext("profiler"):
+            profiler = Profiler("profile")
+
+            for _ in range(2):
+                with profiler.region("Run forward model"):
+                    _work(1000)
+                    with profiler.region("plot gather"):
+                        _work(1000)
+
+            profiler.save()
+
+            self.assertTrue(os.path.isfile(os.path.join("profile", "Run_forward_model.pstats")))
+            self.assertTrue(os.path.isfile(os.path.join("profile", "plot_gather.txt")))
+
+            with open(os.path.join("profile", "regions.txt")) as f:
+                summary = f.read()
+
+        self.assertIn("Run forward model", summary)
+        self.assertIn("plot gather", summary)
@@ -0,0 +1,191 @@
+import os
+import threading
+import time
+
+from ecl.util.test import TestAreaContext
+from res.enkf import RealizationStateEnum
+
+from tests import ErtTest
+from ert_gui.load_manifest import LoadManifest
+from ert_gui.result_loader import LoadProgress, ResultLoader
+
+
+class _FakeFsManager(object):
+    def __init__(self, states):
+        self._states = states
+
+    def getFileSystem(self, case_name):
+        return case_name
+
+    def getStateMapForCase(self, case_name):
+        return self._states
+
+
+class _FakeErt(object):
+    """ Loads every realization of the mask except the failing ones, and updates the state map. """
+
+    def __init__(self, ensemble_size, failing=(), broken=None, has_data=()):
+        self._ensemble_size = ensemble_size
+        self._states = [RealizationStateEnum.STATE_HAS_DATA if iens in has_data
+                        else RealizationStateEnum.STATE_UNDEFINED for iens in range(ensemble_size)]
+        self._failing = set(failing)
+        self._broken = broken
+        self._lock = threading.Lock()
+        self._loading = 0
+        self.max_concurrent_loads = 0
+        self.calls = []
+
+    def getEnsembleSize(self):
+        return self._ensemble_size
+
+    def getEnkfFsManager(self):
+        return _FakeFsManager(self._states)
+
+    def loadFromForwardModel(self, mask, iteration, fs):
+        active = [iens for iens in range(len(mask)) if mask[iens]]
+        with self._lock:
+            self.calls.append((tuple(active), iteration, fs))
+            self._loading += 1
+            self.max_concurrent_loads = max(self.max_concurrent_loads, self._loading)
+        try:
+            time.sleep(0.001)
+            if self._broken in active:
+                raise IOError("Storage is broken")
+
+            for iens in active:
+                failed = iens in self._failing
+                self._states[iens] = (RealizationStateEnum.STATE_LOAD_FAILURE if failed
+                                      else RealizationStateEnum.STATE_HAS_DATA)
+            return len([iens for iens in active if iens not in self._failing])
+        finally:
+            with self._lock:
+                self._loading -= 1
+
+
+class _FakeRunpathIndex(object):
+    def __init__(self, runpaths):
+        self._runpaths = runpaths
+
+    def exists(self, iens, iteration=0):
+        return (iens, iteration) in self._runpaths
+
+    def runpath(self, iens, iteration=0):
+        return "realization-%d/iter-%d" % (iens, iteration)
+
+
+class _FakeManifest(object):
+    def __init__(self, unchanged):
+        self.unchanged = set(unchanged)
+        self.recorded = []
+        self.saved = False
+
+    def isUnchanged(self, iens, iteration, runpath):
+        return iens in self.unchanged
+
+    def record(self, iens, iteration, runpath):
+        self.recorded.append((iens, iteration, runpath))
+
+    def forget(self, iens):
+        pass
+
+    def save(self):
+        self.saved = True
+
+
+class ResultLoaderTest(ErtTest):
+
+    def test_load_reports_status_per_realization(self):
+        ert = _FakeErt(10, failing=[3, 7], has_data=[3])
+        reported = []
+        progress = LoadProgress(listener=lambda iens, status: reported.append((iens, status)))
+
+        loaded = ResultLoader(ert, workers=3, chunk_size=4).load("default", list(range(10)), 1, progress)
+
+        self.assertEqual(loaded, 8)
+        self.assertEqual(sorted(active for active, _, _ in ert.calls), [(0, 1, 2, 3), (4, 5, 6, 7), (8, 9)])
+        # The storage is not thread safe, so the chunks are loaded one after the other.
+        self.assertEqual(ert.max_concurrent_loads, 1)
+        self.assertTrue(all(iteration == 1 and fs == "default" for _, iteration, fs in ert.calls))
+
+        statuses = progress.statuses()
+        self.assertEqual(statuses[3], LoadProgress.FAILED)
+        self.assertEqual(statuses[7], LoadProgress.FAILED)
+        self.assertEqual(progress.count(LoadProgress.LOADED), 8)
+        self.assertEqual(progress.finished(), 10)
+        self.assertIn((3, LoadProgress.FAILED), reported)
+        self.assertIn((0, LoadProgress.LOADING), reported)
+
+    def test_cancel_stops_loading(self):
+        ert = _FakeErt(100)
+        progress = LoadProgress(listener=lambda iens, status: progress.cancel() if iens == 5 else None)
+
+        loaded = ResultLoader(ert, workers=2, chunk_size=10).load("default", list(range(100)), 0, progress)
+
+        self.assertTrue(progress.isCancelled())
+        self.assertLess(loaded, 100)
+        self.assertGreater(progress.count(LoadProgress.PENDING), 0)
+
+    def test_load_error_is_raised(self):
+        ert = _FakeErt(10, broken=4)
+        progress = LoadProgress()
+
+        with self.assertRaises(IOError):
+            ResultLoader(ert, workers=2, chunk_size=5).load("default", list(range(10)), 0, progress)
+
+        self.assertEqual([progress.statuses()[iens] for iens in range(5)], [LoadProgress.FAILED] * 5)
+
+    def test_realizations_without_runpath_are_missing(self):
+        ert = _FakeErt(4)
+        runpath_index = _FakeRunpathIndex([(0, 1), (2, 1)])
+        progress = LoadProgress()
+
+        loaded = ResultLoader(ert, workers=2, runpath_index=runpath_index).load("default", list(range(4)), 1, progress)
+
+        self.assertEqual(loaded, 2)
+        self.assertEqual([active for active, _, _ in ert.calls], [(0, 2)])
+        self.assertEqual(progress.statuses()[1], LoadProgress.MISSING)
+        self.assertEqual(progress.statuses()[3], LoadProgress.MISSING)
+        self.assertEqual(progress.finished(), 4)
+
+    def test_unchanged_realizations_with_data_are_skipped(self):
+        ert = _FakeErt(4, has_data=[0, 1, 2])
+        runpath_index = _FakeRunpathIndex([(iens, 0) for iens in range(4)])
+        manifest = _FakeManifest(unchanged=[1, 2, 3])
+        progress = LoadProgress()
+
+        loader = ResultLoader(ert, workers=2, runpath_index=runpath_index, manifest=manifest)
+        loaded = loader.load("default", list(range(4)), 0, progress, skip_unchanged=True)
+
+        # Realization 3 is unchanged on disk but has no data in the case.
+        self.assertEqual(loaded, 2)
+        self.assertEqual([active for active, _, _ in ert.calls], [(0, 3)])
+        self.assertEqual(progress.count(LoadProgress.UNCHANGED), 2)
+        self.assertEqual(sorted(manifest.recorded), [(0, 0, "realization-0/iter-0"), (3, 0, "realization-3/iter-0")])
+        self.assertTrue(manifest.saved)
+
+        loaded = loader.load("default", list(range(4)), 0, progress)
+        self.assertEqual(loaded, 4)
+
+    def test_realization_loaded_from_another_iteration_is_not_unchanged(self):
+        with TestAreaContext("result_loader_iterations"):
+            for iteration in range(2):
+                runpath = "realization-0/iter-%d" % iteration
+                os.makedirs(runpath)
+                with open(os.path.join(runpath, "SNAKE_OIL.UNSMRY"), "w") as f:
+                    f.write("iteration %d" % iteration)
+
+            ert = _FakeErt(1, has_data=[0])
+            runpath_index = _FakeRunpathIndex([(0, 0), (0, 1)])
+            loader = ResultLoader(ert, workers=1, runpath_index=runpath_index, manifest=LoadManifest("."))
+
+            for iteration in [0, 1, 0]:
+                progress = LoadProgress()
+                loaded = loader.load("default", [0], iteration, progress, skip_unchanged=True)
+                self.assertEqual(loaded, 1)
+                self.assertEqual(progress.statuses()[0], LoadProgress.LOADED)
+
+            self.assertEqual([iteration for _, iteration, _ in ert.calls], [0, 1, 0])
+
+            progress = LoadProgress()
+            loader.load("default", [0], 0, progress, skip_unchanged=True)
+            self.assertEqual(progress.statuses()[0], LoadProgress.UNCHANGED)
@@ -0,0 +1,98 @@
+import os
+
+from ecl.util.test import TestAreaContext
+
+from tests import ErtTest
+from ert_gui.runpath_index import RunpathIndex, RunpathIndexCache
+
+
+def _makeRunpath(path, marker=None):
+    os.makedirs(path)
+    if marker is not None:
+        with open(os.path.join(path, marker), "w") as f:
+            f.write("")
+
+
+class RunpathIndexTest(ErtTest):
+
+    def test_realizations_and_iterations_are_found(self):
+        with TestAreaContext("runpath_index"):
+            _makeRunpath("simulations/realization-0/iter-0", RunpathIndex.OK_FILE)
+            _makeRunpath("simulations/realization-0/iter-1", RunpathIndex.ERROR_FILE)
+            _makeRunpath("simulations/realization-2/iter-0")
+            _makeRunpath("simulations/realization-x/iter-0")
+            os.makedirs("simulations/realization-3")
+
+            index = RunpathIndex("simulations/realization-%d/iter-%d")
+
+            self.assertEqual(index.iterations(), [0, 1])
+            self.assertEqual(index.realizations(0), [0, 2])
+            self.assertEqual(index.realizations(1), [0])
+            self.assertEqual(index.runpath(2, 0), os.path.join("simulations", "realization-2", "iter-0"))
+            self.assertIsNone(index.runpath(3, 0))
+
+            self.assertEqual(index.matrix(3), [[RunpathIndex.OK, RunpathIndex.ERROR],
+                                               [RunpathIndex.MISSING, RunpathIndex.MISSING],
+                                               [RunpathIndex.PRESENT, RunpathIndex.MISSING]])
+
+    def test_refresh_finds_new_runpaths_and_markers(self):
+        with TestAreaContext("runpath_index_refresh"):
+            _makeRunpath("default/real_0/iteration_0")
+            index = RunpathIndex("<ERTCASE>/real_%d/iteration_%d")
+            self.assertEqual(index.state(0, 0), RunpathIndex.PRESENT)
+
+            _makeRunpath("default/real_1/iteration_0", RunpathIndex.OK_FILE)
+            with open("default/real_0/iteration_0/ERROR", "w") as f:
+                f.write("")
+            # Make sure the changes are seen with a coarse modification time.
+            os.utime("default", (0, 0))
+            os.utime("default/real_0/iteration_0", (0, 0))
+
+            index.refresh()
+            self.assertEqual(index.realizations(0), [0, 1])
+            self.assertEqual(index.state(0, 0), RunpathIndex.ERROR)
+            self.assertEqual(index.state(1, 0), RunpathIndex.OK)
+
+    def test_runpath_without_iteration(self):
+        with TestAreaContext("runpath_index_single"):
+            _makeRunpath("run/5")
+            index = RunpathIndex(os.path.abspath("run") + "/%d")
+            self.assertEqual(index.iterations(), [0])
+            self.assertEqual(index.realizations(), [5])
+
+    def test_every_iteration_uses_the_runpath_without_iteration(self):
+        with TestAreaContext("runpath_index_single_iterations"):
+            _makeRunpath("sim/real-0", RunpathIndex.OK_FILE)
+            _makeRunpath("sim/real-2")
+            index = RunpathIndex("sim/real-%d")
+
+            for iteration in range(3):
+                self.assertTrue(index.exists(0, iteration))
+                self.assertFalse(index.exists(1, iteration))
+                self.assertEqual(index.runpath(2, iteration), os.path.join("sim", "real-2"))
+                self.assertEqual(index.state(0, iteration), RunpathIndex.OK)
+                self.assertEqual(index.realizations(iteration), [0, 2])
+
+    def test_cache_reuses_the_index_of_a_case(self):
+        class _ModelConfig(object):
+            def getRunpathAsString(self):
+                return "<ERTCASE>/real_%d/iteration_%d"
+
+        class _Ert(object):
+            def getModelConfig(self):
+                return _ModelConfig()
+
+        with TestAreaContext("runpath_index_cache"):
+            _makeRunpath("default/real_0/iteration_0")
+            cache = RunpathIndexCache()
+            index = cache.index(_Ert(), "default")
+            self.assertEqual(index.realizations(0), [0])
+
+            _makeRunpath("default/real_1/iteration_0")
+            os.utime("default", (0, 0))
+            self.assertIs(cache.index(_Ert(), "default"), index)
+            self.assertEqual(index.realizations(0), [0, 1])
+
+            self.assertIsNot(cache.index(_Ert(), "other"), index)
+            cache.clear()
+            self.assertIsNot(cache.index(_Ert(), "default"), index)
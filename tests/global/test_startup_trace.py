@@ -0,0 +1,51 @@
+import os
+
+from ecl.util.test import TestAreaContext
+
+from tests import ErtTest
+from ert_gui.startup_trace import StartupTrace, ENVIRONMENT_VARIABLE
+
+
+class StartupTraceTest(ErtTest):
+
+    def test_report(self):
+        with TestAreaContext("startup_trace"):
+            trace = StartupTrace("startup.txt")
+            trace.addPhase("import", 10.0, 10.5)
+            with trace.phase("EnKFMain"):
+                pass
+
+            phases = trace.phases()
+            self.assertEqual([name for name, _, _ in phases], ["import", "EnKFMain"])
+            self.assertEqual(phases[0][2], 0.5)
+
+            trace.finish()
+            with open("startup.txt") as f:
+                report = f.read()
+
+        self.assertIn("import", report)
+        self.assertIn("EnKFMain", report)
+        self.assertIn("Total", report)
+
+    def test_from_environment(self):
+        old_value = os.environ.pop(ENVIRONMENT_VARIABLE, None)
+        try:
+            self.assertFalse(StartupTrace.fromEnvironment().isEnabled())
+
+            os.environ[ENVIRONMENT_VARIABLE] = "1"
+            self.assertTrue(StartupTrace.fromEnvironment().isEnabled())
+
+            os.environ[ENVIRONMENT_VARIABLE] = "0"
+            self.assertFalse(StartupTrace.fromEnvironment().isEnabled())
+        finally:
+            os.environ.pop(ENVIRONMENT_VARIABLE, None)
+            if old_value is not None:
+                os.environ[ENVIRONMENT_VARIABLE] = old_value
+
+    def test_disabled_trace_writes_nothing(self):
+        with TestAreaContext("startup_trace_disabled"):
+            trace = StartupTrace()
+            with trace.phase("show"):
+                pass
+            trace.finish()
+            self.assertEqual(os.listdir("."), [])
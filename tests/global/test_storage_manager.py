@@ -0,0 +1,115 @@
+import os
+import tarfile
+
+from ecl.util.test import TestAreaContext
+
+from tests import ErtTest
+from ert_gui.storage_manager import StorageManager
+
+
+def _write(filename, size):
+    directory = os.path.dirname(filename)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(filename, "wb") as f:
+        f.write(b"x" * size)
+
+
+class _FakeFileSystem(object):
+    def __init__(self, case_name):
+        self._case_name = case_name
+
+    def getCaseName(self):
+        return self._case_name
+
+
+class _FakeFsManager(object):
+    def __init__(self, enspath):
+        self._enspath = enspath
+        self.running = set()
+        self.mounted = set()
+
+    def getCaseList(self):
+        return sorted(os.listdir(self._enspath))
+
+    def isCaseRunning(self, case):
+        return case in self.running
+
+    def isCaseMounted(self, case):
+        return case in self.mounted
+
+    def getCurrentFileSystem(self):
+        return _FakeFileSystem("default")
+
+
+class _FakeModelConfig(object):
+    def getEnspath(self):
+        return "storage"
+
+
+class _FakeErt(object):
+    def __init__(self):
+        self.fs_manager = _FakeFsManager("storage")
+
+    def getModelConfig(self):
+        return _FakeModelConfig()
+
+    def getEnkfFsManager(self):
+        return self.fs_manager
+
+
+class StorageManagerTest(ErtTest):
+
+    def createStorage(self):
+        _write("storage/default/ert_fstab", 10)
+        _write("storage/default/Ensemble/mod_0/PARAMETER.data_0", 100)
+        _write("storage/iter_1/ert_fstab", 10)
+        _write("storage/iter_1/Ensemble/mod_0/PARAMETER.data_0", 200)
+        _write("storage/iter_1/Ensemble/mod_1/DYNAMIC_FORECAST.data_0", 1000)
+        _write("storage/iter_2/ert_fstab", 10)
+
+    def test_usage_by_case_and_node_type(self):
+        with TestAreaContext("storage_manager_scan"):
+            self.createStorage()
+            manager = StorageManager(_FakeErt(), workers=2)
+
+            usages = manager.scan()
+            self.assertEqual([usage.name for usage in usages], ["iter_1", "default", "iter_2"])
+
+            iter_1 = usages[0]
+            self.assertEqual(iter_1.total, 1210)
+            self.assertEqual(iter_1.file_count, 3)
+            self.assertEqual(iter_1.by_type, {"METADATA": 10, "PARAMETER": 200, "DYNAMIC_FORECAST": 1000})
+
+        self.assertEqual(StorageManager.formatSize(512), "512 B")
+        self.assertEqual(StorageManager.formatSize(1536), "1.5 KB")
+        self.assertEqual(StorageManager.formatSize(3 * 1024 ** 3), "3.0 GB")
+
+    def test_unsafe_cases_are_not_removed(self):
+        with TestAreaContext("storage_manager_remove"):
+            self.createStorage()
+            ert = _FakeErt()
+            ert.fs_manager.running.add("iter_1")
+            ert.fs_manager.mounted.add("iter_2")
+            manager = StorageManager(ert)
+
+            self.assertIsNotNone(manager.removalProblem("default"))
+            self.assertIsNotNone(manager.removalProblem("iter_1"))
+            self.assertIsNotNone(manager.removalProblem("iter_2"))
+            self.assertIsNotNone(manager.removalProblem("missing"))
+
+            with self.assertRaises(ValueError):
+                manager.deleteCase("iter_1")
+            self.assertTrue(os.path.isdir("storage/iter_1"))
+
+            ert.fs_manager.running.clear()
+            ert.fs_manager.mounted.clear()
+            manager.deleteCase("iter_2")
+            self.assertFalse(os.path.exists("storage/iter_2"))
+
+            os.mkdir("archive")
+            archive_path = manager.archiveCase("iter_1", "archive")
+            self.assertFalse(os.path.exists("storage/iter_1"))
+            self.assertEqual(archive_path, os.path.join("archive", "iter_1.tar.gz"))
+            with tarfile.open(archive_path) as archive:
+                self.assertIn("iter_1/Ensemble/mod_1/DYNAMIC_FORECAST.data_0", archive.getnames())
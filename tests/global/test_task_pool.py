@@ -0,0 +1,49 @@
+import threading
+
+from tests import ErtTest
+from ert_gui.task_pool import TaskProgress, runTasks
+
+
+class TaskPoolTest(ErtTest):
+
+    def test_run_tasks_counts_successful_tasks(self):
+        progress = TaskProgress()
+        names = set()
+        lock = threading.Lock()
+
+        def runTask(state, index):
+            with lock:
+                names.add(threading.current_thread().name)
+            return index % 3 == 0
+
+        count = runTasks(list(range(30)), runTask, progress, 4, "ert_gui_test_worker")
+
+        self.assertEqual(count, 10)
+        self.assertFalse(progress.isCancelled())
+        self.assertTrue(all(name.startswith("ert_gui_test_worker_") for name in names))
+
+    def test_first_error_cancels_and_is_raised(self):
+        progress = TaskProgress()
+
+        def runTask(state, index):
+            raise ValueError("Task %d failed" % index)
+
+        with self.assertRaises(ValueError):
+            runTasks(list(range(10)), runTask, progress, 2, "ert_gui_test_worker")
+        self.assertTrue(progress.isCancelled())
+
+    def test_progress(self):
+        progress = TaskProgress()
+        self.assertEqual(progress.fraction(), 1.0)
+
+        progress.start(4)
+        progress.advance()
+        progress.skip()
+        progress.advance(2)
+
+        self.assertEqual(progress.done(), 3)
+        self.assertEqual(progress.skipped(), 1)
+        self.assertEqual(progress.fraction(), 0.75)
+
+        progress.start(2)
+        self.assertEqual((progress.done(), progress.skipped()), (0, 0))
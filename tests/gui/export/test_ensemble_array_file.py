@@ -0,0 +1,53 @@
+import os
+
+import numpy
+
+from ecl.util.test import TestAreaContext
+
+from tests import ErtTest
+from ert_gui.tools.export.ensemble_array_file import EnsembleArrayFile, h5py
+
+
+class EnsembleArrayFileTest(ErtTest):
+
+    def test_gen_kw_rows(self):
+        if not EnsembleArrayFile.isAvailable():
+            return
+
+        with TestAreaContext("ensemble_array_file_gen_kw"):
+            array_file = EnsembleArrayFile("COEFFS.h5", "COEFFS", [0, 2, 5], ["A", "B"])
+            array_file.write(2, [5.0, 50.0])
+            array_file.write(0, [0.0, 10.0])
+            array_file.close()
+
+            with h5py.File("COEFFS.h5", "r") as f:
+                self.assertEqual(f.attrs["keyword"], "COEFFS")
+                self.assertEqual(list(f["realizations"][:]), [0, 2, 5])
+                self.assertEqual([name.decode("utf-8") for name in f["index"][:]], ["A", "B"])
+                self.assertEqual(list(f["loaded"][:]), [True, False, True])
+
+                values = f["values"][:]
+                self.assertEqual(values.shape, (3, 2))
+                self.assertEqual(list(values[0]), [0.0, 10.0])
+                self.assertTrue(numpy.isnan(values[1]).all())
+                self.assertEqual(list(values[2]), [5.0, 50.0])
+
+    def test_gen_data_rows_grow(self):
+        if not EnsembleArrayFile.isAvailable():
+            return
+
+        with TestAreaContext("ensemble_array_file_gen_data"):
+            array_file = EnsembleArrayFile("SNAKE_OIL_WPR_DIFF.h5", "SNAKE_OIL_WPR_DIFF", [0, 1])
+            array_file.write(1, [1.0, 2.0])
+            array_file.write(0, [1.0, 2.0, 3.0])
+            array_file.close()
+
+            with h5py.File("SNAKE_OIL_WPR_DIFF.h5", "r") as f:
+                values = f["values"][:]
+                self.assertNotIn("index", f)
+
+            self.assertEqual(values.shape, (2, 3))
+            self.assertEqual(list(values[0]), [1.0, 2.0, 3.0])
+            self.assertEqual(list(values[1][:2]), [1.0, 2.0])
+            self.assertTrue(numpy.isnan(values[1][2]))
+            self.assertTrue(os.path.isfile("SNAKE_OIL_WPR_DIFF.h5"))
@@ -0,0 +1,57 @@
+import os
+
+from ecl.util.test import TestAreaContext
+
+from tests import ErtTest
+from ert_gui.tools.export.export_manifest import ExportManifest
+
+
+class ExportManifestTest(ErtTest):
+
+    def test_unchanged_files_are_recognized(self):
+        with TestAreaContext("export_manifest"):
+            os.mkdir("export")
+            filename = os.path.join("export", "COEFFS_0.txt")
+            digest = ExportManifest.digest("Parameter list", [1.0, 2.5])
+
+            manifest = ExportManifest("export")
+            self.assertFalse(manifest.isUnchanged(filename, digest))
+
+            with open(filename, "w") as f:
+                f.write("A 1.0\nB 2.5\n")
+            manifest.record(filename, digest)
+            manifest.save()
+
+            manifest = ExportManifest("export")
+            self.assertTrue(manifest.isUnchanged(filename, digest))
+            self.assertFalse(manifest.isUnchanged(filename, ExportManifest.digest("Parameter list", [1.0, 2.6])))
+            self.assertFalse(manifest.isUnchanged(filename, ExportManifest.digest("Template based", [1.0, 2.5])))
+
+            os.remove(filename)
+            self.assertFalse(manifest.isUnchanged(filename, digest))
+
+    def test_template_changes_are_recognized(self):
+        with TestAreaContext("export_manifest_template"):
+            with open("template.tmpl", "w") as f:
+                f.write("A <A>\n")
+            template = ExportManifest.templateDigest("template.tmpl")
+            digest = ExportManifest.digest("Template based", [1.0], template)
+            self.assertEqual(digest, ExportManifest.digest("Template based", [1.0],
+                                                           ExportManifest.templateDigest("template.tmpl")))
+            self.assertNotEqual(digest, ExportManifest.digest("Template based", [1.0]))
+
+            with open("template.tmpl", "w") as f:
+                f.write("B <A>\n")
+            self.assertNotEqual(digest, ExportManifest.digest("Template based", [1.0],
+                                                              ExportManifest.templateDigest("template.tmpl")))
+            self.assertNotEqual(ExportManifest.templateDigest("template.tmpl"),
+                                ExportManifest.templateDigest("missing.tmpl"))
+
+    def test_broken_manifest_is_ignored(self):
+        with TestAreaContext("export_manifest_broken"):
+            os.mkdir("export")
+            with open(os.path.join("export", ExportManifest.MANIFEST_FILE), "w") as f:
+                f.write("{not json")
+
+            manifest = ExportManifest("export")
+            self.assertFalse(manifest.isUnchanged(os.path.join("export", "COEFFS_0.txt"), "digest"))
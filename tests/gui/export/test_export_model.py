@@ -0,0 +1,63 @@
+import threading
+
+from tests import ErtTest
+from ert_gui.task_pool import TaskProgress
+from ert_gui.tools.export.export_model import ExportModel
+
+
+class ExportModelTest(ErtTest):
+
+    def test_run_tasks_reuses_worker_state(self):
+        model = ExportModel(workers=3)
+        progress = TaskProgress()
+        progress.start(20)
+        states = []
+        exported = []
+        lock = threading.Lock()
+
+        def createState():
+            state = object()
+            with lock:
+                states.append(state)
+            return state
+
+        def runTask(state, index):
+            with lock:
+                exported.append((state, index))
+            return index % 2 == 0
+
+        count = model._runTasks(list(range(20)), runTask, progress, createState)
+
+        self.assertEqual(count, 10)
+        self.assertEqual(sorted(index for _, index in exported), list(range(20)))
+        self.assertLessEqual(len(states), 3)
+        self.assertTrue(set(state for state, _ in exported) <= set(states))
+        self.assertEqual(progress.done(), 20)
+        self.assertEqual(progress.fraction(), 1.0)
+
+    def test_cancel_stops_workers(self):
+        model = ExportModel(workers=2)
+        progress = TaskProgress()
+        progress.start(100)
+
+        def runTask(state, index):
+            if index == 5:
+                progress.cancel()
+            return True
+
+        count = model._runTasks(list(range(100)), runTask, progress)
+        self.assertTrue(progress.isCancelled())
+        self.assertLess(count, 100)
+
+    def test_task_error_is_raised(self):
+        model = ExportModel(workers=2)
+        progress = TaskProgress()
+
+        def runTask(state, index):
+            if index == 3:
+                raise IOError("Disk full")
+            return True
+
+        with self.assertRaises(IOError):
+            model._runTasks(list(range(10)), runTask, progress)
+        self.assertTrue(progress.isCancelled())
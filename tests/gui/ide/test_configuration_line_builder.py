@@ -128,3 +128,37 @@ class ConfigurationLineBuilderTest(ErtTest):
 
 
 
+
+    def test_cached_lines(self):
+        keywords = ErtKeywords()
+        clb = ConfigurationLineBuilder(keywords, cache_size=2)
+
+        clb.processLine("NUM_REALIZATIONS 25 -- comment")
+        config_line = clb.configurationLine()
+        self.assertEqual(clb.cacheCount(), 1)
+
+        clb.processLine("JOBNAME job_%d")
+        self.assertFalse(clb.hasComment())
+
+        clb.processLine("NUM_REALIZATIONS 25 -- comment")
+        self.assertIs(clb.configurationLine(), config_line)
+        self.assertTrue(clb.hasComment())
+        self.assertEqual(clb.commentIndex(), 20)
+        self.assertEqual(clb.cacheCount(), 2)
+
+        clb.processLine("-- only a comment")
+        self.assertFalse(clb.hasConfigurationLine())
+        self.assertEqual(clb.cacheCount(), 2)
+
+        clb.processLine("JOBNAME job_%d")
+        self.assertEqual(clb.configurationLine().keyword().value(), "JOBNAME")
+
+        clb.processLine("NUM_REALIZATIONS 25 -- comment")
+        self.assertIsNot(clb.configurationLine(), config_line)
+
+        clb.clearCache()
+        self.assertEqual(clb.cacheCount(), 0)
+
+        clb = ConfigurationLineBuilder(keywords)
+        clb.processLine("NUM_REALIZATIONS 25")
+        self.assertEqual(clb.cacheCount(), 0)
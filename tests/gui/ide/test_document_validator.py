@@ -0,0 +1,55 @@
+from ert_gui.ide.keywords.document_validator import DocumentValidator
+from tests import ErtTest
+
+
+class DocumentValidatorTest(ErtTest):
+
+    def test_valid_document(self):
+        text = "\n".join(["DEFINE <USER> TEST_USER",
+                          "NUM_REALIZATIONS 25",
+                          "RUNPATH <USER>/realization%d",
+                          "ANALYSIS_COPY STD_ENKF ENKF_HIGH_TRUNCATION",
+                          "ANALYSIS_SELECT ENKF_HIGH_TRUNCATION",
+                          "GEN_KW A a.tmpl a.txt a.txt",
+                          "GEN_KW B b.tmpl b.txt b.txt"])
+
+        self.assertEqual(DocumentValidator().validate(text), [])
+
+
+    def test_duplicate_keywords(self):
+        text = "\n".join(["NUM_REALIZATIONS 25",
+                          "DEFINE <KEY> a",
+                          "-- NUM_REALIZATIONS 10",
+                          "NUM_REALIZATIONS 50",
+                          "  DEFINE <KEY> b"])
+
+        problems = DocumentValidator().validate(text)
+        self.assertEqual(len(problems), 2)
+
+        self.assertEqual(problems[0].lineNumber(), 3)
+        self.assertEqual((problems[0].fromIndex(), problems[0].toIndex()), (0, 16))
+        self.assertEqual(problems[0].message(), DocumentValidator.KEYWORD_ALREADY_SET % 1)
+
+        self.assertEqual(problems[1].lineNumber(), 4)
+        self.assertEqual((problems[1].fromIndex(), problems[1].toIndex()), (9, 14))
+        self.assertEqual(problems[1].message(), DocumentValidator.DEFINE_ALREADY_SET % ("<KEY>", 2))
+
+
+    def test_references_defined_later(self):
+        text = "\n".join(["RUNPATH <ROOT>/realization%d",
+                          "ANALYSIS_SELECT MY_MODULE",
+                          "DEFINE <ROOT> /scratch",
+                          "ANALYSIS_LOAD MY_MODULE rml_enkf.so",
+                          "ANALYSIS_SET_VAR MY_MODULE ENKF_TRUNCATION 0.95"])
+
+        problems = DocumentValidator().validate(text)
+        self.assertEqual(len(problems), 2)
+
+        self.assertEqual(problems[0].lineNumber(), 0)
+        self.assertEqual((problems[0].fromIndex(), problems[0].toIndex()), (8, 14))
+        self.assertTrue(10 in problems[0])
+        self.assertEqual(problems[0].message(), DocumentValidator.DEFINED_LATER % ("<ROOT>", 3))
+
+        self.assertEqual(problems[1].lineNumber(), 1)
+        self.assertEqual((problems[1].fromIndex(), problems[1].toIndex()), (16, 25))
+        self.assertEqual(problems[1].message(), DocumentValidator.DEFINED_LATER % ("MY_MODULE", 4))
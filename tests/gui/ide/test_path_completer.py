@@ -0,0 +1,45 @@
+import os
+
+from ecl.util.test import TestAreaContext
+
+from ert_gui.ide.completers.path_completer import PathCompleter
+from tests import ErtTest
+
+
+class PathCompleterTest(ErtTest):
+
+    def test_complete_options(self):
+        with TestAreaContext("path_completer"):
+            os.makedirs("data/sim")
+            os.makedirs("data/Setup")
+            for filename in ["data/Summary.txt", "data/setup.txt", "data/obs.txt"]:
+                with open(filename, "w") as f:
+                    f.write("")
+
+            completer = PathCompleter()
+
+            self.assertEqual(completer.completeOptions("da"), ["data/"])
+            self.assertEqual(completer.completeOptions("data/"),
+                             ["data/obs.txt", "data/setup.txt", "data/Summary.txt", "data/Setup/", "data/sim/"])
+            self.assertEqual(completer.completeOptions("data/s"), ["data/setup.txt", "data/sim/"])
+            self.assertEqual(completer.completeOptions("data/S"), ["data/Summary.txt", "data/Setup/"])
+            self.assertEqual(completer.completeOptions("missing/s"), [])
+
+
+    def test_cached_listing(self):
+        with TestAreaContext("path_completer_cache"):
+            os.makedirs("data")
+            completer = PathCompleter(ttl=3600)
+            self.assertEqual(completer.completeOptions("data/a"), [])
+
+            with open("data/a.txt", "w") as f:
+                f.write("")
+
+            self.assertEqual(completer.completeOptions("data/a"), [])
+
+            completer.invalidate("data")
+            self.assertEqual(completer.completeOptions("data/a"), ["data/a.txt"])
+
+            os.makedirs("data/ab")
+            completer = PathCompleter(ttl=0)
+            self.assertEqual(completer.completeOptions("data/a"), ["data/a.txt", "data/ab/"])
@@ -0,0 +1,26 @@
+from ert_gui.ide.keywords.definitions import RealizationThresholdArgument
+from tests import ErtTest
+
+
+class RealizationThresholdArgumentTest(ErtTest):
+
+    def test_realization_threshold_argument(self):
+        threshold = RealizationThresholdArgument()
+
+        self.assertTrue(threshold.validate("45"))
+        self.assertTrue(threshold.validate("80%"))
+        self.assertTrue(threshold.validate("100%"))
+
+        self.assertFalse(threshold.validate(""))
+        self.assertFalse(threshold.validate("0"))
+        self.assertFalse(threshold.validate("0%"))
+        self.assertFalse(threshold.validate("101%"))
+        self.assertFalse(threshold.validate("80 %"))
+        self.assertFalse(threshold.validate("many"))
+
+        self.assertEqual(threshold.validate("45").value(), 45)
+        self.assertAlmostEqual(threshold.validate("80%").value(), 0.8)
+
+    def test_optional_realization_threshold_argument(self):
+        threshold = RealizationThresholdArgument(optional=True)
+        self.assertTrue(threshold.validate(""))
@@ -1,9 +1,18 @@
+import os
+import sys
+
+from ecl.util.test import TestAreaContext
 from tests import ErtTest
 from res.enkf import EnKFMain
 from res.test import ErtTestContext
 from ert_gui.simulation.models import BaseRunModel
 from ert_gui import configureErtNotifier
 
+if sys.version_info >= (3, 3):
+    from unittest.mock import Mock, patch
+else:
+    from mock import Mock, patch
+
 class BaseRunModelTest(ErtTest):
 
     def test_instantiation(self):
@@ -14,3 +23,29 @@ class BaseRunModelTest(ErtTest):
             brm = BaseRunModel(ert.get_queue_config( ))
             self.assertFalse(brm.isQueueRunning())
             self.assertTrue(brm.getProgress() >= 0)
+
+    def test_run_steps_on_job_queue(self):
+        job_queue = Mock()
+        run_context = Mock()
+        ert = Mock()
+        simulation_runner = ert.getEnkfSimulationRunner.return_value
+        simulation_runner.runSimpleStep.return_value = 3
+        simulation_runner.runEnsembleExperiment.return_value = 5
+
+        brm = BaseRunModel(Mock())
+        brm._job_queue = job_queue
+        with patch.object(BaseRunModel, "ert", return_value=ert):
+            self.assertEqual(3, brm.runSimpleStep(run_context))
+            self.assertEqual(5, brm.runEnsembleExperiment(run_context))
+
+        simulation_runner.runSimpleStep.assert_called_once_with(job_queue, run_context)
+        simulation_runner.runEnsembleExperiment.assert_called_once_with(job_queue, run_context)
+
+    def test_finish_run_writes_trace_and_job_statistics(self):
+        with TestAreaContext("base_run_model_finish_run"):
+            brm = BaseRunModel(Mock())
+            brm.finishRun({"trace_file": "trace.json", "job_statistics_file": "job_statistics.json"})
+
+            self.assertTrue(os.path.isfile("trace.json"))
+            self.assertTrue(os.path.isfile("job_statistics.json"))
+            self.assertIsNone(brm._run_context)
@@ -0,0 +1,68 @@
+import json
+import os
+
+from ecl.util.test import TestAreaContext
+from res.job_queue import JobStatusType
+
+from tests import ErtTest
+from ert_gui.simulation.models import FakeQueueConfig, FakeJobQueue
+
+
+class _RunArg(object):
+
+    def __init__(self, iens, runpath):
+        self.iens = iens
+        self.runpath = runpath
+
+
+class FakeJobQueueTest(ErtTest):
+
+    def test_config_from_string(self):
+        config = FakeQueueConfig.fromString("mean_runtime=600, failure_rate=0.1,seed=3")
+        self.assertEqual(600.0, config.mean_runtime)
+        self.assertEqual(0.1, config.failure_rate)
+        self.assertEqual(3, config.seed)
+
+        with self.assertRaises(ValueError):
+            FakeQueueConfig.fromString("mean_runtime")
+
+        with self.assertRaises(ValueError):
+            FakeQueueConfig.fromString("no_such_option=1")
+
+    def test_run_step(self):
+        with TestAreaContext("fake_job_queue"):
+            run_context = [_RunArg(iens, "realization-%d" % iens) for iens in range(4)]
+            run_context.insert(2, None)
+
+            config = FakeQueueConfig(mean_runtime=10, pending_time=1, time_scale=0.001, job_count=3,
+                                     max_running=2, seed=1, poll_interval=0.001)
+            job_queue = FakeJobQueue(config)
+
+            self.assertEqual(4, job_queue.runStep(run_context))
+            self.assertEqual(4, len(job_queue))
+            self.assertFalse(job_queue.isRunning())
+
+            for run_arg in run_context[3:]:
+                self.assertEqual(JobStatusType.JOB_QUEUE_SUCCESS, job_queue.getJobStatus(job_queue.queueIndex(run_arg.iens)))
+                self.assertTrue(os.path.isfile(os.path.join(run_arg.runpath, "OK")))
+
+                with open(os.path.join(run_arg.runpath, "status.json")) as f:
+                    status = json.load(f)
+                self.assertEqual(3, len(status["jobs"]))
+                self.assertTrue(all(job["status"] == "Success" for job in status["jobs"]))
+
+            with self.assertRaises(ValueError):
+                job_queue.queueIndex(10)
+
+    def test_failures(self):
+        with TestAreaContext("fake_job_queue_failures"):
+            run_context = [_RunArg(iens, "realization-%d" % iens) for iens in range(3)]
+
+            config = FakeQueueConfig(mean_runtime=10, failure_rate=1.0, pending_time=0, time_scale=0.001,
+                                     poll_interval=0.001)
+            job_queue = FakeJobQueue(config)
+
+            self.assertEqual(0, job_queue.runStep(run_context))
+            for run_arg in run_context:
+                self.assertEqual(JobStatusType.JOB_QUEUE_FAILED, job_queue.getJobStatus(job_queue.queueIndex(run_arg.iens)))
+                self.assertTrue(os.path.isfile(os.path.join(run_arg.runpath, "ERROR")))
@@ -0,0 +1,73 @@
+import json
+
+from ecl.util.test import TestAreaContext
+
+from tests import ErtTest
+from ert_gui.simulation.models import JobRuntimeStatistics, RuntimeHistogram
+
+
+class _Job(object):
+
+    def __init__(self, name, status, start_time=None, end_time=None):
+        self.name = name
+        self.status = status
+        self.start_time = start_time
+        self.end_time = end_time
+
+
+class JobRuntimeStatisticsTest(ErtTest):
+
+    def test_histogram(self):
+        self.assertEqual(0, RuntimeHistogram.bucketIndex(0.5))
+        self.assertEqual(1, RuntimeHistogram.bucketIndex(1.0))
+        self.assertEqual(RuntimeHistogram.BUCKET_COUNT - 1, RuntimeHistogram.bucketIndex(1e12))
+
+        histogram = RuntimeHistogram()
+        self.assertIsNone(histogram.quantile(0.5))
+
+        for runtime in [10, 10, 10, 100, 1000]:
+            histogram.add(runtime)
+
+        lower, upper = RuntimeHistogram.bucketBounds(RuntimeHistogram.bucketIndex(10))
+        self.assertTrue(lower <= histogram.quantile(0.5) <= upper)
+        self.assertTrue(lower <= 10 < upper)
+
+        lower, upper = RuntimeHistogram.bucketBounds(RuntimeHistogram.bucketIndex(1000))
+        self.assertTrue(lower <= histogram.quantile(1.0) <= upper)
+
+    def test_jobs_are_counted_once(self):
+        statistics = JobRuntimeStatistics()
+        statistics.record(0, 0, [_Job("ECLIPSE", "Running", 100)])
+        self.assertEqual([], statistics.summary())
+
+        jobs = [_Job("COPY", "Success", 0, 2), _Job("ECLIPSE", "Success", 100, 160)]
+        statistics.record(0, 0, jobs)
+        statistics.record(0, 0, jobs)
+        statistics.record(0, 1, [_Job("COPY", "Success", 0, 4), _Job("ECLIPSE", "Failure", 100)])
+        statistics.record(1, 0, [_Job("COPY", "Success", 10, 13)])
+
+        summary = {job["name"]: job for job in statistics.summary()}
+        self.assertEqual(["COPY", "ECLIPSE"], [job["name"] for job in statistics.summary()])
+
+        self.assertEqual(3, summary["COPY"]["success_count"])
+        self.assertEqual(0, summary["COPY"]["failure_count"])
+        self.assertAlmostEqual(3.0, summary["COPY"]["mean_runtime"])
+        self.assertEqual(2, summary["COPY"]["min_runtime"])
+        self.assertEqual(4, summary["COPY"]["max_runtime"])
+
+        self.assertEqual(1, summary["ECLIPSE"]["success_count"])
+        self.assertEqual(1, summary["ECLIPSE"]["failure_count"])
+        self.assertEqual(60, summary["ECLIPSE"]["median_runtime"])
+
+    def test_save(self):
+        statistics = JobRuntimeStatistics()
+        statistics.record(0, 0, [_Job("COPY", "Success", 0, 2)])
+
+        with TestAreaContext("job_runtime_statistics"):
+            statistics.save("statistics.json")
+            with open("statistics.json") as f:
+                data = json.load(f)
+
+        self.assertEqual(1, len(data["jobs"]))
+        self.assertEqual("COPY", data["jobs"][0]["name"])
+        self.assertEqual([1], [bucket["count"] for bucket in data["jobs"][0]["histogram"]])
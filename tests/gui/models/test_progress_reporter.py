@@ -0,0 +1,68 @@
+import json
+
+from ecl.util.test import TestAreaContext
+
+from tests import ErtTest
+from ert_gui.simulation.models import ProgressReporter
+
+
+class _Model(object):
+
+    def __init__(self):
+        self.successful_realizations = []
+        self.iteration = 0
+
+    def getProgressSnapshot(self):
+        return {"phase": 0,
+                "phase_count": 1,
+                "phase_name": "Running simulations",
+                "progress": 0.5,
+                "iteration": self.iteration,
+                "queue_status": {"running": 2},
+                "successful_realizations": list(self.successful_realizations),
+                "running_time": 10,
+                "finished": False,
+                "failed": False}
+
+
+class ProgressReporterTest(ErtTest):
+
+    def test_completed_realizations_are_reported_once(self):
+        model = _Model()
+        reporter = ProgressReporter(model)
+        reporter._start_time = 0
+
+        model.successful_realizations = [0, 3]
+        record = reporter.record()
+        self.assertEqual([0, 3], record["completed_realizations"])
+        self.assertEqual(2, record["completed_count"])
+        self.assertEqual("progress", record["event"])
+
+        model.successful_realizations = [0, 1, 3]
+        record = reporter.record()
+        self.assertEqual([1], record["completed_realizations"])
+        self.assertEqual(3, record["completed_count"])
+
+        model.iteration = 1
+        model.successful_realizations = [0]
+        record = reporter.record()
+        self.assertEqual([0], record["completed_realizations"])
+        self.assertEqual(1, record["completed_count"])
+
+    def test_write_to_file(self):
+        model = _Model()
+        model.successful_realizations = [2]
+
+        with TestAreaContext("progress_reporter"):
+            reporter = ProgressReporter(model, path="progress.jsonl", interval=60)
+            reporter.start()
+            reporter.stop(error="Simulation failed!")
+
+            with open("progress.jsonl") as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertEqual(1, len(records))
+        self.assertEqual("finished", records[0]["event"])
+        self.assertTrue(records[0]["failed"])
+        self.assertEqual("Simulation failed!", records[0]["error"])
+        self.assertEqual([2], records[0]["completed_realizations"])
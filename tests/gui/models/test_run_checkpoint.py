@@ -0,0 +1,32 @@
+import os
+
+from ecl.util.test import TestAreaContext
+from tests import ErtTest
+from ert_gui.simulation.models import RunCheckpoint
+
+
+class RunCheckpointTest(ErtTest):
+
+    def test_missing_checkpoint(self):
+        with TestAreaContext("run_checkpoint_missing"):
+            self.assertIsNone(RunCheckpoint.load("es_mda_checkpoint.json"))
+
+    def test_save_and_load(self):
+        with TestAreaContext("run_checkpoint_save_load"):
+            checkpoint = RunCheckpoint("iter_%d", [1.7, 1.7, 1.7], 10, [0, 1, 2, 5])
+            self.assertEqual(["iter_0"], checkpoint.caseNames())
+
+            checkpoint.iteration = 1
+            checkpoint.save("es_mda_checkpoint.json")
+            self.assertFalse(os.path.exists("es_mda_checkpoint.json.tmp"))
+
+            loaded = RunCheckpoint.load("es_mda_checkpoint.json")
+            self.assertEqual("iter_%d", loaded.target_case_format)
+            self.assertEqual([1.7, 1.7, 1.7], loaded.weights)
+            self.assertEqual(10, loaded.ensemble_size)
+            self.assertEqual([0, 1, 2, 5], loaded.active_realizations)
+            self.assertEqual(1, loaded.iteration)
+            self.assertEqual(["iter_0", "iter_1", "iter_2"], loaded.caseNames())
+
+            RunCheckpoint.remove("es_mda_checkpoint.json")
+            self.assertIsNone(RunCheckpoint.load("es_mda_checkpoint.json"))
@@ -0,0 +1,38 @@
+import json
+
+from ecl.util.test import TestAreaContext
+from tests import ErtTest
+from ert_gui.simulation.models import RunTrace
+
+
+class RunTraceTest(ErtTest):
+
+    def test_span(self):
+        trace = RunTrace()
+        with trace.span("createRunPath", iteration=2):
+            pass
+
+        spans = [event for event in trace.events() if event["ph"] == "X"]
+        self.assertEqual(1, len(spans))
+        self.assertEqual("createRunPath", spans[0]["name"])
+        self.assertEqual("phase", spans[0]["cat"])
+        self.assertEqual({"iteration": 2}, spans[0]["args"])
+        self.assertTrue(spans[0]["dur"] >= 0)
+
+    def test_save(self):
+        trace = RunTrace()
+        trace.setThreadName(4, "Realization 3")
+        trace.addSpan("running", "queue", 100.0, 102.5, tid=4)
+
+        with TestAreaContext("run_trace_save"):
+            trace.save("trace.json")
+            with open("trace.json") as f:
+                data = json.load(f)
+
+        events = data["traceEvents"]
+        thread_names = {event["tid"]: event["args"]["name"] for event in events if event["ph"] == "M"}
+        self.assertEqual({0: "Run model", 4: "Realization 3"}, thread_names)
+
+        span = [event for event in events if event["ph"] == "X"][0]
+        self.assertEqual(100000000, span["ts"])
+        self.assertEqual(2500000, span["dur"])
@@ -0,0 +1,39 @@
+import datetime
+from collections import namedtuple
+
+from tests import ErtTest
+from ert_gui.simulation.models.slow_realization_detector import SlowRealizationDetector, realizationRuntime
+
+Job = namedtuple("Job", ["name", "status", "start_time", "end_time"])
+
+
+def finished(start, runtime):
+    return [Job("job", "Success", start, start + runtime)], None
+
+
+def running(start):
+    return [Job("job", "Running", start, None)], None
+
+
+class SlowRealizationDetectorTest(ErtTest):
+
+    def test_realization_runtime(self):
+        start = datetime.datetime(2019, 1, 1, 12, 0, 0)
+        jobs = [Job("a", "Success", start, start + datetime.timedelta(seconds=10)),
+                Job("b", "Success", start + datetime.timedelta(seconds=10), start + datetime.timedelta(seconds=25))]
+        self.assertEqual(25, realizationRuntime(jobs))
+
+        jobs[1] = Job("b", "Running", start + datetime.timedelta(seconds=10), None)
+        self.assertIsNone(realizationRuntime(jobs))
+
+    def test_detect_slow_realizations(self):
+        previous = {0: finished(0, 100), 1: finished(0, 10), 2: finished(0, 20)}
+        detector = SlowRealizationDetector(factor=2.0)
+        detector.recordIteration(previous)
+
+        self.assertEqual(100, detector.expectedRuntime(0))
+        self.assertEqual(20, detector.expectedRuntime(3))
+
+        current = {0: running(1000), 1: running(1000), 2: finished(1000, 15), 3: running(1000)}
+        self.assertEqual([1, 3], detector.detect(current, now=1050))
+        self.assertEqual([0, 1, 3], detector.detect(current, now=1201))
@@ -0,0 +1,23 @@
+from tests import ErtTest
+from ert_gui.simulation.models import StragglerPolicy
+
+
+class StragglerPolicyTest(ErtTest):
+
+    def test_no_policy(self):
+        self.assertIsNone(StragglerPolicy.fromArguments({}))
+        self.assertIsNone(StragglerPolicy.fromArguments({"straggler_threshold": None}))
+
+    def test_default_grace_time(self):
+        policy = StragglerPolicy.fromArguments({"straggler_threshold": "10"})
+        self.assertEqual(StragglerPolicy.DEFAULT_GRACE_TIME, policy.grace_time)
+
+        policy = StragglerPolicy.fromArguments({"straggler_threshold": "10", "straggler_grace_time": "120"})
+        self.assertEqual(120, policy.grace_time)
+
+    def test_success_threshold(self):
+        self.assertEqual(45, StragglerPolicy("45").successThreshold(100))
+        self.assertEqual(20, StragglerPolicy("45").successThreshold(20))
+        self.assertEqual(90, StragglerPolicy("90%").successThreshold(100))
+        self.assertEqual(10, StragglerPolicy("95%").successThreshold(10))
+        self.assertEqual(9, StragglerPolicy("81%").successThreshold(10))
@@ -0,0 +1,39 @@
+import sys
+
+from tests import ErtTest
+from ert_gui.ertwidgets.backgroundtask import BackgroundTask
+
+if sys.version_info >= (3, 3):
+    from unittest.mock import Mock, patch
+else:
+    from mock import Mock, patch
+
+
+class BackgroundTaskTest(ErtTest):
+
+    def runTask(self, function):
+        on_done = Mock()
+        on_update = Mock()
+        with patch("ert_gui.ertwidgets.backgroundtask.QTimer"):
+            task = BackgroundTask("ert_gui_test_thread", function, on_done, on_update)
+            task.start()
+            task._thread.join()
+            task._poll()
+
+        self.assertEqual(task._thread.name, "ert_gui_test_thread")
+        self.assertTrue(task._thread.daemon)
+        self.assertFalse(task.isRunning())
+        task._timer.stop.assert_called_once_with()
+        on_update.assert_called_once_with()
+        return on_done
+
+    def test_value_is_reported(self):
+        on_done = self.runTask(lambda: 42)
+        on_done.assert_called_once_with(42, None)
+
+    def test_error_is_reported(self):
+        def fail():
+            raise IOError("Disk full")
+
+        on_done = self.runTask(fail)
+        on_done.assert_called_once_with(None, "Disk full")
@@ -0,0 +1,54 @@
+import os
+
+from ecl.util.test import TestAreaContext
+
+from tests import ErtTest
+from ert_gui.simulation.file_tail import FileTail
+
+
+class FileTailTest(ErtTest):
+
+    def test_missing_file(self):
+        with TestAreaContext("file_tail_missing"):
+            tail = FileTail("missing.stdout")
+            self.assertEqual("", tail.read())
+            self.assertEqual(0, tail.offset())
+
+    def test_reads_appended_text(self):
+        with TestAreaContext("file_tail_append"):
+            with open("job.stdout", "w") as f:
+                f.write("line 1\n")
+
+            tail = FileTail("job.stdout")
+            self.assertEqual("line 1\n", tail.read())
+            self.assertEqual("", tail.read())
+
+            with open("job.stdout", "a") as f:
+                f.write("line 2\nline")
+            self.assertEqual("line 2\nline", tail.read())
+            self.assertEqual(os.path.getsize("job.stdout"), tail.offset())
+
+            with open("job.stdout", "w") as f:
+                f.write("new\n")
+            self.assertEqual("new\n", tail.read())
+            self.assertTrue(tail.truncated)
+
+    def test_large_file_is_tailed(self):
+        with TestAreaContext("file_tail_large"):
+            with open("job.stdout", "w") as f:
+                for index in range(100):
+                    f.write("line %d\n" % index)
+
+            original_threshold = FileTail.MMAP_THRESHOLD
+            FileTail.MMAP_THRESHOLD = 10
+            try:
+                tail = FileTail("job.stdout", max_lines=3)
+                self.assertEqual("line 97\nline 98\nline 99\n", tail.read())
+                self.assertEqual(os.path.getsize("job.stdout") - len("line 97\nline 98\nline 99\n"), tail.skipped_bytes)
+
+                with open("job.stdout", "a") as f:
+                    f.write("line 100\n")
+                self.assertEqual("line 100\n", tail.read())
+                self.assertEqual(0, tail.skipped_bytes)
+            finally:
+                FileTail.MMAP_THRESHOLD = original_threshold
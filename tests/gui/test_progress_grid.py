@@ -0,0 +1,67 @@
+from res.job_queue import JobStatusType
+
+from tests import ErtTest
+from ert_gui.simulation.progress_grid import ProgressGrid
+
+
+class _Job(object):
+
+    def __init__(self, status):
+        self.status = status
+
+
+def _jobs(*statuses):
+    return [_Job(status) for status in statuses]
+
+
+class ProgressGridTest(ErtTest):
+
+    def test_update_reports_changed_realizations(self):
+        grid = ProgressGrid()
+        self.assertEqual([], grid.update({}))
+
+        progress = {0: (_jobs("Success", "Running"), JobStatusType.JOB_QUEUE_RUNNING),
+                    2: (_jobs("Waiting"), JobStatusType.JOB_QUEUE_PENDING)}
+        self.assertEqual([0, 2], grid.update(progress))
+        self.assertEqual(3, grid.realizationCount())
+        self.assertEqual(2, grid.jobCount())
+        self.assertEqual(ProgressGrid.REALIZATION_RUNNING, grid.realizationState(0))
+        self.assertEqual(ProgressGrid.REALIZATION_MISSING, grid.realizationState(1))
+        self.assertEqual(ProgressGrid.REALIZATION_IDLE, grid.realizationState(2))
+
+        version = grid.version()
+        self.assertEqual([], grid.update(progress))
+        self.assertEqual(version, grid.version())
+
+        progress[2] = (_jobs("Failure"), JobStatusType.JOB_QUEUE_FAILED)
+        self.assertEqual([2], grid.update(progress))
+        self.assertEqual(ProgressGrid.REALIZATION_FAILED, grid.realizationState(2))
+        self.assertEqual(ProgressGrid.stateCode("Failure"), grid.jobStates()[2, 0])
+        self.assertEqual(ProgressGrid.NO_JOB, grid.jobStates()[2, 1])
+
+    def test_state_codes(self):
+        self.assertEqual(1, ProgressGrid.stateCode("Waiting"))
+        self.assertEqual(ProgressGrid.stateCode("Unknown"), ProgressGrid.stateCode("Something else"))
+
+        colors = {"Waiting": (1, 1, 1), "Pending": (2, 2, 2), "Running": (3, 3, 3), "Success": (4, 4, 4),
+                  "Failure": (5, 5, 5), "Unknown": (6, 6, 6, 100)}
+        table = ProgressGrid.colorTable(colors)
+        self.assertEqual(len(ProgressGrid.JOB_STATES) + 1, len(table))
+        self.assertEqual((0, 0, 0, 0), table[ProgressGrid.NO_JOB])
+        self.assertEqual((3, 3, 3, 255), table[ProgressGrid.stateCode("Running")])
+        self.assertEqual((6, 6, 6, 100), table[ProgressGrid.stateCode("Unknown")])
+
+    def test_pixels(self):
+        grid = ProgressGrid()
+        grid.update({0: (_jobs("Waiting", "Pending", "Running"), None),
+                     3: (_jobs("Success"), None)})
+
+        grid_width, grid_height, sub_grid_size = grid.layout(2.0)
+        self.assertEqual((4, 2, 2), (grid_width, grid_height, sub_grid_size))
+
+        pixels = grid.pixels(grid_width, grid_height, sub_grid_size)
+        self.assertEqual((4, 8), pixels.shape)
+        self.assertEqual([1, 2], list(pixels[0, 0:2]))
+        self.assertEqual([3, 0], list(pixels[1, 0:2]))
+        self.assertEqual([4, 0], list(pixels[0, 6:8]))
+        self.assertEqual(0, pixels[2:].sum())